@@ -20,6 +20,10 @@ DEFAULT_NEWS_RETENTION_DAYS = 3  # Days to keep news in cache
 # Repository Management
 README_OLD_NEWS_CUTOFF_DAYS = 30  # Days before news sections are archived
 
+# News YAML Files
+NEWS_YAML_STREAM_THRESHOLD_BYTES = 128 * 1024  # Above this size, news YAML is streamed
+NEWS_YAML_BYTES_PER_NEWS = 2 * 1024  # Approximate YAML size of one news entry
+
 # Git Operations
 GIT_OPERATION_TIMEOUT_SECONDS = 30  # Timeout for git commands
 
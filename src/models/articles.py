@@ -1,6 +1,7 @@
 """Article data models for the pipeline."""
 
 from datetime import datetime
+from functools import cached_property
 
 from pydantic import BaseModel, Field, HttpUrl
 
@@ -30,6 +31,16 @@ class ProcessedArticle(BaseModel):
     slug: str = Field(description="URL slug for the article")
     content_hash: str = Field(description="Hash for deduplication")
 
+    @cached_property
+    def url_str(self) -> str:
+        """Article URL as a plain string (computed once)."""
+        return str(self.url)
+
+    @cached_property
+    def published_iso(self) -> str:
+        """Publication date in ISO format, or 'unknown' (computed once)."""
+        return self.published_date.isoformat() if self.published_date else "unknown"
+
 
 class ClusteredArticle(BaseModel):
     """Article assigned to a cluster (Step 3)."""
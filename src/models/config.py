@@ -106,6 +106,18 @@ class Step4Config(StepConfig):
     fallback_to_no_merge: bool = Field(
         default=True, description="If API fails, don't merge (keep all news)"
     )
+    batch_size: int = Field(
+        default=20, ge=1, description="Today's news per Gemini deduplication call"
+    )
+    max_concurrent_calls: int = Field(
+        default=2, ge=1, description="Maximum deduplication calls in flight at once"
+    )
+    prefilter_threshold: float = Field(
+        ge=0.0,
+        le=1.0,
+        default=0.2,
+        description="Minimum lexical similarity for a cached news to be sent to Gemini",
+    )
 
 
 class Step5Config(StepConfig):
@@ -121,6 +133,27 @@ class Step5Config(StepConfig):
             "engagement_potential": 0.2,
         }
     )
+    timeout_seconds: int = Field(
+        default=30, ge=1, description="Deadline for one Gemini categorization call"
+    )
+    max_concurrent_calls: int = Field(
+        default=4, ge=1, description="Maximum categorization calls in flight per process"
+    )
+    max_llm_candidates: int = Field(
+        default=100,
+        ge=1,
+        description="Most promising clusters sent to Gemini; the rest are auto-categorized",
+    )
+    llm_bypass_threshold: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Local keyword confidence above which Gemini is skipped (None = always ask)",
+    )
+    circuit_state_file: str | None = Field(
+        default=None,
+        description="File keeping the Gemini circuit breaker state across runs (None = in memory)",
+    )
 
 
 class Step6Config(StepConfig):
@@ -132,6 +165,29 @@ class Step6Config(StepConfig):
     retry_attempts: int = Field(default=3)
     temperature: float = Field(ge=0.0, le=2.0, default=0.5)
     max_summary_length: int = Field(default=300)
+    max_concurrent_calls: int = Field(
+        default=5, ge=1, description="Maximum news enhanced (Gemini calls) at once"
+    )
+    use_batch_mode: bool = Field(
+        default=False,
+        description="Enhance all news in one discounted Gemini Batch Mode job (slower)",
+    )
+    structured_output: bool = Field(
+        default=False,
+        description=(
+            "Request schema-constrained JSON instead of the delimited text template "
+            "(the model must support structured output together with Google Search)"
+        ),
+    )
+    batch_timeout_seconds: int = Field(
+        default=6 * 3600, ge=60, description="Give up on a batch job (and call per news) after this"
+    )
+    response_cache_dir: str | None = Field(
+        default=None, description="Directory for cached Gemini responses (None disables caching)"
+    )
+    response_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 3600, ge=0, description="Maximum age of a reused cached response"
+    )
 
 
 class Step7Config(StepConfig):
@@ -17,7 +17,7 @@ from src.models.config import Step3Config
 from src.models.news import NewsCluster, Step3Result
 
 # AI-related keywords for filtering (200+ keywords)
-AI_KEYWORDS = {
+AI_KEYWORDS = frozenset({
     # Core AI terms
     "ai", "artificial intelligence", "machine learning", "deep learning",
     "neural network", "neural net", "llm", "large language model",
@@ -133,7 +133,7 @@ AI_KEYWORDS = {
     "world model", "reasoning model", "o1", "chain-of-thought reasoning",
     "test-time compute", "scaling laws", "emergent abilities",
     "learning to learn", "meta-learning",
-}
+})
 
 
 class GeminiClusteringResponse(BaseModel):
@@ -199,12 +199,10 @@ def _prepare_articles_for_prompt(articles: list[ProcessedArticle]) -> list[dict]
             {
                 "slug": article.slug,
                 "title": article.title,
-                "url": str(article.url),
+                "url": article.url_str,
                 "content_preview": content_preview,
                 "feed": article.feed_name,
-                "published": article.published_date.isoformat()
-                if article.published_date
-                else "unknown",
+                "published": article.published_iso,
             }
         )
 
@@ -280,10 +278,18 @@ Your task is to group similar AI news articles into coherent news topics.
         },
     )
 
-    logger.debug("Gemini API response received", response_text=response.text[:200])  # type: ignore
+    # The SDK already decodes structured output into the schema; reuse it
+    # instead of parsing the JSON a second time
+    parsed = getattr(response, "parsed", None)
+    if isinstance(parsed, GeminiClusteringResponse):
+        logger.debug("Gemini API response received (pre-parsed by SDK)")
+        return parsed
+
+    response_text = response.text  # property re-joins parts on every access
+    logger.debug("Gemini API response received", response_text=response_text[:200])  # type: ignore
 
     # Parse and validate with Pydantic
-    clustering_response = GeminiClusteringResponse.model_validate_json(response.text)  # type: ignore
+    clustering_response = GeminiClusteringResponse.model_validate_json(response_text)  # type: ignore
 
     return clustering_response
 
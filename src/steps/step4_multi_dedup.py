@@ -4,33 +4,85 @@ Uses Gemini API to identify and merge semantically duplicate news clusters
 across the last 3 days to avoid presenting the same news multiple times.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import gzip
+import io
+import math
+import os
+import re
+import zlib
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
 
 from loguru import logger
-from pydantic import BaseModel, Field
-from tenacity import retry, stop_after_attempt, wait_exponential
+from pydantic import BaseModel, Field, ValidationError
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 from src.models.config import Step4Config
 from src.models.news import NewsCluster, NewsDeduplicationPair, Step4Result
 from src.utils.cache import CacheManager
+from src.utils.gemini_client import get_gemini_client, is_transient_gemini_error
+from src.utils.prompt_loader import get_prompt_loader
+
+# Fast gzip level for daily news cache files (most of the size win, little CPU)
+_GZIP_LEVEL = 3
+
+# Word tokens used by the lexical prefilter
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
+# Common words that carry no signal for news similarity
+_STOPWORDS = frozenset(
+    {
+        "about", "after", "and", "are", "but", "for", "from", "has", "have", "its",
+        "into", "new", "not", "now", "over", "that", "the", "their", "this", "was",
+        "were", "what", "which", "will", "with",
+    }
+)  # fmt: skip
+
+
+def _utc_now() -> datetime:
+    """Current time in UTC; daily cache files are named by UTC date."""
+    return datetime.now(UTC)
 
 
 def _save_news_to_cache(cache_manager: CacheManager, news: list[NewsCluster]) -> None:
     """Save news clusters to cache with today's date.
 
+    The day file is gzip-compressed JSON (news_YYYY-MM-DD.json.gz); cluster
+    text is highly repetitive, so this roughly halves size and read I/O.
+
     Args:
         cache_manager: Cache manager instance
         news: List of news clusters to save
     """
-    from pathlib import Path
-
     # Ensure news cache directory exists
     news_cache_dir = Path(cache_manager.cache_dir) / "news"
     news_cache_dir.mkdir(parents=True, exist_ok=True)
 
-    # Save with today's date
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    cache_manager.save(f"news/news_{today_str}", news)
+    # Save with today's (UTC) date
+    today_str = _utc_now().strftime("%Y-%m-%d")
+    news_file = news_cache_dir / f"news_{today_str}.json.gz"
+    payload = CachedNewsDay(data=news, cached_at=_utc_now()).model_dump_json()
+
+    # Write to a temp file and rename over the target, so a crash mid-write
+    # can never leave a truncated day file behind
+    tmp_file = news_file.with_name(f"{news_file.name}.tmp")
+    tmp_file.write_bytes(gzip.compress(payload.encode("utf-8"), compresslevel=_GZIP_LEVEL))
+    os.replace(tmp_file, news_file)
+
+    # Drop a plain JSON file from an earlier run so it can't shadow the new one
+    news_file.with_suffix("").unlink(missing_ok=True)
+    logger.info("News cache saved", path=str(news_file), count=len(news))
+
+
+class CachedNewsDay(BaseModel):
+    """Daily news cache file (same layout as CacheManager.save output)."""
+
+    data: list[NewsCluster] = Field(description="News clusters cached for the day")
+    cached_at: datetime | None = Field(default=None, description="When the file was written")
 
 
 class GeminiDeduplicationResponse(BaseModel):
@@ -104,7 +156,7 @@ async def run_step4(
 
         # Load cached news from last N days
         logger.info(f"Loading cached news from last {config.lookback_days} days")
-        cached_news = _load_cached_news(cache_manager, config.lookback_days)
+        cached_news = await _load_cached_news(cache_manager, config.lookback_days)
         logger.info(
             f"Loaded {len(cached_news)} news from cache",
             lookback_days=config.lookback_days,
@@ -126,6 +178,26 @@ async def run_step4(
                 api_failures=0,
             )
 
+        # Lookup maps shared by the short-circuit check and the merge
+        today_by_id = {news.news_id: news for news in today_news}
+        cached_by_id = {news.news_id: news for news in cached_news}
+
+        # Re-run of an already deduplicated day: every news is cached already
+        if today_by_id.keys() <= cached_by_id.keys():
+            logger.info("All today's news already in cache, skipping deduplication")
+            # Same shape as the merge path: cached news (today's included) in cache order
+            unique_news = list(cached_by_id.values())
+            return Step4Result(
+                success=True,
+                unique_news=unique_news,
+                news_before_dedup=len(today_news),
+                news_after_dedup=len(unique_news),
+                duplicates_found=0,
+                news_merged=0,
+                api_calls=0,
+                api_failures=0,
+            )
+
         # Check for API key
         if not api_key:
             logger.warning("No API key provided")
@@ -160,14 +232,27 @@ async def run_step4(
                 )
 
         try:
+            # Exact title/topic matches need no semantic comparison
+            exact_pairs = _find_exact_duplicates(today_news, cached_news)
+            exact_today_ids = {pair.news_today_id for pair in exact_pairs}
+            exact_cached_ids = {pair.news_cached_id for pair in exact_pairs}
+            remaining_news = [news for news in today_news if news.news_id not in exact_today_ids]
+            remaining_cached = [
+                news for news in cached_news if news.news_id not in exact_cached_ids
+            ]
+            if exact_pairs:
+                logger.info(f"Found {len(exact_pairs)} exact duplicates without Gemini")
+
             # Call Gemini API for semantic deduplication
             logger.info("Calling Gemini API for semantic deduplication")
-            dedup_response = await _call_gemini_deduplication(
-                today_news, cached_news, config, api_key
+            llm_pairs, batch_calls = await _deduplicate_in_batches(
+                remaining_news, remaining_cached, config, api_key
             )
-            api_calls += 1
+            api_calls += batch_calls
+
+            # Batches are independent, so two of them may claim the same cached news
+            duplicate_pairs = _unique_pairs(exact_pairs + llm_pairs)
 
-            duplicate_pairs = dedup_response.duplicate_pairs
             duplicates_found = len(duplicate_pairs)
 
             logger.info(
@@ -177,7 +262,13 @@ async def run_step4(
             )
 
             # Merge duplicate news
-            unique_news = _merge_duplicate_news(today_news, cached_news, duplicate_pairs)
+            unique_news = _merge_duplicate_news(
+                today_news,
+                cached_news,
+                duplicate_pairs,
+                today_by_id=today_by_id,
+                cached_by_id=cached_by_id,
+            )
             news_merged = duplicates_found  # Each pair results in one merge
 
             logger.info(
@@ -189,7 +280,7 @@ async def run_step4(
 
         except Exception as e:
             error_msg = f"Gemini API call failed: {e}"
-            logger.error(error_msg, exc_info=True)
+            logger.opt(exception=True).error(error_msg)
             errors.append(error_msg)
             api_failures += 1
 
@@ -235,7 +326,7 @@ async def run_step4(
 
     except Exception as e:
         error_msg = f"Step 4 failed critically: {e}"
-        logger.error(error_msg, exc_info=True)
+        logger.opt(exception=True).error(error_msg)
         return Step4Result(
             success=False,
             unique_news=[],
@@ -249,54 +340,318 @@ async def run_step4(
         )
 
 
-def _load_cached_news(cache_manager: CacheManager, lookback_days: int) -> list[NewsCluster]:
+async def _load_cached_news(cache_manager: CacheManager, lookback_days: int) -> list[NewsCluster]:
     """Load news clusters from cache for the last N days.
 
+    Only the files named after days inside the window are considered, so the
+    cost does not grow with the age of the cache. They are read concurrently
+    in worker threads so the event loop is not blocked on I/O.
+
     Args:
         cache_manager: Cache manager instance
         lookback_days: Number of days to look back
 
     Returns:
-        List of NewsCluster from cache (last N days)
+        Unique NewsCluster from cache (last N days), oldest day first
     """
-    from pathlib import Path
-
-    all_cached_news: list[NewsCluster] = []
-    cutoff_date = datetime.now() - timedelta(days=lookback_days)
-
-    # Scan cache directory for news files
     cache_dir = Path(cache_manager.cache_dir) / "news"
     if not cache_dir.exists():
         logger.debug("News cache directory does not exist")
         return []
 
-    # Load news from each daily cache file
-    for news_file in sorted(cache_dir.glob("*.json")):
-        try:
-            # Extract date from filename (e.g., news_2024-12-24.json)
-            date_str = news_file.stem.split("_")[-1]
-            file_date = datetime.strptime(date_str, "%Y-%m-%d")
-
-            # Skip files older than lookback window
-            if file_date < cutoff_date:
-                logger.debug(f"Skipping old cache file: {news_file.name}")
-                continue
-
-            # Load news from file
-            news_list = cache_manager.load(f"news/{news_file.stem}", NewsCluster)
-            if news_list:
-                all_cached_news.extend(news_list)
-                logger.debug(f"Loaded {len(news_list)} news from {news_file.name}")
-
-        except (ValueError, IndexError) as e:
-            logger.warning(f"Could not parse date from {news_file.name}: {e}")
-            continue
+    # Expected daily cache files inside the lookback window (e.g. news_2024-12-24.json.gz)
+    now = _utc_now()
+    news_files: list[Path] = [
+        cache_dir / f"news_{(now - timedelta(days=days_ago)).strftime('%Y-%m-%d')}.json.gz"
+        for days_ago in range(lookback_days - 1, -1, -1)
+    ]
+
+    # Load news from each file concurrently (decoded once per file version)
+    news_per_day = await asyncio.gather(
+        *(asyncio.to_thread(_load_news_day, news_file) for news_file in news_files)
+    )
+
+    # A news saved on several days appears once, with its latest version
+    # (days are ordered oldest first, later assignments win)
+    cached_by_id: dict[str, NewsCluster] = {}
+    for news_file, news_list in zip(news_files, news_per_day, strict=True):
+        if news_list:
+            for news in news_list:
+                cached_by_id[news.news_id] = news
+            logger.debug(f"Loaded {len(news_list)} news from {news_file.name}")
 
+    all_cached_news = list(cached_by_id.values())
     logger.info(f"Loaded {len(all_cached_news)} total news from cache")
     return all_cached_news
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=10))
+def _load_news_day(news_file: Path) -> list[NewsCluster]:
+    """Load one daily news cache file, reusing the decoded result if unchanged.
+
+    Past days are never rewritten, so keying the decode cache on the file's
+    mtime gives near-100% hits across runs in the same process while still
+    picking up a rewritten file (e.g. today's cache after a re-run).
+
+    Args:
+        news_file: Path to a compressed daily news cache file; a plain .json
+            file written before compression was introduced is used as fallback
+
+    Returns:
+        News clusters from the file, or an empty list if it is unreadable
+    """
+    for candidate in (news_file, news_file.with_suffix("")):
+        try:
+            mtime_ns = candidate.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning(f"Failed to stat cached news file {candidate.name}: {e}")
+            return []
+        return list(_decode_news_day(str(candidate), mtime_ns))
+
+    # No pipeline run that day
+    return []
+
+
+@lru_cache(maxsize=32)
+def _decode_news_day(path_str: str, mtime_ns: int) -> tuple[NewsCluster, ...]:
+    """Decode a daily news file; mtime_ns only serves as part of the cache key."""
+    return tuple(_read_news_day(Path(path_str)))
+
+
+def _read_news_day(news_file: Path) -> list[NewsCluster]:
+    """Read and validate one daily news cache file.
+
+    The raw bytes are decoded and validated by pydantic-core in a single pass,
+    without building intermediate Python dicts for every cluster.
+
+    Args:
+        news_file: Path to a daily news cache file (news_YYYY-MM-DD.json[.gz])
+
+    Returns:
+        News clusters from the file, or an empty list if it is unreadable
+    """
+    try:
+        raw = news_file.read_bytes()
+    except OSError as e:
+        logger.warning(f"Failed to load cached news from {news_file.name}: {e}")
+        return []
+
+    try:
+        if news_file.suffix == ".gz":
+            raw = gzip.decompress(raw)
+        return CachedNewsDay.model_validate_json(raw).data
+    except (OSError, EOFError, zlib.error) as e:
+        _quarantine_corrupt_file(news_file, e)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            _quarantine_corrupt_file(news_file, e)
+        else:
+            # Well-formed but different schema: keep the file, just skip it
+            logger.warning(f"Failed to load cached news from {news_file.name}: {e}")
+    return []
+
+
+def _quarantine_corrupt_file(news_file: Path, error: Exception) -> None:
+    """Move a corrupt day file aside so later runs don't decode it again.
+
+    The file is renamed to ``<name>.corrupt`` rather than deleted, keeping it
+    around for inspection.
+    """
+    logger.warning(f"Corrupt cached news file {news_file.name}, moving it aside: {error}")
+    try:
+        os.replace(news_file, news_file.with_name(f"{news_file.name}.corrupt"))
+    except OSError as e:
+        logger.warning(f"Failed to move corrupt cache file {news_file.name}: {e}")
+
+
+def _find_exact_duplicates(
+    today_news: list[NewsCluster], cached_news: list[NewsCluster]
+) -> list[NewsDeduplicationPair]:
+    """Pair today's news with cached news sharing the same title and topic.
+
+    Each cached news is paired at most once so merges never overwrite each other.
+
+    Args:
+        today_news: News clusters from today
+        cached_news: News clusters from cache
+
+    Returns:
+        Duplicate pairs found by exact (case-insensitive) title and topic match
+    """
+    cached_by_key: dict[tuple[str, str], NewsCluster] = {}
+    for news in cached_news:
+        cached_by_key.setdefault(_exact_match_key(news), news)
+
+    pairs: list[NewsDeduplicationPair] = []
+    for news in today_news:
+        cached = cached_by_key.pop(_exact_match_key(news), None)
+        if cached is not None:
+            pairs.append(
+                NewsDeduplicationPair(
+                    news_today_id=news.news_id,
+                    news_cached_id=cached.news_id,
+                    merge_reason="Identical title and topic",
+                )
+            )
+    return pairs
+
+
+def _exact_match_key(news: NewsCluster) -> tuple[str, str]:
+    """Normalized (title, topic) key for exact duplicate detection."""
+    return news.title.strip().casefold(), news.main_topic.strip().casefold()
+
+
+async def _deduplicate_in_batches(
+    today_news: list[NewsCluster],
+    cached_news: list[NewsCluster],
+    config: Step4Config,
+    api_key: str,
+) -> tuple[list[NewsDeduplicationPair], int]:
+    """Compare today's news against the cache in concurrent batches.
+
+    Today's news is split into chunks of ``config.batch_size``; each chunk is
+    sent to Gemini together with the cached news that pass a cheap lexical
+    prefilter, with at most ``config.max_concurrent_calls`` requests in flight.
+    Batches without any candidate are not sent at all.
+
+    Args:
+        today_news: News clusters from today
+        cached_news: News clusters from cache (last N days)
+        config: Step 4 configuration
+        api_key: Gemini API key
+
+    Returns:
+        Tuple of (duplicate pairs from all batches, number of API calls)
+
+    Raises:
+        Exception: If any batch fails after retries
+    """
+    batches = [
+        today_news[i : i + config.batch_size] for i in range(0, len(today_news), config.batch_size)
+    ]
+
+    # Keep only cached news lexically close to something in each batch
+    cached_vectors = [_term_vector(news) for news in cached_news]
+    candidates_per_batch = [
+        _select_candidates(batch, cached_news, cached_vectors, config.prefilter_threshold)
+        for batch in batches
+    ]
+    work = [
+        (batch, candidates)
+        for batch, candidates in zip(batches, candidates_per_batch, strict=True)
+        if candidates
+    ]
+
+    logger.debug(
+        f"Prefilter kept {sum(len(c) for _, c in work)} cached candidates "
+        f"across {len(work)}/{len(batches)} batches",
+        threshold=config.prefilter_threshold,
+    )
+
+    semaphore = asyncio.Semaphore(config.max_concurrent_calls)
+
+    async def dedup_with_semaphore(
+        batch: list[NewsCluster], candidates: list[NewsCluster]
+    ) -> GeminiDeduplicationResponse:
+        async with semaphore:
+            return await _call_gemini_deduplication(batch, candidates, config, api_key)
+
+    if len(batches) > 1:
+        logger.debug(
+            f"Split deduplication into {len(batches)} batches",
+            batch_size=config.batch_size,
+            max_concurrent_calls=config.max_concurrent_calls,
+        )
+
+    responses = await asyncio.gather(
+        *(dedup_with_semaphore(batch, candidates) for batch, candidates in work)
+    )
+
+    duplicate_pairs = [pair for response in responses for pair in response.duplicate_pairs]
+    return duplicate_pairs, len(work)
+
+
+def _unique_pairs(pairs: list[NewsDeduplicationPair]) -> list[NewsDeduplicationPair]:
+    """Keep the first pair for each today and cached news id.
+
+    Args:
+        pairs: Duplicate pairs, in priority order
+
+    Returns:
+        Pairs where every today and cached news id appears at most once
+    """
+    seen_today: set[str] = set()
+    seen_cached: set[str] = set()
+    unique: list[NewsDeduplicationPair] = []
+    for pair in pairs:
+        if pair.news_today_id in seen_today or pair.news_cached_id in seen_cached:
+            logger.debug(
+                f"Dropping overlapping merge pair: "
+                f"today={pair.news_today_id}, cached={pair.news_cached_id}"
+            )
+            continue
+        seen_today.add(pair.news_today_id)
+        seen_cached.add(pair.news_cached_id)
+        unique.append(pair)
+    return unique
+
+
+def _term_vector(news: NewsCluster) -> Counter[str]:
+    """Build a bag-of-words vector from a news title and summary opening."""
+    text = f"{news.title} {news.summary[:200]}".lower()
+    return Counter(
+        token
+        for token in _TOKEN_PATTERN.findall(text)
+        if len(token) > 2 and token not in _STOPWORDS
+    )
+
+
+def _cosine_similarity(a: Counter[str], b: Counter[str]) -> float:
+    """Cosine similarity between two term-frequency vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(count * b[token] for token, count in a.items() if token in b)
+    if not dot:
+        return 0.0
+    norm_a = math.sqrt(sum(count * count for count in a.values()))
+    norm_b = math.sqrt(sum(count * count for count in b.values()))
+    return dot / (norm_a * norm_b)
+
+
+def _select_candidates(
+    batch: list[NewsCluster],
+    cached_news: list[NewsCluster],
+    cached_vectors: list[Counter[str]],
+    threshold: float,
+) -> list[NewsCluster]:
+    """Select cached news similar enough to any news in the batch.
+
+    Args:
+        batch: Today's news in this batch
+        cached_news: News clusters from cache
+        cached_vectors: Term vectors of cached_news (same order)
+        threshold: Minimum cosine similarity (0 keeps every cached news)
+
+    Returns:
+        Cached news worth sending to Gemini, in cache order
+    """
+    if threshold <= 0:
+        return list(cached_news)
+
+    batch_vectors = [_term_vector(news) for news in batch]
+    return [
+        cached
+        for cached, cached_vector in zip(cached_news, cached_vectors, strict=True)
+        if any(_cosine_similarity(vector, cached_vector) >= threshold for vector in batch_vectors)
+    ]
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=2, max=10, jitter=2),
+    retry=retry_if_exception(is_transient_gemini_error),
+)
 async def _call_gemini_deduplication(
     today_news: list[NewsCluster],
     cached_news: list[NewsCluster],
@@ -315,14 +670,10 @@ async def _call_gemini_deduplication(
         GeminiDeduplicationResponse with duplicate pairs
 
     Raises:
-        Exception: On API failures after retries
+        Exception: On non-transient API failures, or transient ones after retries
     """
-    from google import genai
-
-    from src.utils.prompt_loader import get_prompt_loader
-
-    # Create client
-    client = genai.Client(api_key=api_key)
+    # Reuse the shared client (and its HTTP connection pool)
+    client = get_gemini_client(api_key)
 
     # Prepare news data for prompt
     today_data = _prepare_news_for_prompt(today_news)
@@ -341,21 +692,33 @@ async def _call_gemini_deduplication(
 
     logger.debug("Calling Gemini API for deduplication", model=config.llm_model)
 
-    # Make API call with structured output (using Pydantic class directly)
-    response = client.models.generate_content(
+    # Make API call with structured output (using Pydantic class directly).
+    # The SDK call is blocking, so run it in a worker thread to keep the event
+    # loop free for concurrent batches.
+    response = await asyncio.to_thread(
+        client.models.generate_content,
         model=config.llm_model,
         contents=prompt,
         config={
             "temperature": config.temperature,
             "response_mime_type": "application/json",
             "response_schema": GeminiDeduplicationResponse,
+            "http_options": {"timeout": config.timeout_seconds * 1000},  # milliseconds
         },
     )
 
-    logger.debug("Gemini API response received", response_text=response.text[:200])
+    # The SDK already decodes structured output into the schema; reuse it
+    # instead of parsing the JSON a second time
+    parsed = getattr(response, "parsed", None)
+    if isinstance(parsed, GeminiDeduplicationResponse):
+        logger.debug("Gemini API response received (pre-parsed by SDK)")
+        return parsed
+
+    response_text = response.text  # property re-joins parts on every access
+    logger.debug("Gemini API response received", response_text=response_text[:200])
 
     # Parse and validate with Pydantic
-    dedup_response = GeminiDeduplicationResponse.model_validate_json(response.text)
+    dedup_response = GeminiDeduplicationResponse.model_validate_json(response_text)
 
     return dedup_response
 
@@ -369,22 +732,54 @@ def _prepare_news_for_prompt(news_list: list[NewsCluster]) -> str:
     Returns:
         Formatted string for prompt
     """
-    lines = []
+    buffer = io.StringIO()
     for i, news in enumerate(news_list, 1):
-        lines.append(
-            f"{i}. [ID: {news.news_id}] {news.title}\n"
-            f"   Summary: {news.summary[:200]}...\n"
-            f"   Topic: {news.main_topic} | Articles: {news.article_count} | "
-            f"Created: {news.created_at.strftime('%Y-%m-%d %H:%M')}"
+        if i > 1:
+            buffer.write("\n\n")
+        buffer.write(f"{i}. ")
+        buffer.write(
+            _format_news_entry(
+                news.news_id,
+                news.title,
+                news.summary,
+                news.main_topic,
+                news.article_count,
+                news.created_at,
+            )
         )
 
-    return "\n\n".join(lines)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=1024)
+def _format_news_entry(
+    news_id: str,
+    title: str,
+    summary: str,
+    main_topic: str,
+    article_count: int,
+    created_at: datetime,
+) -> str:
+    """Format one news entry (without its list number) for the prompt.
+
+    Cached news is immutable once written and is re-sent on every batch and
+    every run within the lookback window, so its text is built once and keyed
+    on the fields it is derived from (a changed cluster gets a new entry).
+    """
+    return (
+        f"[ID: {news_id}] {title}\n"
+        f"   Summary: {summary[:200]}...\n"
+        f"   Topic: {main_topic} | Articles: {article_count} | "
+        f"Created: {created_at:%Y-%m-%d %H:%M}"
+    )
 
 
 def _merge_duplicate_news(
     today_news: list[NewsCluster],
     cached_news: list[NewsCluster],
     duplicate_pairs: list[NewsDeduplicationPair],
+    today_by_id: dict[str, NewsCluster] | None = None,
+    cached_by_id: dict[str, NewsCluster] | None = None,
 ) -> list[NewsCluster]:
     """Merge duplicate news by combining article slugs.
 
@@ -399,19 +794,21 @@ def _merge_duplicate_news(
         today_news: News clusters from today
         cached_news: News clusters from cache
         duplicate_pairs: Pairs identified as duplicates
+        today_by_id: Optional prebuilt news_id lookup for today_news
+        cached_by_id: Optional prebuilt news_id lookup for cached_news
 
     Returns:
         List of unique news (merged + non-duplicates)
     """
-    # Create lookup maps
-    today_map = {news.news_id: news for news in today_news}
-    cached_map = {news.news_id: news for news in cached_news}
+    # Create lookup maps (unless the caller already built them)
+    today_map = today_by_id if today_by_id is not None else {n.news_id: n for n in today_news}
+    cached_map = cached_by_id if cached_by_id is not None else {n.news_id: n for n in cached_news}
 
     # Track which today news have been merged
     merged_today_ids = set()
 
-    # Result list starting with all cached news
-    result_news: list[NewsCluster] = list(cached_news)
+    # Result keyed by news_id, starting with all cached news (insertion-ordered)
+    result_by_id: dict[str, NewsCluster] = dict(cached_map)
 
     # Process each duplicate pair (all pairs are meant to be merged)
     for pair in duplicate_pairs:
@@ -443,8 +840,8 @@ def _merge_duplicate_news(
                 merge_count=to_merge.article_count,
             )
 
-        # Merge article slugs (avoid duplicates)
-        merged_slugs = list(set(base.article_slugs + to_merge.article_slugs))
+        # Merge article slugs (avoid duplicates, keep order)
+        merged_slugs = list(dict.fromkeys(chain(base.article_slugs, to_merge.article_slugs)))
 
         # Create updated news cluster
         updated_news = NewsCluster(
@@ -454,24 +851,17 @@ def _merge_duplicate_news(
             article_slugs=merged_slugs,
             article_count=len(merged_slugs),
             main_topic=base.main_topic,
-            keywords=list(set(base.keywords + to_merge.keywords))[
-                :10
-            ],  # Merge keywords, limit to 10
+            # Merge keywords (order-preserving), limit to 10
+            keywords=list(dict.fromkeys(chain(base.keywords, to_merge.keywords)))[:10],
             created_at=base.created_at,
-            updated_at=datetime.utcnow(),  # Mark as updated
+            updated_at=_utc_now(),  # Mark as updated
         )
 
-        # Update in result list
-        if base == cached_item:
-            # Find and replace cached news in result
-            for i, news in enumerate(result_news):
-                if news.news_id == cached_item.news_id:
-                    result_news[i] = updated_news
-                    break
-        else:
-            # Base is today news, need to add to result and remove cached
-            result_news = [n for n in result_news if n.news_id != cached_item.news_id]
-            result_news.append(updated_news)
+        # Update in result
+        if base is today_item:
+            # Base is today news, need to remove cached and add to result
+            result_by_id.pop(cached_item.news_id, None)
+        result_by_id[base.news_id] = updated_news
 
         # Mark today news as merged
         merged_today_ids.add(pair.news_today_id)
@@ -484,6 +874,7 @@ def _merge_duplicate_news(
         )
 
     # Add non-merged today news to result
+    result_news = list(result_by_id.values())
     for news in today_news:
         if news.news_id not in merged_today_ids:
             result_news.append(news)
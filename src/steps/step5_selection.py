@@ -4,14 +4,21 @@ Selects the most interesting news items (max 10) and categorizes them using Gemi
 Only news with high importance scores are selected for the final output.
 """
 
-from collections import defaultdict
+import asyncio
+import heapq
+import re
+from collections import Counter
+from datetime import UTC, datetime
 
 from loguru import logger
 from pydantic import BaseModel, Field
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 from src.models.config import Step5Config
 from src.models.news import CategorizedNews, NewsCategory, NewsCluster, Step5Result
+from src.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.utils.gemini_client import get_gemini_client, is_transient_gemini_error
+from src.utils.prompt_loader import get_prompt_loader
 
 
 class CategorizedNewsItem(BaseModel):
@@ -32,6 +39,102 @@ class GeminiCategorizationResponse(BaseModel):
     rationale: str = Field(description="Overall categorization strategy explanation")
 
 
+# Human-readable category descriptions used in the categorization prompt
+_CATEGORY_DESCRIPTIONS: dict[NewsCategory, str] = {
+    NewsCategory.MODEL_RELEASE: "New AI model releases, major updates to existing models",
+    NewsCategory.RESEARCH: "Research papers, academic findings, scientific breakthroughs",
+    NewsCategory.POLICY_REGULATION: "AI policy, government regulations, legal frameworks",
+    NewsCategory.FUNDING_ACQUISITION: "Funding rounds, investments, acquisitions",
+    NewsCategory.PRODUCT_LAUNCH: "New AI products, features, services",
+    NewsCategory.PARTNERSHIP: "Company partnerships, collaborations, joint ventures",
+    NewsCategory.ETHICS_SAFETY: "AI safety, ethics, responsible AI, alignment",
+    NewsCategory.INDUSTRY_NEWS: "Company announcements, industry trends, market news",
+    NewsCategory.OTHER: "Other AI-related news that doesn't fit above categories",
+}
+
+# Category lookup by value (avoids enum construction and ValueError per item)
+_CATEGORY_BY_VALUE: dict[str, NewsCategory] = {
+    category.value: category for category in NewsCategory
+}
+
+# Keywords that point to a category when categorizing without Gemini
+# (OTHER has none: it is never chosen locally)
+_CATEGORY_KEYWORDS: dict[NewsCategory, frozenset[str]] = {
+    NewsCategory.MODEL_RELEASE: frozenset(
+        {"model", "models", "llm", "llms", "gpt", "gemini", "claude", "llama", "mistral",
+         "weights", "checkpoint", "multimodal"}
+    ),
+    NewsCategory.RESEARCH: frozenset(
+        {"research", "researchers", "paper", "papers", "study", "arxiv", "benchmark",
+         "benchmarks", "dataset", "breakthrough"}
+    ),
+    NewsCategory.POLICY_REGULATION: frozenset(
+        {"policy", "regulation", "regulations", "regulators", "law", "legislation", "government",
+         "lawsuit", "court", "compliance", "ban"}
+    ),
+    NewsCategory.FUNDING_ACQUISITION: frozenset(
+        {"funding", "investment", "investors", "raises", "raised", "acquisition", "acquires",
+         "acquired", "valuation", "ipo"}
+    ),
+    NewsCategory.PRODUCT_LAUNCH: frozenset(
+        {"product", "feature", "features", "app", "launch", "launches", "launched", "rollout",
+         "available", "tool"}
+    ),
+    NewsCategory.PARTNERSHIP: frozenset(
+        {"partnership", "partners", "partner", "collaboration", "alliance", "joint"}
+    ),
+    NewsCategory.ETHICS_SAFETY: frozenset(
+        {"safety", "ethics", "ethical", "alignment", "bias", "misuse", "responsible", "deepfake",
+         "deepfakes", "privacy"}
+    ),
+    NewsCategory.INDUSTRY_NEWS: frozenset(
+        {"industry", "market", "company", "companies", "layoffs", "hiring", "revenue",
+         "earnings", "ceo", "chips"}
+    ),
+}  # fmt: skip
+
+# Word pattern for matching news text against category keywords
+_KEYWORD_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Prompt section listing every category, built once at import
+_CATEGORIES_DESC_BLOCK = "\n".join(
+    f"- {category.value}: {_CATEGORY_DESCRIPTIONS.get(category, 'Other AI news')}"
+    for category in NewsCategory
+)
+
+# Attempts per categorization call (first try plus transient-error retries)
+_GEMINI_ATTEMPTS = 3
+
+# Stops calling Gemini during an outage. One run's exhausted retries open it, and
+# with config.circuit_state_file the state carries over to the next runs, which
+# then make a single probe call instead of a full retry storm. Only transient
+# errors count: a bad prompt or response says nothing about Gemini being down.
+_GEMINI_BREAKER = CircuitBreaker(
+    "gemini_categorization",
+    fail_max=_GEMINI_ATTEMPTS,
+    reset_timeout=6 * 3600,
+    is_failure=is_transient_gemini_error,
+)
+
+# Per-process cap on in-flight categorization calls, one gate per configured limit
+_GEMINI_SEMAPHORES: dict[int, asyncio.Semaphore] = {}
+
+
+def _get_gemini_semaphore(limit: int) -> asyncio.Semaphore:
+    """Get the shared semaphore bounding concurrent Gemini calls.
+
+    Args:
+        limit: Maximum categorization calls in flight at once
+
+    Returns:
+        Semaphore shared by every caller using the same limit
+    """
+    semaphore = _GEMINI_SEMAPHORES.get(limit)
+    if semaphore is None:
+        semaphore = _GEMINI_SEMAPHORES[limit] = asyncio.Semaphore(limit)
+    return semaphore
+
+
 async def run_step5(
     config: Step5Config,
     news_clusters: list[NewsCluster],
@@ -49,138 +152,194 @@ async def run_step5(
 
     Returns:
         Step5Result with selected top news (≤ target_count) and all categorized news
-
-    Raises:
-        ValueError: If config is invalid
     """
+    logger.info("Starting Step 5: Top news selection and categorization")
+
     try:
-        logger.info("Starting Step 5: Top news selection and categorization")
-
-        if not config.enabled:
-            logger.info("Step 5 disabled, returning empty result")
-            return Step5Result(
-                success=True,
-                top_news=[],
-                all_categorized_news=[],
-                categories_distribution={},
-                api_calls=0,
-                api_failures=0,
-            )
+        return await _run_step5_inner(config, news_clusters, api_key)
+    except Exception as e:
+        error_msg = f"Step 5 failed critically: {e}"
+        logger.opt(exception=True).error(error_msg)
+        return Step5Result(
+            success=False,
+            top_news=[],
+            all_categorized_news=[],
+            categories_distribution={},
+            api_calls=0,
+            api_failures=0,
+            errors=[error_msg],
+        )
 
-        # Handle empty input
-        if not news_clusters:
-            logger.info("No news clusters to categorize")
-            return Step5Result(
-                success=True,
-                top_news=[],
-                all_categorized_news=[],
-                categories_distribution={},
-                api_calls=0,
-                api_failures=0,
-            )
 
-        # Check for API key
-        if not api_key:
-            error_msg = "No API key provided for Step 5"
-            logger.error(error_msg)
-            return Step5Result(
-                success=False,
-                top_news=[],
-                all_categorized_news=[],
-                categories_distribution={},
-                api_calls=0,
-                api_failures=0,
-                errors=[error_msg],
-            )
+async def _run_step5_inner(
+    config: Step5Config,
+    news_clusters: list[NewsCluster],
+    api_key: str | None,
+) -> Step5Result:
+    """Categorize, score and select news; unexpected errors propagate.
 
-        api_calls = 0
-        api_failures = 0
-        errors: list[str] = []
+    Args:
+        config: Step 5 configuration
+        news_clusters: Deduplicated news clusters from Step 4
+        api_key: Gemini API key
 
-        try:
-            # Call Gemini API for categorization and scoring
-            logger.info(f"Categorizing and scoring {len(news_clusters)} news clusters")
-            categorization_response = await _call_gemini_categorization(
-                news_clusters, config, api_key
-            )
-            api_calls += 1
+    Returns:
+        Step5Result (a failed Gemini call gives success=False)
+    """
+    if not config.enabled:
+        logger.info("Step 5 disabled, returning empty result")
+        return Step5Result(
+            success=True,
+            top_news=[],
+            all_categorized_news=[],
+            categories_distribution={},
+            api_calls=0,
+            api_failures=0,
+        )
 
-            # Parse and validate categorized news
-            all_categorized_news = _parse_categorized_news(news_clusters, categorization_response)
+    # Handle empty input
+    if not news_clusters:
+        logger.info("No news clusters to categorize")
+        return Step5Result(
+            success=True,
+            top_news=[],
+            all_categorized_news=[],
+            categories_distribution={},
+            api_calls=0,
+            api_failures=0,
+        )
 
-            logger.info(
-                f"Categorized {len(all_categorized_news)} news clusters",
-                total=len(news_clusters),
-            )
+    # Check for API key
+    if not api_key:
+        error_msg = "No API key provided for Step 5"
+        logger.error(error_msg)
+        return Step5Result(
+            success=False,
+            top_news=[],
+            all_categorized_news=[],
+            categories_distribution={},
+            api_calls=0,
+            api_failures=0,
+            errors=[error_msg],
+        )
 
-            # Sort by importance score and select most interesting
-            sorted_news = sorted(
-                all_categorized_news, key=lambda x: x.importance_score, reverse=True
-            )
+    api_calls = 0
+    errors: list[str] = []
 
-            # Filter by quality threshold (only include truly interesting news)
-            quality_threshold = config.scoring_weights.get("quality_threshold", 6.0)
-            interesting_news = [
-                news for news in sorted_news if news.importance_score >= quality_threshold
-            ]
-
-            # Take top N, up to max target_count
-            top_news = interesting_news[: config.target_count]
-
-            logger.info(
-                f"Selected {len(top_news)} most interesting news",
-                total_candidates=len(all_categorized_news),
-                above_threshold=len(interesting_news),
-                quality_threshold=quality_threshold,
-                max_count=config.target_count,
-            )
+    # Clusters whose keywords clearly point to one category skip Gemini
+    remaining_clusters, locally_categorized = _split_locally_categorized(
+        news_clusters, config.llm_bypass_threshold
+    )
+    if locally_categorized:
+        logger.info(
+            "Categorized {count} news clusters locally",
+            count=len(locally_categorized),
+            llm_bypass_threshold=config.llm_bypass_threshold,
+        )
 
-            # Calculate category distribution
-            categories_distribution = _calculate_category_distribution(all_categorized_news)
+    # Only the most promising clusters go to Gemini; the rest get a low
+    # default score so one oversized prompt can't fail the whole step
+    llm_candidates, auto_categorized = _partition_llm_candidates(
+        remaining_clusters, config.max_llm_candidates
+    )
+    if auto_categorized:
+        logger.info(
+            "Auto-categorized {count} low-potential news clusters",
+            count=len(auto_categorized),
+            max_llm_candidates=config.max_llm_candidates,
+        )
 
-            logger.info("Step 5 completed successfully")
+    # Near-identical clusters are categorized once and share the result
+    representatives, duplicates_by_id = _group_equivalent_clusters(llm_candidates)
+    if duplicates_by_id:
+        logger.info(
+            "Collapsed {count} equivalent news clusters before categorization",
+            count=len(llm_candidates) - len(representatives),
+        )
 
-            return Step5Result(
-                success=True,
-                top_news=top_news,
-                all_categorized_news=all_categorized_news,
-                categories_distribution=categories_distribution,
-                api_calls=api_calls,
-                api_failures=api_failures,
-                errors=errors,
+    # Call Gemini API for categorization and scoring
+    _GEMINI_BREAKER.use_state_file(config.circuit_state_file)
+    try:
+        if representatives:
+            logger.info("Categorizing and scoring {} news clusters", len(representatives))
+            categorization_response = await _call_gemini_categorization(
+                representatives, config, api_key
             )
-
-        except Exception as e:
-            error_msg = f"Gemini API call failed: {e}"
-            logger.error(error_msg, exc_info=True)
-            errors.append(error_msg)
-            api_failures += 1
-
-            return Step5Result(
-                success=False,
-                top_news=[],
-                all_categorized_news=[],
-                categories_distribution={},
-                api_calls=api_calls,
-                api_failures=api_failures,
-                errors=errors,
+            api_calls += 1
+        else:
+            categorization_response = GeminiCategorizationResponse(
+                categorized_news=[], rationale=""
             )
-
+    except CircuitOpenError as e:
+        # Gemini is known to be down: skip the call and keep every news
+        # with local or default scoring instead of failing the pipeline
+        error_msg = f"Gemini categorization skipped: {e}"
+        logger.warning(error_msg)
+        errors.append(error_msg)
+        categorization_response = GeminiCategorizationResponse(categorized_news=[], rationale="")
     except Exception as e:
-        error_msg = f"Step 5 failed critically: {e}"
-        logger.error(error_msg, exc_info=True)
+        error_msg = f"Gemini API call failed: {e}"
+        logger.opt(exception=True).error(error_msg)
         return Step5Result(
             success=False,
             top_news=[],
             all_categorized_news=[],
             categories_distribution={},
-            api_calls=0,
-            api_failures=0,
-            errors=[error_msg],
+            api_calls=api_calls,
+            api_failures=1,
+            errors=[*errors, error_msg],
         )
 
+    # Parse and validate categorized news (uncategorized ones get defaults)
+    all_categorized_news = _parse_categorized_news(representatives, categorization_response)
+    if duplicates_by_id:
+        all_categorized_news = _expand_equivalent_clusters(all_categorized_news, duplicates_by_id)
+    all_categorized_news.extend(locally_categorized)
+    all_categorized_news.extend(auto_categorized)
+
+    logger.info(
+        "Categorized {count} news clusters",
+        count=len(all_categorized_news),
+        total=len(news_clusters),
+    )
+
+    # Keep the top N above the quality threshold (only truly interesting news)
+    quality_threshold = config.scoring_weights.get("quality_threshold", 6.0)
+    top_news, above_threshold = _select_top_news(
+        all_categorized_news, quality_threshold, config.target_count
+    )
+
+    logger.info(
+        "Selected {count} most interesting news",
+        count=len(top_news),
+        total_candidates=len(all_categorized_news),
+        above_threshold=above_threshold,
+        quality_threshold=quality_threshold,
+        max_count=config.target_count,
+    )
+
+    # Calculate category distribution
+    categories_distribution = _calculate_category_distribution(all_categorized_news)
+
+    logger.info("Step 5 completed successfully")
+
+    return Step5Result(
+        success=True,
+        top_news=top_news,
+        all_categorized_news=all_categorized_news,
+        categories_distribution=categories_distribution,
+        api_calls=api_calls,
+        api_failures=0,
+        errors=errors,
+    )
+
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=10))
+@retry(
+    stop=stop_after_attempt(_GEMINI_ATTEMPTS),
+    wait=wait_exponential_jitter(initial=2, max=10, jitter=2),
+    retry=retry_if_exception(is_transient_gemini_error),
+)
+@_GEMINI_BREAKER
 async def _call_gemini_categorization(
     news_clusters: list[NewsCluster],
     config: Step5Config,
@@ -197,30 +356,22 @@ async def _call_gemini_categorization(
         GeminiCategorizationResponse with categorized news
 
     Raises:
-        Exception: On API failures after retries
+        CircuitOpenError: If recent calls kept failing and the circuit is open
+        Exception: On API failures (only transient errors are retried)
     """
-    from google import genai
-
-    from src.utils.prompt_loader import get_prompt_loader
-
-    # Create client
-    client = genai.Client(api_key=api_key)
+    # Shared client: connection pool and auth setup are reused across calls
+    client = get_gemini_client(api_key)
 
     # Prepare news data for prompt
     news_data = _prepare_news_for_prompt(news_clusters)
 
-    # Build categories description
-    categories_desc = "\n".join(
-        [f"- {category.value}: {_get_category_description(category)}" for category in NewsCategory]
-    )
-
     # Load and format prompt from YAML
     prompt_loader = get_prompt_loader()
     prompt = prompt_loader.format_prompt(
         "step5_selection",
         num_news=len(news_clusters),
         news_formatted=news_data,
-        categories_description=categories_desc,
+        categories_description=_CATEGORIES_DESC_BLOCK,
         recency_weight=config.scoring_weights.get("recency", 0.3),
         source_priority_weight=config.scoring_weights.get("source_priority", 0.3),
         content_quality_weight=config.scoring_weights.get("content_quality", 0.2),
@@ -229,23 +380,38 @@ async def _call_gemini_categorization(
 
     logger.debug("Calling Gemini API for categorization")
 
-    # Make API call with structured output (using Pydantic class directly)
-    response = client.models.generate_content(
-        model="gemini-2.5-flash-lite",
-        contents=prompt,
-        config={
-            "temperature": 0.3,
-            "response_mime_type": "application/json",
-            "response_schema": GeminiCategorizationResponse,
-        },
-    )
+    # Make API call with structured output (using Pydantic class directly).
+    # The SDK call is blocking, so run it in a worker thread to keep the event
+    # loop free; the deadline makes a hung connection raise instead of waiting,
+    # and the semaphore keeps concurrent callers from flooding the quota.
+    async with _get_gemini_semaphore(config.max_concurrent_calls):
+        response = await asyncio.wait_for(
+            asyncio.to_thread(
+                client.models.generate_content,
+                model="gemini-2.5-flash-lite",
+                contents=prompt,
+                config={
+                    "temperature": 0.3,
+                    "response_mime_type": "application/json",
+                    "response_schema": GeminiCategorizationResponse,
+                    "http_options": {"timeout": config.timeout_seconds * 1000},  # milliseconds
+                },
+            ),
+            timeout=config.timeout_seconds,
+        )
 
-    logger.debug("Gemini API response received", response_text=response.text[:200])  # type: ignore
+    # The SDK already decodes structured output into the schema; reuse it
+    # instead of parsing the JSON a second time
+    parsed = getattr(response, "parsed", None)
+    if isinstance(parsed, GeminiCategorizationResponse):
+        logger.debug("Gemini API response received (pre-parsed by SDK)")
+        return parsed
 
-    # Parse and validate with Pydantic
-    categorization_response = GeminiCategorizationResponse.model_validate_json(response.text)  # type: ignore
+    response_text = response.text or ""  # property re-joins parts on every access
+    logger.debug("Gemini API response received", response_text=response_text[:200])
 
-    return categorization_response
+    # Parse and validate with Pydantic
+    return GeminiCategorizationResponse.model_validate_json(response_text)
 
 
 def _prepare_news_for_prompt(news_clusters: list[NewsCluster]) -> str:
@@ -257,17 +423,183 @@ def _prepare_news_for_prompt(news_clusters: list[NewsCluster]) -> str:
     Returns:
         Formatted string for prompt
     """
-    lines = []
-    for i, news in enumerate(news_clusters, 1):
-        lines.append(
-            f"{i}. [ID: {news.news_id}] {news.title}\n"
-            f"   Summary: {news.summary[:200]}...\n"
-            f"   Topic: {news.main_topic} | Articles: {news.article_count} | "
-            f"Keywords: {', '.join(news.keywords[:5])}\n"
-            f"   Created: {news.created_at.strftime('%Y-%m-%d %H:%M')}"
+    return "\n\n".join(
+        f"{i}. [ID: {news.news_id}] {news.title}\n"
+        f"   Summary: {news.summary[:200]}...\n"
+        f"   Topic: {news.main_topic} | Articles: {news.article_count} | "
+        f"Keywords: {', '.join(news.keywords[:5])}\n"
+        f"   Created: {news.created_at:%Y-%m-%d %H:%M}"
+        for i, news in enumerate(news_clusters, 1)
+    )
+
+
+def _categorize_locally(news: NewsCluster) -> tuple[NewsCategory, float]:
+    """Guess a cluster's category from its keywords, topic and title.
+
+    Confidence is the share of keyword hits that belong to the best category,
+    reduced when that category has fewer than two hits.
+
+    Args:
+        news: News cluster
+
+    Returns:
+        Tuple of (best category, confidence between 0 and 1)
+    """
+    text = " ".join((news.title, news.main_topic, *news.keywords)).lower()
+    tokens = set(_KEYWORD_TOKEN_PATTERN.findall(text))
+
+    hits = {category: len(tokens & keywords) for category, keywords in _CATEGORY_KEYWORDS.items()}
+    total_hits = sum(hits.values())
+    if not total_hits:
+        return NewsCategory.OTHER, 0.0
+
+    best_category = max(hits, key=hits.__getitem__)
+    best_hits = hits[best_category]
+    return best_category, best_hits / total_hits * min(best_hits / 2, 1.0)
+
+
+def _split_locally_categorized(
+    news_clusters: list[NewsCluster],
+    bypass_threshold: float | None,
+) -> tuple[list[NewsCluster], list[CategorizedNews]]:
+    """Categorize high-confidence clusters locally, leaving the rest for Gemini.
+
+    Locally categorized news get an importance score from their source count
+    (5.0 for a single article, up to 9.0), since no LLM judged them.
+
+    Args:
+        news_clusters: News clusters to categorize
+        bypass_threshold: Minimum local confidence to skip Gemini (None disables)
+
+    Returns:
+        Tuple of (clusters still needing Gemini, locally categorized news)
+    """
+    if bypass_threshold is None:
+        return news_clusters, []
+
+    remaining: list[NewsCluster] = []
+    local: list[CategorizedNews] = []
+    for news in news_clusters:
+        category, confidence = _categorize_locally(news)
+        if confidence < bypass_threshold:
+            remaining.append(news)
+            continue
+        local.append(
+            CategorizedNews(
+                news_cluster=news,
+                category=category,
+                importance_score=5.0 + min(news.article_count - 1, 4),
+                reasoning=f"Categorized locally from keywords (confidence {confidence:.2f})",
+            )
+        )
+    return remaining, local
+
+
+def _group_equivalent_clusters(
+    news_clusters: list[NewsCluster],
+) -> tuple[list[NewsCluster], dict[str, list[NewsCluster]]]:
+    """Group clusters with the same normalized title and top keywords.
+
+    Args:
+        news_clusters: News clusters to categorize
+
+    Returns:
+        Tuple of (one representative per group in input order, other group
+        members keyed by their representative's news_id)
+    """
+    representative_by_key: dict[tuple[str, frozenset[str]], NewsCluster] = {}
+    duplicates_by_id: dict[str, list[NewsCluster]] = {}
+
+    for news in news_clusters:
+        key = (
+            " ".join(_KEYWORD_TOKEN_PATTERN.findall(news.title.lower())),
+            frozenset(keyword.lower() for keyword in news.keywords[:5]),
         )
+        representative = representative_by_key.setdefault(key, news)
+        if representative is not news:
+            duplicates_by_id.setdefault(representative.news_id, []).append(news)
+
+    return list(representative_by_key.values()), duplicates_by_id
+
+
+def _expand_equivalent_clusters(
+    categorized_news: list[CategorizedNews],
+    duplicates_by_id: dict[str, list[NewsCluster]],
+) -> list[CategorizedNews]:
+    """Give every group member its representative's category and score.
+
+    Args:
+        categorized_news: Categorized representatives
+        duplicates_by_id: Other group members keyed by representative news_id
+
+    Returns:
+        Categorized news with each member right after its representative
+    """
+    expanded: list[CategorizedNews] = []
+    for categorized in categorized_news:
+        expanded.append(categorized)
+        for news in duplicates_by_id.get(categorized.news_cluster.news_id, ()):
+            expanded.append(categorized.model_copy(update={"news_cluster": news}))
+    return expanded
+
+
+def _prefilter_score(news: NewsCluster, now: datetime) -> float:
+    """Cheap interest estimate used to pick which clusters Gemini scores.
+
+    Larger clusters (more sources covering the story) and fresher ones rank
+    higher; the score halves for every day of age.
+
+    Args:
+        news: News cluster
+        now: Current UTC time
+
+    Returns:
+        Heuristic score (higher is more promising)
+    """
+    timestamp = news.updated_at or news.created_at
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    age_days: float = max((now - timestamp).total_seconds(), 0.0) / 86400
+    return float(news.article_count * 0.5**age_days)
+
+
+def _partition_llm_candidates(
+    news_clusters: list[NewsCluster],
+    max_candidates: int,
+) -> tuple[list[NewsCluster], list[CategorizedNews]]:
+    """Split clusters into Gemini candidates and auto-categorized leftovers.
 
-    return "\n\n".join(lines)
+    Args:
+        news_clusters: All news clusters
+        max_candidates: Maximum clusters to send to Gemini
+
+    Returns:
+        Tuple of (candidates in input order, remaining news categorized as
+        OTHER with a below-threshold default score)
+    """
+    if len(news_clusters) <= max_candidates:
+        return news_clusters, []
+
+    now = datetime.now(UTC)
+    ranked = heapq.nlargest(
+        max_candidates,
+        range(len(news_clusters)),
+        key=lambda i: _prefilter_score(news_clusters[i], now),
+    )
+    selected = set(ranked)
+
+    candidates = [news for i, news in enumerate(news_clusters) if i in selected]
+    auto_categorized = [
+        CategorizedNews(
+            news_cluster=news,
+            category=NewsCategory.OTHER,
+            importance_score=4.0,
+            reasoning="Not sent to LLM (low pre-filter score), using default values",
+        )
+        for i, news in enumerate(news_clusters)
+        if i not in selected
+    ]
+    return candidates, auto_categorized
 
 
 def _get_category_description(category: NewsCategory) -> str:
@@ -279,18 +611,7 @@ def _get_category_description(category: NewsCategory) -> str:
     Returns:
         Description string
     """
-    descriptions = {
-        NewsCategory.MODEL_RELEASE: "New AI model releases, major updates to existing models",
-        NewsCategory.RESEARCH: "Research papers, academic findings, scientific breakthroughs",
-        NewsCategory.POLICY_REGULATION: "AI policy, government regulations, legal frameworks",
-        NewsCategory.FUNDING_ACQUISITION: "Funding rounds, investments, acquisitions",
-        NewsCategory.PRODUCT_LAUNCH: "New AI products, features, services",
-        NewsCategory.PARTNERSHIP: "Company partnerships, collaborations, joint ventures",
-        NewsCategory.ETHICS_SAFETY: "AI safety, ethics, responsible AI, alignment",
-        NewsCategory.INDUSTRY_NEWS: "Company announcements, industry trends, market news",
-        NewsCategory.OTHER: "Other AI-related news that doesn't fit above categories",
-    }
-    return descriptions.get(category, "Other AI news")
+    return _CATEGORY_DESCRIPTIONS.get(category, "Other AI news")
 
 
 def _parse_categorized_news(
@@ -319,12 +640,12 @@ def _parse_categorized_news(
         reasoning = item.reasoning
 
         if not news_id:
-            logger.warning("Skipping categorized item without news_id: %s", item)
+            logger.warning("Skipping categorized item without news_id: {}", item)
             continue
 
         if news_id in seen_news_ids:
             logger.warning(
-                "Duplicate categorization for news %s, keeping first entry only", news_id
+                "Duplicate categorization for news {}, keeping first entry only", news_id
             )
             continue
 
@@ -333,21 +654,17 @@ def _parse_categorized_news(
         # Find corresponding news cluster
         news_cluster = news_map.get(news_id)
         if not news_cluster:
-            logger.warning(f"News cluster not found for ID: {news_id}")
+            logger.warning("News cluster not found for ID: {}", news_id)
             continue
 
         # Parse category
-        try:
-            category = NewsCategory(category_str)
-        except ValueError:
-            logger.warning(f"Invalid category '{category_str}' for news {news_id}, using OTHER")
+        category = _CATEGORY_BY_VALUE.get(category_str)
+        if category is None:
+            logger.warning("Invalid category '{}' for news {}, using OTHER", category_str, news_id)
             category = NewsCategory.OTHER
 
         # Validate and clamp importance score
-        if importance_score < 0.0:
-            importance_score = 0.0
-        elif importance_score > 10.0:
-            importance_score = 10.0
+        importance_score = max(0.0, min(10.0, importance_score))
 
         categorized_news = CategorizedNews(
             news_cluster=news_cluster,
@@ -359,14 +676,17 @@ def _parse_categorized_news(
         categorized_news_list.append(categorized_news)
 
     logger.info(
-        f"Parsed {len(categorized_news_list)} categorized news from {len(news_clusters)} input"
+        "Parsed {} categorized news from {} input", len(categorized_news_list), len(news_clusters)
     )
 
     # If some news were not categorized, add them with default values
-    categorized_ids = {cn.news_cluster.news_id for cn in categorized_news_list}
-    for news in news_clusters:
-        if news.news_id not in categorized_ids:
-            logger.warning(f"News {news.news_id} was not categorized, adding with defaults")
+    # (walk the input, for a stable order, only when something is missing)
+    missing_ids = news_map.keys() - seen_news_ids
+    if missing_ids:
+        for news in news_map.values():
+            if news.news_id not in missing_ids:
+                continue
+            logger.warning("News {} was not categorized, adding with defaults", news.news_id)
             categorized_news_list.append(
                 CategorizedNews(
                     news_cluster=news,
@@ -379,6 +699,43 @@ def _parse_categorized_news(
     return categorized_news_list
 
 
+def _select_top_news(
+    categorized_news: list[CategorizedNews],
+    quality_threshold: float,
+    target_count: int,
+) -> tuple[list[CategorizedNews], int]:
+    """Select the highest-scoring news above the quality threshold.
+
+    Filtering and top-N selection happen in one pass over a bounded min-heap,
+    without sorting or copying the full list. Ties keep input order.
+
+    Args:
+        categorized_news: All categorized news
+        quality_threshold: Minimum importance score to be selected
+        target_count: Maximum number of news to select
+
+    Returns:
+        Tuple of (selected news by descending score, count above threshold)
+    """
+    # Entries are (score, -index, news): the heap root is the weakest kept
+    # item, and on equal scores the later one is dropped first
+    heap: list[tuple[float, int, CategorizedNews]] = []
+    above_threshold = 0
+
+    for index, news in enumerate(categorized_news):
+        if news.importance_score < quality_threshold:
+            continue
+        above_threshold += 1
+        entry = (news.importance_score, -index, news)
+        if len(heap) < target_count:
+            heapq.heappush(heap, entry)
+        elif target_count > 0:
+            heapq.heappushpop(heap, entry)
+
+    heap.sort(key=lambda entry: entry[:2], reverse=True)
+    return [news for _, _, news in heap], above_threshold
+
+
 def _calculate_category_distribution(
     categorized_news: list[CategorizedNews],
 ) -> dict[NewsCategory, int]:
@@ -390,9 +747,4 @@ def _calculate_category_distribution(
     Returns:
         Dictionary mapping categories to counts
     """
-    distribution = defaultdict(int)
-
-    for news in categorized_news:
-        distribution[news.category] += 1
-
-    return dict(distribution)
+    return dict(Counter(news.category for news in categorized_news))
@@ -4,14 +4,19 @@ Uses Gemini API with Google Search grounding to enhance top news with
 extended summaries, external links, and citations. Makes ONE call per news.
 """
 
+import asyncio
 import re
-from datetime import datetime
-from urllib.parse import urlparse
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from functools import lru_cache, partial
+from typing import Any
+from urllib.parse import parse_qs, urljoin, urlparse
 
 import aiohttp
 from loguru import logger
-from pydantic import HttpUrl, ValidationError
-from tenacity import retry, stop_after_attempt, wait_exponential
+from pydantic import BaseModel, Field, HttpUrl, ValidationError
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from src.constants import ABSTRACT_MAX_LENGTH, ABSTRACT_MIN_LENGTH
 from src.models.config import Step6Config
@@ -22,12 +27,50 @@ from src.models.news import (
     ExternalLink,
     Step6Result,
 )
+from src.utils.gemini_client import get_gemini_client, is_transient_gemini_error
+from src.utils.llm_cache import LLMResponseCache
+
+
+class EnhancedNewsPayload(BaseModel):
+    """Structured Gemini output for one news (used with ``structured_output``)."""
+
+    abstract: str = Field(description="10-30 word brief summary")
+    extended_summary: str = Field(
+        description="200-450 word narrative grounded in the retrieved web sources"
+    )
+    key_points: list[str] = Field(description="3-4 key points")
+
+
+# Gemini Batch Mode job polling (seconds, doubled after each poll)
+_BATCH_POLL_INITIAL_SECONDS = 10
+_BATCH_POLL_MAX_SECONDS = 300
+_BATCH_SUCCESS_STATES = frozenset({"JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"})
+_BATCH_FINAL_STATES = _BATCH_SUCCESS_STATES | {
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+# Response parsing (the section headers are fixed by the step 6 prompt)
+_NEWS_BLOCK_RE = re.compile(
+    r"===\s*NEWS START\s*===(.*?)===\s*NEWS END\s*===", re.DOTALL | re.IGNORECASE
+)
+_SECTION_HEADERS = frozenset({"ABSTRACT", "EXTENDED SUMMARY", "KEY POINTS"})
+
+# Host of the redirect URLs returned in grounding chunks
+_GROUNDING_REDIRECT_HOST = "vertexaisearch.cloud.google.com"
+
+# Grounding redirect URL -> resolved destination, shared by all news in the process.
+# Only successful resolutions are stored; the oldest entry is evicted when full.
+_REDIRECT_CACHE: dict[str, str] = {}
+_REDIRECT_CACHE_MAX_SIZE = 4096
 
 
 async def run_step6(
     config: Step6Config,
     top_news: list[CategorizedNews],
     api_key: str | None = None,
+    on_enhanced: Callable[[EnhancedNews], Awaitable[None]] | None = None,
 ) -> Step6Result:
     """Execute Step 6: Content enhancement with web grounding.
 
@@ -35,6 +78,9 @@ async def run_step6(
         config: Step 6 configuration
         top_news: Top news from Step 5 (up to 10)
         api_key: Gemini API key (required if step enabled)
+        on_enhanced: Optional callback awaited with each news as soon as it is
+            enhanced (completion order), so callers can start downstream work
+            before the whole step finishes
 
     Returns:
         Step6Result with enhanced news
@@ -85,33 +131,81 @@ async def run_step6(
                 errors=[error_msg],
             )
 
+        # One timestamp for every news enhanced in this run
+        run_ts = datetime.now(UTC)
         api_calls = 0
         api_failures = 0
         errors: list[str] = []
         enhancement_failures = 0
         enhanced_news_list: list[EnhancedNews] = []
 
-        logger.info(f"Enhancing {len(top_news)} news items with ONE Gemini call per news")
-
-        # Process each news item individually
-        for idx, cat_news in enumerate(top_news, 1):
-            news_id = cat_news.news_cluster.news_id
-            logger.info(f"Processing news {idx}/{len(top_news)}: {news_id}")
+        logger.info(
+            f"Enhancing {len(top_news)} news items with ONE Gemini call per news "
+            f"(up to {config.max_concurrent_calls} at once)"
+        )
 
+        results: list[EnhancedNews | BaseException] | None = None
+        if config.use_batch_mode:
             try:
-                enhanced = await _enhance_single_news(cat_news, config, api_key)
-                api_calls += 1
-                enhanced_news_list.append(enhanced)
-                logger.info(
-                    f"Successfully enhanced {news_id}: {len(enhanced.external_links)} links, "
-                    f"{len(enhanced.citations)} citations"
-                )
+                results = await _enhance_news_batch(top_news, config, api_key, run_ts)
             except Exception as exc:
+                logger.opt(exception=True).warning(
+                    f"Batch enhancement failed, falling back to one call per news: {exc}"
+                )
+            else:
+                for result in results:
+                    if not isinstance(result, BaseException):
+                        await _notify_enhanced(on_enhanced, result)
+
+        if results is None:
+            # Enhance news concurrently; the semaphore bounds calls in flight.
+            # Blocking Gemini calls get their own pool, sized to the same limit,
+            # so they never queue behind other to_thread work in the default one.
+            semaphore = asyncio.Semaphore(config.max_concurrent_calls)
+
+            with ThreadPoolExecutor(
+                max_workers=config.max_concurrent_calls, thread_name_prefix="gemini-step6"
+            ) as executor:
+
+                async def enhance_with_semaphore(
+                    idx: int, cat_news: CategorizedNews
+                ) -> EnhancedNews:
+                    async with semaphore:
+                        logger.info(
+                            f"Processing news {idx}/{len(top_news)}: "
+                            f"{cat_news.news_cluster.news_id}"
+                        )
+                        enhanced = await _enhance_single_news(
+                            cat_news, config, api_key, executor, run_ts
+                        )
+                    await _notify_enhanced(on_enhanced, enhanced)
+                    return enhanced
+
+                results = await asyncio.gather(
+                    *(
+                        enhance_with_semaphore(idx, cat_news)
+                        for idx, cat_news in enumerate(top_news, 1)
+                    ),
+                    return_exceptions=True,
+                )
+
+        # Collect results in input order
+        for cat_news, result in zip(top_news, results, strict=True):
+            news_id = cat_news.news_cluster.news_id
+            if isinstance(result, BaseException):
                 api_failures += 1
                 enhancement_failures += 1
-                error_msg = f"Failed to enhance news {news_id}: {exc}"
-                logger.error(error_msg, exc_info=True)
+                error_msg = f"Failed to enhance news {news_id}: {result}"
+                logger.opt(exception=result).error(error_msg)
                 errors.append(error_msg)
+                continue
+
+            api_calls += 1
+            enhanced_news_list.append(result)
+            logger.info(
+                f"Successfully enhanced {news_id}: {len(result.external_links)} links, "
+                f"{len(result.citations)} citations"
+            )
 
         logger.info(f"Enhanced {len(enhanced_news_list)}/{len(top_news)} news items")
 
@@ -151,11 +245,34 @@ async def run_step6(
         )
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=10))
+async def _notify_enhanced(
+    on_enhanced: Callable[[EnhancedNews], Awaitable[None]] | None,
+    enhanced: EnhancedNews,
+) -> None:
+    """Pass an enhanced news to the caller's callback; callback errors are only logged."""
+    if on_enhanced is None:
+        return
+    try:
+        await on_enhanced(enhanced)
+    except Exception as exc:
+        logger.opt(exception=True).warning(
+            f"on_enhanced callback failed for {enhanced.news.news_cluster.news_id}: {exc}"
+        )
+
+
+# Only transient API errors are retried: a response that fails to parse or
+# validate would fail the same way again
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(min=2, max=10),
+    retry=retry_if_exception(is_transient_gemini_error),
+)
 async def _enhance_single_news(
     cat_news: CategorizedNews,
     config: Step6Config,
     api_key: str,
+    executor: ThreadPoolExecutor | None = None,
+    enhanced_at: datetime | None = None,
 ) -> EnhancedNews:
     """Enhance a single news item with Gemini grounding.
 
@@ -163,6 +280,8 @@ async def _enhance_single_news(
         cat_news: Categorized news to enhance
         config: Step 6 configuration
         api_key: Gemini API key
+        executor: Thread pool for the blocking Gemini call (default executor if None)
+        enhanced_at: Run timestamp for the result (now if None)
 
     Returns:
         EnhancedNews with extended summary, links, and citations
@@ -170,19 +289,178 @@ async def _enhance_single_news(
     Raises:
         Exception: On API failures after retries
     """
-    from google import genai
     from google.genai import types
 
+    news = cat_news.news_cluster
+
+    prompt = _build_enhancement_prompt(cat_news)
+
+    # Reuse a stored response for an identical request (reruns, overlapping days)
+    response_cache = _get_response_cache(config)
+    cache_key = LLMResponseCache.make_key(
+        model=config.llm_model,
+        prompt=prompt,
+        temperature=getattr(config, "temperature", 0.3),
+        tools=["google_search"],
+        structured_output=config.structured_output,
+    )
+    if response_cache is not None:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached Gemini response for {news.news_id}")
+            return await _process_enhancement_response(
+                types.GenerateContentResponse.model_validate(cached), cat_news, enhanced_at
+            )
+
+    client = get_gemini_client(api_key)
+
+    logger.debug(f"Calling Gemini API with grounding for news {news.news_id}")
+
+    # The SDK call is blocking; run it in a worker thread so concurrent news
+    # are actually enhanced in parallel
+    response = await asyncio.get_running_loop().run_in_executor(
+        executor,
+        partial(
+            client.models.generate_content,
+            model=config.llm_model,
+            contents=prompt,
+            config=_build_generation_config(config),
+        ),
+    )
+
+    logger.debug(f"Gemini API response received for {news.news_id}")
+
+    enhanced = await _process_enhancement_response(response, cat_news, enhanced_at)
+
+    # Only responses that parsed successfully are worth keeping
+    if response_cache is not None and isinstance(response, types.GenerateContentResponse):
+        response_cache.set(cache_key, response.model_dump(mode="json", exclude_none=True))
+
+    return enhanced
+
+
+def _get_response_cache(config: Step6Config) -> LLMResponseCache | None:
+    """Get the response cache configured for Step 6.
+
+    Args:
+        config: Step 6 configuration
+
+    Returns:
+        LLMResponseCache, or None when response caching is disabled
+    """
+    if not config.response_cache_dir:
+        return None
+    return _open_response_cache(config.response_cache_dir, config.response_cache_ttl_seconds)
+
+
+@lru_cache(maxsize=4)
+def _open_response_cache(cache_dir: str, ttl_seconds: int) -> LLMResponseCache:
+    """Create the response cache once per (directory, TTL)."""
+    return LLMResponseCache(cache_dir, ttl_seconds)
+
+
+async def _enhance_news_batch(
+    top_news: list[CategorizedNews],
+    config: Step6Config,
+    api_key: str,
+    enhanced_at: datetime | None = None,
+) -> list[EnhancedNews | BaseException]:
+    """Enhance all news with one Gemini Batch Mode job.
+
+    Batch jobs are billed at a discount but can take much longer than
+    synchronous calls, which suits a daily pipeline.
+
+    Args:
+        top_news: News to enhance
+        config: Step 6 configuration
+        api_key: Gemini API key
+        enhanced_at: Run timestamp for the results (now if None)
+
+    Returns:
+        One EnhancedNews or exception per input news, in input order
+
+    Raises:
+        RuntimeError: If the batch job ends without succeeding
+        TimeoutError: If the job doesn't finish within batch_timeout_seconds
+    """
+    from google.genai import types
+
+    client = get_gemini_client(api_key)
+    generation_config = _build_generation_config(config)
+    requests = [
+        types.InlinedRequest(
+            contents=_build_enhancement_prompt(cat_news),
+            metadata={"news_id": cat_news.news_cluster.news_id},
+            config=generation_config,
+        )
+        for cat_news in top_news
+    ]
+
+    job = await asyncio.to_thread(
+        client.batches.create,
+        model=config.llm_model,
+        src=requests,
+        config={"display_name": f"step6-enhancement-{datetime.now(UTC):%Y%m%d-%H%M%S}"},
+    )
+    logger.info(f"Created Gemini batch job {job.name} for {len(requests)} news")
+
+    # Poll with exponential backoff until the job reaches a final state
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + config.batch_timeout_seconds
+    delay = _BATCH_POLL_INITIAL_SECONDS
+    while job.state not in _BATCH_FINAL_STATES:
+        if loop.time() >= deadline:
+            await asyncio.to_thread(client.batches.cancel, name=job.name)
+            raise TimeoutError(
+                f"Batch job {job.name} not done after {config.batch_timeout_seconds}s"
+            )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, _BATCH_POLL_MAX_SECONDS)
+        job = await asyncio.to_thread(client.batches.get, name=job.name)
+        logger.debug(f"Batch job {job.name} state: {job.state}")
+
+    if job.state not in _BATCH_SUCCESS_STATES:
+        raise RuntimeError(f"Batch job {job.name} ended in state {job.state}: {job.error}")
+
+    inlined_responses = (job.dest.inlined_responses if job.dest else None) or []
+    if len(inlined_responses) != len(top_news):
+        raise RuntimeError(
+            f"Batch job {job.name} returned {len(inlined_responses)} responses "
+            f"for {len(top_news)} requests"
+        )
+
+    # Responses come back in request order
+    results: list[EnhancedNews | BaseException] = []
+    for cat_news, inlined in zip(top_news, inlined_responses, strict=True):
+        if inlined.error or not inlined.response:
+            results.append(RuntimeError(f"Batch request failed: {inlined.error}"))
+            continue
+        try:
+            results.append(
+                await _process_enhancement_response(inlined.response, cat_news, enhanced_at)
+            )
+        except Exception as exc:
+            results.append(exc)
+    return results
+
+
+def _build_enhancement_prompt(cat_news: CategorizedNews) -> str:
+    """Format the Step 6 prompt for one news item.
+
+    Args:
+        cat_news: Categorized news to enhance
+
+    Returns:
+        Complete prompt text
+    """
     from src.utils.prompt_loader import get_prompt_loader
 
-    client = genai.Client(api_key=api_key)
     news = cat_news.news_cluster
-
     keywords = ", ".join(news.keywords[:8]) if news.keywords else "n/a"
 
     # Load and format prompt from YAML
     prompt_loader = get_prompt_loader()
-    prompt = prompt_loader.format_prompt(
+    return prompt_loader.format_prompt(
         "step6_enhancement",
         news_id=news.news_id,
         title=news.title,
@@ -193,45 +471,62 @@ async def _enhance_single_news(
         article_count=news.article_count,
     )
 
-    logger.debug(f"Calling Gemini API with grounding for news {news.news_id}")
+
+def _build_generation_config(config: Step6Config) -> Any:
+    """Get the grounded generation config shared by sync and batch calls.
+
+    Args:
+        config: Step 6 configuration
+
+    Returns:
+        google.genai GenerateContentConfig with Google Search grounding
+    """
+    return _generation_config_for(getattr(config, "temperature", 0.3), config.structured_output)
+
+
+@lru_cache(maxsize=4)
+def _generation_config_for(temperature: float, structured_output: bool = False) -> Any:
+    """Build the grounding tool and generation config once per settings."""
+    from google.genai import types
 
     grounding_tool = types.Tool(googleSearch=types.GoogleSearch())
-    generation_config = types.GenerateContentConfig(
-        temperature=getattr(config, "temperature", 0.3),
-        tools=[grounding_tool],
-    )
+    if structured_output:
+        return types.GenerateContentConfig(
+            temperature=temperature,
+            tools=[grounding_tool],
+            response_mime_type="application/json",
+            response_schema=EnhancedNewsPayload,
+        )
+    return types.GenerateContentConfig(temperature=temperature, tools=[grounding_tool])
 
-    response = client.models.generate_content(
-        model=config.llm_model,
-        contents=prompt,
-        config=generation_config,
-    )
 
-    logger.debug(f"Gemini API response received for {news.news_id}")
+async def _process_enhancement_response(
+    response: Any, cat_news: CategorizedNews, enhanced_at: datetime | None = None
+) -> EnhancedNews:
+    """Extract grounding metadata from a Gemini response and parse it.
+
+    Args:
+        response: Gemini GenerateContentResponse
+        cat_news: News the response belongs to
+        enhanced_at: Run timestamp for the result (now if None)
+
+    Returns:
+        Parsed EnhancedNews
+    """
+    news = cat_news.news_cluster
 
     # Extract grounding metadata
     grounding_metadata: dict = {}
-    if response.candidates:
-        candidate = response.candidates[0]
-        if getattr(candidate, "grounding_metadata", None):
-            gm = candidate.grounding_metadata
-            web_queries = (
-                list(gm.web_search_queries)
-                if getattr(gm, "web_search_queries", None) is not None
-                else []
-            )
-            grounding_chunks = (
-                list(gm.grounding_chunks)
-                if getattr(gm, "grounding_chunks", None) is not None
-                else []
-            )
-            grounding_supports = (
-                list(gm.grounding_supports)
-                if getattr(gm, "grounding_supports", None) is not None
-                else []
-            )
+    candidates = response.candidates
+    if candidates:
+        gm = getattr(candidates[0], "grounding_metadata", None)
+        if gm:
+            # The SDK already returns lists; use them as-is instead of copying
+            web_queries = gm.web_search_queries or []
+            grounding_chunks = gm.grounding_chunks or []
+            grounding_supports = gm.grounding_supports or []
             logger.debug(
-                "Grounding data for %s: %s queries, %s chunks, %s supports",
+                "Grounding data for {}: {} queries, {} chunks, {} supports",
                 news.news_id,
                 len(web_queries),
                 len(grounding_chunks),
@@ -252,6 +547,7 @@ async def _enhance_single_news(
         response_text=response_text,
         grounding_metadata=grounding_metadata,
         cat_news=cat_news,
+        enhanced_at=enhanced_at,
     )
 
     return enhanced
@@ -328,6 +624,7 @@ async def _parse_single_news_response(
     response_text: str,
     grounding_metadata: dict,
     cat_news: CategorizedNews,
+    enhanced_at: datetime | None = None,
 ) -> EnhancedNews:
     """Parse and validate Gemini API response into structured EnhancedNews."""
     news = cat_news.news_cluster
@@ -336,23 +633,25 @@ async def _parse_single_news_response(
     if not response_text.strip():
         raise ValueError(f"Gemini returned empty response for {news_id}")
 
-    # Extract NEWS block
-    pattern = re.compile(
-        r"===\s*NEWS START\s*===(.*?)===\s*NEWS END\s*===",
-        re.DOTALL | re.IGNORECASE,
-    )
-    match = pattern.search(response_text)
-    if not match:
-        raise ValueError(f"No NEWS block found in response for {news_id}")
+    if response_text.lstrip().startswith("{"):
+        # Structured output: the schema already separates the sections
+        try:
+            payload = EnhancedNewsPayload.model_validate_json(response_text)
+        except ValidationError as exc:
+            raise ValueError(f"Invalid structured response for {news_id}: {exc}") from exc
+        sections = {"ABSTRACT": payload.abstract, "EXTENDED SUMMARY": payload.extended_summary}
+        key_points = [p.strip() for p in payload.key_points if p.strip()]
+    else:
+        # Extract NEWS block
+        match = _NEWS_BLOCK_RE.search(response_text)
+        if not match:
+            raise ValueError(f"No NEWS block found in response for {news_id}")
 
-    section_text = match.group(1).strip()
+        sections = _split_sections(match.group(1))
+        key_points = _extract_key_points(sections.get("KEY POINTS", ""))
 
     # Extract abstract
-    abstract = _extract_section_text(
-        section_text,
-        "ABSTRACT",
-        stop_headers=["EXTENDED SUMMARY"],
-    )
+    abstract = sections.get("ABSTRACT")
     if not abstract:
         # Fallback: use first 150 chars of original summary
         abstract = news.summary[:150]
@@ -378,11 +677,7 @@ async def _parse_single_news_response(
         abstract = abstract[: ABSTRACT_MAX_LENGTH - 3] + "..."
 
     # Extract extended summary
-    extended_summary = _extract_section_text(
-        section_text,
-        "EXTENDED SUMMARY",
-        stop_headers=["KEY POINTS"],
-    )
+    extended_summary = sections.get("EXTENDED SUMMARY")
     if not extended_summary:
         extended_summary = news.summary
     extended_summary = extended_summary.strip()
@@ -404,9 +699,6 @@ async def _parse_single_news_response(
         )
         extended_summary = extended_summary[:3997] + "..."
 
-    # Extract key points
-    key_points = _extract_key_points(section_text)
-
     # Extract external links from grounding chunks
     chunk_links = await _extract_external_links(grounding_metadata)
 
@@ -425,7 +717,7 @@ async def _parse_single_news_response(
         extended_summary=extended_summary,
         external_links=external_links[:10],
         key_points=key_points[:7],
-        enhanced_at=datetime.utcnow(),
+        enhanced_at=enhanced_at or datetime.now(UTC),
         grounded=grounded,
     )
 
@@ -440,55 +732,83 @@ async def _parse_single_news_response(
     return enhanced_news
 
 
-def _extract_section_text(
-    section_text: str,
-    header: str,
-    stop_headers: list[str] | None = None,
-) -> str | None:
-    """Extract multiline section text bounded by stop headers."""
-    if stop_headers:
-        stop_pattern = "|".join(rf"{re.escape(h)}\s*:" for h in stop_headers)
-        lookahead = rf"(?=(?:{stop_pattern})|===\s*NEWS END\s*===|$)"
-    else:
-        lookahead = r"(?===\s*NEWS END\s*===|$)"
-
-    pattern = rf"{header}\s*:\s*\n(.*?){lookahead}"
-    match = re.search(pattern, section_text, re.DOTALL | re.IGNORECASE)
-    return match.group(1).strip() if match else None
-
+def _split_sections(news_block: str) -> dict[str, str]:
+    """Split a NEWS block into its sections in a single pass over its lines.
 
-def _extract_key_points(section_text: str) -> list[str]:
-    """Extract bullet key points from the section."""
-    key_points_text = _extract_section_text(section_text, "KEY POINTS", None)
-    if not key_points_text:
-        return []
-
-    points = re.findall(r"-\s*(.+?)(?=\n-|\n\n|$)", key_points_text, re.DOTALL)
-    return [p.strip() for p in points if p.strip()]
+    A section starts at a line ``HEADER:`` (case-insensitive, text may follow
+    the colon) and runs until the next section header.
 
+    Args:
+        news_block: Content between the NEWS START and NEWS END markers
 
-async def _resolve_redirect_url(redirect_url: str, timeout: int = 5) -> str:
+    Returns:
+        Stripped section text keyed by upper-case header
+    """
+    sections: dict[str, list[str]] = {}
+    current: list[str] | None = None
+
+    for line in news_block.splitlines():
+        header, colon, rest = line.partition(":")
+        header = header.strip().upper()
+        if colon and header in _SECTION_HEADERS:
+            current = sections.setdefault(header, [])
+            if rest.strip():
+                current.append(rest)
+        elif current is not None:
+            current.append(line)
+
+    return {header: "\n".join(lines).strip() for header, lines in sections.items()}
+
+
+def _extract_key_points(key_points_text: str) -> list[str]:
+    """Extract bullet key points; a bullet ends at the next bullet or a blank line."""
+    points: list[str] = []
+    in_bullet = False
+
+    for line in key_points_text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("-"):
+            points.append(stripped[1:].strip())
+            in_bullet = True
+        elif not stripped:
+            in_bullet = False
+        elif in_bullet:
+            points[-1] = f"{points[-1]}\n{stripped}"
+
+    return [p for p in points if p]
+
+
+async def _resolve_redirect_url(
+    session: aiohttp.ClientSession, redirect_url: str, timeout: int = 5
+) -> str:
     """Resolve Google grounding redirect URL to final destination.
 
     Args:
+        session: Shared HTTP session (reuses connections to the redirect host)
         redirect_url: Google grounding redirect URL
         timeout: Request timeout in seconds
 
     Returns:
         Final resolved URL or original URL if resolution fails
     """
+    local_url = _resolve_redirect_locally(redirect_url)
+    if local_url is not None:
+        return local_url
+
     try:
-        async with (
-            aiohttp.ClientSession() as session,
-            session.head(
-                redirect_url,
-                allow_redirects=True,
-                timeout=aiohttp.ClientTimeout(total=timeout),
-            ) as response,
-        ):
-            # Return the final URL after following redirects
-            final_url = str(response.url)
+        async with session.head(
+            redirect_url,
+            allow_redirects=False,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            # The first hop already points at the publisher; don't follow the
+            # rest of the chain (trackers, canonical redirects)
+            location = response.headers.get("Location")
+            if not location:
+                return str(response.url)
+            final_url = urljoin(redirect_url, location)
             logger.debug(f"Resolved redirect: {redirect_url[:80]}... -> {final_url[:80]}...")
+            _cache_redirect(redirect_url, final_url)
             return final_url
     except TimeoutError:
         logger.warning(f"Timeout resolving redirect URL: {redirect_url[:80]}...")
@@ -498,41 +818,93 @@ async def _resolve_redirect_url(redirect_url: str, timeout: int = 5) -> str:
         return redirect_url
 
 
+def _resolve_redirect_locally(redirect_url: str) -> str | None:
+    """Resolve a grounding URL without a network request when possible.
+
+    URLs that are not grounding redirects are already final. For redirects,
+    the resolution cache is checked, then an explicit destination is looked
+    for in the query string. Only HEAD-resolved URLs are cached.
+
+    Args:
+        redirect_url: URI from a grounding chunk
+
+    Returns:
+        Destination URL, or None if a HEAD request is needed
+    """
+    parsed = urlparse(redirect_url)
+    if parsed.netloc != _GROUNDING_REDIRECT_HOST:
+        return redirect_url
+
+    cached_url = _REDIRECT_CACHE.get(redirect_url)
+    if cached_url is not None:
+        return cached_url
+
+    for values in parse_qs(parsed.query).values():
+        for value in values:
+            if value.startswith(("http://", "https://")):
+                return value
+
+    return None
+
+
+def _cache_redirect(redirect_url: str, final_url: str) -> None:
+    """Remember a resolved redirect, evicting the oldest entry when full."""
+    if len(_REDIRECT_CACHE) >= _REDIRECT_CACHE_MAX_SIZE:
+        del _REDIRECT_CACHE[next(iter(_REDIRECT_CACHE))]
+    _REDIRECT_CACHE[redirect_url] = final_url
+
+
 async def _extract_external_links(grounding_metadata: dict) -> dict[int, ExternalLink]:
-    """Resolve grounding chunks into ExternalLink templates keyed by chunk index."""
-    chunk_links: dict[int, ExternalLink] = {}
+    """Resolve grounding chunks into ExternalLink templates keyed by chunk index.
+
+    Redirects that cannot be resolved locally are resolved concurrently over
+    one shared session.
+    """
     grounding_chunks = grounding_metadata.get("grounding_chunks") or []
-    logger.info("Processing %s grounding chunks for external links", len(grounding_chunks))
+    logger.info("Processing {} grounding chunks for external links", len(grounding_chunks))
 
+    # (chunk index, redirect URI, title) for every chunk carrying a web source
+    web_chunks: list[tuple[int, str, str]] = []
     for idx, chunk in enumerate(grounding_chunks):
-        try:
-            logger.debug("Chunk %s: type=%s", idx, type(chunk))
-            if not hasattr(chunk, "web"):
-                continue
-            web = chunk.web
-            uri = str(web.uri) if hasattr(web, "uri") else None
-            title = str(web.title) if hasattr(web, "title") else None
-            if not uri or not title:
-                continue
-
-            logger.info("Resolving URL %s/%s: %s", idx + 1, len(grounding_chunks), uri[:80])
-            resolved_uri = await _resolve_redirect_url(uri)
-            parsed = urlparse(resolved_uri)
-            source = parsed.netloc or "unknown"
+        if not hasattr(chunk, "web"):
+            continue
+        web = chunk.web
+        uri = str(web.uri) if hasattr(web, "uri") else None
+        title = str(web.title) if hasattr(web, "title") else None
+        if uri and title:
+            web_chunks.append((idx, uri, title))
+
+    if not web_chunks:
+        return {}
+
+    # Resolve each distinct redirect once even if several chunks share it, and
+    # only open a session for those that cannot be resolved locally
+    resolved_by_uri: dict[str, str | None] = {
+        uri: _resolve_redirect_locally(uri) for _, uri, _ in web_chunks
+    }
+    pending_uris = [uri for uri, resolved in resolved_by_uri.items() if resolved is None]
+    if pending_uris:
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=20, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            resolved = await asyncio.gather(
+                *(_resolve_redirect_url(session, uri) for uri in pending_uris)
+            )
+        resolved_by_uri.update(zip(pending_uris, resolved, strict=True))
 
-            try:
-                link = ExternalLink(
-                    url=HttpUrl(resolved_uri),
-                    title=title[:200] if len(title) > 200 else title,
-                    source=source,
-                    relevance_score=1.0,
-                    snippet=None,
-                )
-                chunk_links[idx] = link
-            except ValidationError as exc:
-                logger.warning("Invalid URL in chunk %s: %s", idx, str(exc)[:100])
-        except Exception as exc:
-            logger.warning("Failed to extract link from chunk %s: %s", idx, exc, exc_info=True)
+    chunk_links: dict[int, ExternalLink] = {}
+    for idx, uri, title in web_chunks:
+        resolved_uri = resolved_by_uri[uri] or uri
+        source = urlparse(resolved_uri).netloc or "unknown"
+        try:
+            chunk_links[idx] = ExternalLink(
+                url=HttpUrl(resolved_uri),
+                title=title[:200] if len(title) > 200 else title,
+                source=source,
+                relevance_score=1.0,
+                snippet=None,
+            )
+        except ValidationError as exc:
+            logger.warning("Invalid URL in chunk {}: {}", idx, str(exc)[:100])
 
-    logger.info("Extracted %s external links from grounding", len(chunk_links))
+    logger.info("Extracted {} external links from grounding", len(chunk_links))
     return chunk_links
@@ -3,20 +3,23 @@
 Generates daily and weekly RSS feeds from enhanced news for external consumption.
 """
 
-import glob
+import os
+import re
 from datetime import datetime, timedelta
 from email.utils import formatdate
 from pathlib import Path
-from xml.dom import minidom
-from xml.etree.ElementTree import Element, SubElement, tostring
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
 
-import yaml
 from loguru import logger
 
 from src.models.config import Step8Config
 from src.models.news import EnhancedNews
 from src.models.rss import RSSFeed, RSSItem, Step8Result
 
+# Daily news file names: YYYY-MM-DD.yaml
+_NEWS_FILE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}\.yaml")
+
 
 async def run_step8(
     config: Step8Config,
@@ -68,7 +71,7 @@ async def run_step8(
             logger.info(f"Created daily feed: {daily_path} ({daily_count} items)")
         except Exception as e:
             error_msg = f"Failed to create daily feed: {e}"
-            logger.error(error_msg, exc_info=True)
+            logger.opt(exception=True).error(error_msg)
             errors.append(error_msg)
 
         # Generate weekly feed (load last 7 days)
@@ -91,7 +94,7 @@ async def run_step8(
             logger.info(f"Created weekly feed: {weekly_path} ({weekly_count} items)")
         except Exception as e:
             error_msg = f"Failed to create weekly feed: {e}"
-            logger.error(error_msg, exc_info=True)
+            logger.opt(exception=True).error(error_msg)
             errors.append(error_msg)
 
         # Validate feeds
@@ -102,7 +105,7 @@ async def run_step8(
                 logger.info(f"Feed validation: {'PASSED' if feeds_valid else 'FAILED'}")
             except Exception as e:
                 error_msg = f"Feed validation failed: {e}"
-                logger.error(error_msg, exc_info=True)
+                logger.opt(exception=True).error(error_msg)
                 errors.append(error_msg)
 
         success = len(errors) == 0 or (daily_path is not None and weekly_path is not None)
@@ -121,7 +124,7 @@ async def run_step8(
 
     except Exception as e:
         error_msg = f"Step 8 failed critically: {e}"
-        logger.error(error_msg, exc_info=True)
+        logger.opt(exception=True).error(error_msg)
         return Step8Result(
             success=False,
             daily_feed_path=None,
@@ -150,11 +153,11 @@ def _news_to_rss_item(news: EnhancedNews, base_url: str) -> RSSItem:
         primary_link = f"{base_url}#news-{news.news.news_cluster.news_id}"
 
     # Description: extended summary + key points
-    description = f"{news.extended_summary}\n\n"
+    parts = [news.extended_summary, ""]
     if news.key_points:
-        description += "**Key Points:**\n"
-        for point in news.key_points:
-            description += f"- {point}\n"
+        parts.append("**Key Points:**")
+        parts.extend(f"- {point}" for point in news.key_points)
+    description = "\n".join(parts) + "\n"
 
     return RSSItem(
         title=news.news.news_cluster.title,
@@ -180,69 +183,57 @@ def _write_rss_feed(
     Raises:
         IOError: If file write fails
     """
-    # Create RSS root element
-    rss = Element("rss", version="2.0")
-    rss.set("xmlns:atom", "http://www.w3.org/2005/Atom")
-
-    # Channel element
-    channel = SubElement(rss, "channel")
-
-    # Required channel elements
-    SubElement(channel, "title").text = feed.title
-    SubElement(channel, "description").text = feed.description
-    SubElement(channel, "link").text = str(feed.link)
-    SubElement(channel, "language").text = feed.language
-
-    # Publication dates
-    SubElement(channel, "pubDate").text = formatdate(feed.pub_date.timestamp())
-    SubElement(channel, "lastBuildDate").text = formatdate(datetime.utcnow().timestamp())
-
-    # Self link
     filename = "weekly.xml" if is_weekly else output_path.name
-    self_link = SubElement(
-        channel,
-        "{http://www.w3.org/2005/Atom}link",
-        href=f"{base_url}/raw/main/{filename}",
-        rel="self",
-    )
-    self_link.set("type", "application/rss+xml")
+    output_path.write_text(_render_rss(feed, base_url, filename), encoding="utf-8")
 
-    # Items
-    for item in feed.items:
-        item_elem = SubElement(channel, "item")
-        SubElement(item_elem, "title").text = item.title
 
-        # Description with CDATA
-        desc = SubElement(item_elem, "description")
-        desc.text = f"<![CDATA[{item.description}]]>"
+def _render_rss(feed: RSSFeed, base_url: str, filename: str) -> str:
+    """Render an RSS 2.0 document.
 
-        SubElement(item_elem, "link").text = str(item.link)
+    The schema is small and fixed, so the XML is written directly instead of
+    building and pretty-printing an element tree.
 
-        # GUID
-        guid_elem = SubElement(item_elem, "guid")
-        guid_elem.set("isPermaLink", "false")
-        guid_elem.text = item.guid
-
-        SubElement(item_elem, "pubDate").text = formatdate(item.pub_date.timestamp())
+    Args:
+        feed: RSSFeed object
+        base_url: Base URL for self link
+        filename: Published feed file name, used in the self link
 
-        # Categories
-        for cat in item.categories:
-            SubElement(item_elem, "category").text = cat
+    Returns:
+        Indented RSS XML document
+    """
+    self_href = quoteattr(f"{base_url}/raw/main/{filename}")
+    parts = [
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">\n'
+        "  <channel>\n"
+        f"    <title>{escape(feed.title)}</title>\n"
+        f"    <description>{escape(feed.description)}</description>\n"
+        f"    <link>{escape(str(feed.link))}</link>\n"
+        f"    <language>{escape(feed.language)}</language>\n"
+        f"    <pubDate>{formatdate(feed.pub_date.timestamp())}</pubDate>\n"
+        f"    <lastBuildDate>{formatdate(datetime.utcnow().timestamp())}</lastBuildDate>\n"
+        f'    <atom:link href={self_href} rel="self" type="application/rss+xml" />\n'
+    ]
 
-    # Convert to string and pretty print
-    xml_str = tostring(rss, encoding="unicode")
+    for item in feed.items:
+        parts.append(
+            "    <item>\n"
+            f"      <title>{escape(item.title)}</title>\n"
+            f"      <description>{_cdata(item.description)}</description>\n"
+            f"      <link>{escape(str(item.link))}</link>\n"
+            f'      <guid isPermaLink="false">{escape(item.guid)}</guid>\n'
+            f"      <pubDate>{formatdate(item.pub_date.timestamp())}</pubDate>\n"
+        )
+        parts.extend(f"      <category>{escape(cat)}</category>\n" for cat in item.categories)
+        parts.append("    </item>\n")
 
-    # Parse and pretty print
-    dom = minidom.parseString(xml_str)
-    pretty_xml = dom.toprettyxml(indent="  ", encoding="utf-8")
+    parts.append("  </channel>\n</rss>\n")
+    return "".join(parts)
 
-    # Remove extra blank lines
-    lines = [line for line in pretty_xml.decode("utf-8").split("\n") if line.strip()]
-    clean_xml = "\n".join(lines)
 
-    # Write to file
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(clean_xml)
+def _cdata(text: str) -> str:
+    """Wrap text in a CDATA section, splitting any ``]]>`` it contains."""
+    return "<![CDATA[" + text.replace("]]>", "]]]]><![CDATA[>") + "]]>"
 
 
 def _load_last_n_days_news(days: int = 7) -> list[EnhancedNews]:
@@ -258,8 +249,10 @@ def _load_last_n_days_news(days: int = 7) -> list[EnhancedNews]:
         This is a simplified implementation that loads from news/ directory.
         In production, this should load from Step 6 cache or news files.
     """
-    news_list = []
-    cutoff_date = datetime.now() - timedelta(days=days)
+    news_list: list[EnhancedNews] = []
+    # ISO dates sort as strings, so file names can be filtered without parsing.
+    # A file dated on the cutoff day is older than cutoff (midnight < now).
+    cutoff_str = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
 
     # Find news YAML files in news/ directory
     news_dir = Path("news")
@@ -267,31 +260,19 @@ def _load_last_n_days_news(days: int = 7) -> list[EnhancedNews]:
         logger.warning("News directory not found, skipping weekly feed loading")
         return []
 
-    # Look for YAML files from last N days
-    yaml_files = glob.glob(str(news_dir / "*.yaml"))
-
-    for yaml_file in yaml_files:
-        try:
-            # Extract date from filename (YYYY-MM-DD.yaml)
-            filename = Path(yaml_file).stem
-            file_date = datetime.strptime(filename, "%Y-%m-%d")
-
-            # Skip if older than cutoff
-            if file_date < cutoff_date:
-                continue
-
-            # Load YAML file
-            with open(yaml_file, encoding="utf-8") as f:
-                _ = yaml.safe_load(f)  # Loaded but not used yet
+    # Look for YAML files (YYYY-MM-DD.yaml) from last N days
+    with os.scandir(news_dir) as entries:
+        yaml_files = [
+            entry.path
+            for entry in entries
+            if _NEWS_FILE_PATTERN.fullmatch(entry.name) and entry.name[:10] > cutoff_str
+        ]
 
-            # NOTE: This is a simplified implementation
-            # In production, we would reconstruct EnhancedNews objects from YAML
-            # For now, we just skip loading historical news
-            # The weekly feed will only contain today's news
-
-        except Exception as e:
-            logger.warning(f"Failed to load news from {yaml_file}: {e}")
-            continue
+    # NOTE: This is a simplified implementation
+    # In production, we would reconstruct EnhancedNews objects from YAML
+    # Until then the files are not read, and the weekly feed only contains
+    # today's news
+    logger.debug(f"Skipping {len(yaml_files)} historical news files (not loaded yet)")
 
     return news_list
 
@@ -299,6 +280,9 @@ def _load_last_n_days_news(days: int = 7) -> list[EnhancedNews]:
 def _validate_rss_feeds(feed_paths: list[Path]) -> bool:
     """Validate RSS feeds against RSS 2.0 spec.
 
+    Each feed must be well-formed XML with a non-empty channel title. The
+    standard library parser covers both checks without a full feed parse.
+
     Args:
         feed_paths: List of feed file paths
 
@@ -306,22 +290,20 @@ def _validate_rss_feeds(feed_paths: list[Path]) -> bool:
         True if all feeds are valid, False otherwise
     """
     try:
-        import feedparser
-
         for path in feed_paths:
             if not path.exists():
                 logger.error(f"Feed file not found: {path}")
                 return False
 
-            parsed = feedparser.parse(str(path))
-
             # Check for parsing errors
-            if parsed.bozo:
-                logger.error(f"Invalid RSS feed {path}: {parsed.bozo_exception}")
+            try:
+                root = ET.parse(path).getroot()  # noqa: S314  # Feed written by this step
+            except ET.ParseError as e:
+                logger.error(f"Invalid RSS feed {path}: {e}")
                 return False
 
             # Check required fields
-            if not parsed.feed.get("title"):
+            if not root.findtext("./channel/title"):
                 logger.error(f"Feed {path} missing title")
                 return False
 
@@ -329,9 +311,6 @@ def _validate_rss_feeds(feed_paths: list[Path]) -> bool:
 
         return True
 
-    except ImportError:
-        logger.warning("feedparser not installed, skipping validation")
-        return True  # Don't fail if feedparser is not available
     except Exception as e:
         logger.error(f"RSS validation failed: {e}")
         return False
@@ -2,7 +2,13 @@
 
 from src.utils.cache import CacheManager
 from src.utils.config_loader import load_feeds_config, load_pipeline_config, load_yaml_config
-from src.utils.hash import calculate_similarity, generate_content_hash, normalize_url
+from src.utils.hash import (
+    calculate_similarity,
+    generate_content_hash,
+    generate_content_hashes,
+    normalize_url,
+    normalize_urls,
+)
 from src.utils.logging import get_logger, setup_logging
 from src.utils.slug import generate_slug, generate_unique_slug
 
@@ -16,6 +22,8 @@ __all__ = [
     "load_feeds_config",
     "load_pipeline_config",
     "generate_content_hash",
+    "generate_content_hashes",
     "normalize_url",
+    "normalize_urls",
     "calculate_similarity",
 ]
@@ -1,11 +1,16 @@
-"""Cache management utilities for pipeline data persistence."""
+"""Cache management utilities for pipeline data persistence.
 
-import json
+Cache files are (de)serialized with pydantic-core's Rust JSON codec, which
+works on bytes directly and is several times faster than the stdlib.
+"""
+
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
 from src.utils.logging import get_logger
 
@@ -14,6 +19,12 @@ logger = get_logger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+class _CacheFile[T: BaseModel](BaseModel):
+    """Cache file layout written by CacheManager.save."""
+
+    data: list[T] | T = Field(description="Cached model or list of models")
+
+
 class CacheManager:
     """Manages cache storage and retrieval for pipeline data."""
 
@@ -51,17 +62,18 @@ class CacheManager:
         cache_path = self._get_cache_path(key)
 
         try:
-            if isinstance(data, list):
-                json_data = [item.model_dump(mode="json") for item in data]
-            else:
-                json_data = data.model_dump(mode="json")
-
+            # pydantic-core serializes the models straight to JSON bytes in one
+            # pass, without first dumping each one to a dict
+            cached_at = datetime.now()
             cache_content = {
-                "data": json_data,
-                "cached_at": datetime.now().isoformat(),
+                "data": data,
+                "cached_at": cached_at,
             }
 
-            cache_path.write_text(json.dumps(cache_content, indent=2))
+            cache_path.write_bytes(to_json(cache_content, indent=2))
+            # The file mtime mirrors cached_at, so age checks need only a stat
+            timestamp = cached_at.timestamp()
+            os.utime(cache_path, (timestamp, timestamp))
             logger.info("Cache saved", key=key, path=str(cache_path))
 
         except Exception as e:
@@ -86,17 +98,18 @@ class CacheManager:
             return None
 
         try:
-            cache_content = json.loads(cache_path.read_text())
-            data = cache_content["data"]
+            # Validate straight from the raw bytes in one pass: pydantic-core
+            # builds the models while parsing, with no intermediate dicts
+            file_model: type[_CacheFile[T]] = _CacheFile[model_class]  # type: ignore[valid-type]
+            data = file_model.model_validate_json(cache_path.read_bytes()).data
 
             if isinstance(data, list):
-                items = [model_class.model_validate(item) for item in data]
+                items = data
                 logger.info("Cache loaded", key=key, count=len(items))
                 return items
             else:
-                item = model_class.model_validate(data)
                 logger.info("Cache loaded", key=key)
-                return item
+                return data
 
         except Exception as e:
             logger.error(
@@ -124,25 +137,22 @@ class CacheManager:
         """
         Get age of cached data.
 
+        The age is read from the file's modification time, which save sets
+        to the cached_at timestamp.
+
         Args:
             key: Cache key
 
         Returns:
             Age as timedelta or None if not found
         """
-        cache_path = self._get_cache_path(key)
-
-        if not cache_path.exists():
-            return None
-
         try:
-            cache_content = json.loads(cache_path.read_text())
-            cached_at = datetime.fromisoformat(cache_content["cached_at"])
-            return datetime.now() - cached_at
-        except Exception as e:
-            logger.warning("Failed to get cache age", key=key, error=str(e))
+            mtime = self._get_cache_path(key).stat().st_mtime
+        except FileNotFoundError:
             return None
 
+        return datetime.now() - datetime.fromtimestamp(mtime)
+
     def is_fresh(self, key: str, max_age_days: int) -> bool:
         """
         Check if cache is fresh (within max age).
@@ -192,11 +202,20 @@ class CacheManager:
                            e.g., {"articles": 10, "news": 3}
         """
         cleaned = 0
-
-        for key, max_days in retention_days.items():
-            if self.exists(key) and not self.is_fresh(key, max_days):
-                self.delete(key)
-                cleaned += 1
+        now = datetime.now()
+
+        # One directory scan; each entry's stat is enough to judge its age
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                key, ext = os.path.splitext(entry.name)
+                if ext != ".json" or key not in retention_days:
+                    continue
+
+                age = now - datetime.fromtimestamp(entry.stat().st_mtime)
+                if age.days >= retention_days[key]:
+                    os.unlink(entry.path)
+                    logger.info("Cache deleted", key=key)
+                    cleaned += 1
 
         logger.info("Cache cleanup completed", cleaned_count=cleaned)
 
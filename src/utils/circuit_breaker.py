@@ -0,0 +1,190 @@
+"""Circuit breaker for calls to external services.
+
+After ``fail_max`` consecutive failures the breaker opens and further calls
+fail immediately with CircuitOpenError, instead of waiting on retries against
+a service that is down. Once ``reset_timeout`` seconds have passed, one probe
+call is let through (half-open) while concurrent callers are still rejected:
+success closes the breaker, failure opens it again.
+
+With a state file the failure count and opening time are saved after every
+change, so the breaker stays open across pipeline runs (separate processes).
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+from functools import wraps
+from pathlib import Path
+from typing import ParamSpec, TypeVar
+
+from loguru import logger
+from pydantic_core import from_json, to_json
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for async callables."""
+
+    def __init__(
+        self,
+        name: str,
+        fail_max: int = 5,
+        reset_timeout: float = 60.0,
+        is_failure: Callable[[Exception], bool] | None = None,
+    ) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            name: Name used in log messages and errors
+            fail_max: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before allowing a probe call
+            is_failure: Tells which exceptions count against the service
+                (default: every exception); the others leave the state as is
+        """
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._is_failure = is_failure
+        self._failures = 0
+        # Wall-clock time, so it stays meaningful when loaded by another process
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+        self._state_file: Path | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.time() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def use_state_file(self, state_file: Path | str | None) -> None:
+        """Persist the breaker state in a file, loading any state saved there.
+
+        Args:
+            state_file: JSON file shared by successive runs (None keeps the
+                state in memory only)
+        """
+        self._state_file = Path(state_file) if state_file is not None else None
+        if self._state_file is None:
+            return
+
+        try:
+            saved = from_json(self._state_file.read_bytes())
+            self._failures = int(saved["failures"])
+            opened_at = saved["opened_at"]
+            self._opened_at = float(opened_at) if opened_at is not None else None
+        except FileNotFoundError:
+            return
+        except (ValueError, KeyError, TypeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable circuit state {self._state_file}: {e}")
+            return
+
+        if self._opened_at is not None:
+            logger.info(
+                f"Circuit '{self.name}' restored as {self.state}",
+                consecutive_failures=self._failures,
+            )
+
+    def before_call(self) -> None:
+        """Check that a call may proceed.
+
+        In the half-open state only the first caller is let through as the
+        probe; the others are rejected until the probe succeeds or fails.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is already running
+        """
+        state = self.state
+        if state is CircuitState.OPEN:
+            raise CircuitOpenError(
+                f"Circuit '{self.name}' is open after {self._failures} consecutive failures"
+            )
+        if state is CircuitState.HALF_OPEN:
+            if self._probe_in_flight:
+                raise CircuitOpenError(f"Circuit '{self.name}' is half-open, probe in flight")
+            self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        if self._opened_at is not None:
+            logger.info(f"Circuit '{self.name}' closed after successful probe")
+        changed = self._failures != 0 or self._opened_at is not None
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+        if changed:
+            self._save_state()
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit when the limit is reached."""
+        self._failures += 1
+        self._probe_in_flight = False
+        if self.state is CircuitState.HALF_OPEN or self._failures >= self.fail_max:
+            if self.state is not CircuitState.OPEN:
+                logger.warning(
+                    f"Circuit '{self.name}' opened",
+                    consecutive_failures=self._failures,
+                    reset_timeout=self.reset_timeout,
+                )
+            self._opened_at = time.time()
+        self._save_state()
+
+    def reset(self) -> None:
+        """Force the circuit back to closed."""
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+        self._save_state()
+
+    def _save_state(self) -> None:
+        """Write the failure count and opening time to the state file, if any."""
+        if self._state_file is None:
+            return
+        try:
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+            self._state_file.write_bytes(
+                to_json({"failures": self._failures, "opened_at": self._opened_at})
+            )
+        except OSError as e:
+            logger.warning(f"Failed to save circuit state {self._state_file}: {e}")
+
+    def __call__(self, func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        """Wrap an async function so every call goes through the breaker."""
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            self.before_call()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                if self._is_failure is None or self._is_failure(e):
+                    self.record_failure()
+                else:
+                    # Not the service's fault: free the probe slot, keep the state
+                    self._probe_in_flight = False
+                raise
+            except BaseException:
+                # Cancelled mid-call: no outcome, let the next caller probe
+                self._probe_in_flight = False
+                raise
+            self.record_success()
+            return result
+
+        return wrapper
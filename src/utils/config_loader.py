@@ -1,7 +1,8 @@
 """Configuration loading utilities."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, TypeVar, cast
 
 import yaml
 from pydantic import BaseModel, ValidationError
@@ -13,6 +14,12 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# libyaml's C parser is several times faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -20,6 +27,10 @@ def load_yaml_config[T: BaseModel](file_path: Path | str, model_class: type[T])
     """
     Load and validate YAML configuration file.
 
+    Parsed results are memoized per file path, inode, modification time and
+    size, so repeated loads of an unchanged file skip parsing. Each call
+    returns a deep copy, so callers may mutate their config freely.
+
     Args:
         file_path: Path to YAML configuration file
         model_class: Pydantic model class to validate against
@@ -42,9 +53,32 @@ def load_yaml_config[T: BaseModel](file_path: Path | str, model_class: type[T])
         logger.error("Configuration file not found", path=str(path))
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
+    # Parsed configs are reused until the file changes on disk; the inode
+    # catches files replaced by rename within the mtime granularity
+    stat = path.stat()
+    config = _load_yaml_config_cached(
+        str(path.resolve()), stat.st_ino, stat.st_mtime_ns, stat.st_size, model_class
+    )
+    return cast(T, config.model_copy(deep=True))
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_config_cached[T: BaseModel](
+    path_str: str, inode: int, mtime_ns: int, size: int, model_class: type[T]
+) -> T:
+    """Parse and validate a YAML config, memoized on the file's identity.
+
+    ``inode``, ``mtime_ns`` and ``size`` are only part of the cache key: a
+    rewritten file gets a new key and is parsed again. An in-place rewrite
+    of the same size within the filesystem's mtime granularity is not
+    detected. The cached instance is shared, so it must not be returned to
+    callers directly.
+    """
+    path = Path(path_str)
+
     try:
         with path.open("r") as f:
-            raw_config = yaml.safe_load(f)
+            raw_config = yaml.load(f, Loader=_YamlLoader)  # noqa: S506
 
         config = model_class.model_validate(raw_config)
         logger.info("Configuration loaded", path=str(path), model=model_class.__name__)
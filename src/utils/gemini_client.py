@@ -0,0 +1,54 @@
+"""Shared Gemini client utility.
+
+Creating a google-genai client sets up its HTTP transport, so steps reuse one
+client per API key instead of building a new one for every call or retry.
+Also holds the retry predicate shared by all Gemini calls.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+import httpx
+from google import genai
+from google.genai import errors
+
+
+def get_gemini_client(api_key: str) -> Any:
+    """Get a shared Gemini client for an API key.
+
+    ``genai.Client`` is looked up on every call, so a patched or replaced
+    client class gets its own cache entry.
+
+    Args:
+        api_key: Gemini API key
+
+    Returns:
+        google.genai.Client instance shared by all callers using this key
+    """
+    return _create_client(genai.Client, api_key)
+
+
+@lru_cache(maxsize=8)
+def _create_client(client_class: Any, api_key: str) -> Any:
+    """Create a client once per (client class, API key) pair."""
+    return client_class(api_key=api_key)
+
+
+def is_transient_gemini_error(exc: BaseException) -> bool:
+    """Tell whether a failed Gemini call is worth retrying.
+
+    Timeouts, connection problems, throttling (408/429) and server-side (5xx)
+    errors are transient; anything else (bad request, auth, invalid response)
+    would fail again the same way.
+
+    Args:
+        exc: Exception raised by the Gemini call
+
+    Returns:
+        True if the call should be retried
+    """
+    if isinstance(exc, (TimeoutError, ConnectionError, httpx.TransportError)):
+        return True
+    if isinstance(exc, errors.ServerError):
+        return True
+    return isinstance(exc, errors.ClientError) and exc.code in (408, 429)
@@ -1,8 +1,14 @@
 """Hashing utilities for deduplication."""
 
 import hashlib
+import re
+from collections.abc import Iterable, Sequence
 from typing import Any
 
+# Protocol, www prefix, trailing slashes, and query/fragment around the kept
+# host and path: one scan strips every variation normalize_url removes
+_URL_NORMALIZE_PATTERN = re.compile(r"(?:https?://)?(?:www\.)?([^?#]*?)/*(?:[?#].*)?", re.DOTALL)
+
 
 def generate_content_hash(*fields: Any) -> str:
     """
@@ -20,12 +26,32 @@ def generate_content_hash(*fields: Any) -> str:
         >>> generate_content_hash("Title", "URL", "Content")
         'x7y8z9...'
     """
-    # Combine all fields into a single string
-    combined = "|".join(str(field).strip().lower() for field in fields if field)
+    return _hash_fields(fields)
+
+
+def generate_content_hashes(rows: Iterable[Sequence[Any]]) -> list[str]:
+    """
+    Generate content hashes for many rows of fields at once.
+
+    Args:
+        rows: Field tuples, each hashed like ``generate_content_hash(*row)``
+
+    Returns:
+        SHA256 hex hashes, in input order
+
+    Examples:
+        >>> generate_content_hashes([("Title", "URL")]) == [generate_content_hash("Title", "URL")]
+        True
+    """
+    return [_hash_fields(row) for row in rows]
+
 
-    # Generate SHA256 hash
-    hash_obj = hashlib.sha256(combined.encode("utf-8"))
-    return hash_obj.hexdigest()
+def _hash_fields(fields: Iterable[Any]) -> str:
+    """Hash normalized, non-empty fields joined with ``|``."""
+    # Join the UTF-8 encoded fields directly, without an intermediate str;
+    # the hash is a dedup key, not a security boundary
+    combined = b"|".join(str(field).strip().lower().encode() for field in fields if field)
+    return hashlib.sha256(combined, usedforsecurity=False).hexdigest()
 
 
 def normalize_url(url: str) -> str:
@@ -51,30 +77,26 @@ def normalize_url(url: str) -> str:
         >>> normalize_url("http://example.com/article?utm_source=feed#section")
         'example.com/article'
     """
-    normalized = url.lower().strip()
+    # The pattern matches any string, so fullmatch never returns None
+    return _URL_NORMALIZE_PATTERN.fullmatch(url.lower().strip()).group(1)  # type: ignore[union-attr]
 
-    # Remove protocol
-    for protocol in ["https://", "http://"]:
-        if normalized.startswith(protocol):
-            normalized = normalized[len(protocol) :]
-            break
 
-    # Remove www prefix
-    if normalized.startswith("www."):
-        normalized = normalized[4:]
-
-    # Remove fragment
-    if "#" in normalized:
-        normalized = normalized.split("#")[0]
+def normalize_urls(urls: list[str]) -> list[str]:
+    """
+    Normalize many URLs for comparison.
 
-    # Remove query parameters (for better deduplication)
-    if "?" in normalized:
-        normalized = normalized.split("?")[0]
+    Args:
+        urls: URLs to normalize
 
-    # Remove trailing slash
-    normalized = normalized.rstrip("/")
+    Returns:
+        Normalized URLs, in input order
 
-    return normalized
+    Examples:
+        >>> normalize_urls(["https://www.example.com/a/", "http://example.com/b?x=1"])
+        ['example.com/a', 'example.com/b']
+    """
+    match = _URL_NORMALIZE_PATTERN.fullmatch
+    return [match(url.lower().strip()).group(1) for url in urls]  # type: ignore[union-attr]
 
 
 def calculate_similarity(hash1: str, hash2: str) -> float:
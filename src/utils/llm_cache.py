@@ -0,0 +1,108 @@
+"""Persistent cache for LLM responses.
+
+Responses are stored as JSON files keyed by a hash of everything that shapes
+the response (model, prompt, generation settings), so rerunning the pipeline
+on unchanged input reads from disk instead of calling the API again. Entries
+are (de)serialized with pydantic-core's Rust JSON codec, which is several
+times faster than the stdlib for the large grounding payloads.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class LLMResponseCache:
+    """File-based LLM response cache with a time-to-live."""
+
+    def __init__(self, cache_dir: Path | str, ttl_seconds: int) -> None:
+        """
+        Initialize LLM response cache.
+
+        Args:
+            cache_dir: Directory for cached responses
+            ttl_seconds: Age after which a cached response is ignored
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """
+        Build a cache key from the request parameters.
+
+        Args:
+            **parts: JSON-serializable values identifying the request
+
+        Returns:
+            SHA-256 hex digest of the parameters
+        """
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_cache_path(self, key: str) -> Path:
+        """
+        Get cache file path for a key (sharded by key prefix).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Path to cache file
+        """
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing, expired or unreadable
+        """
+        cache_path = self._get_cache_path(key)
+
+        try:
+            cache_content = from_json(cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to read LLM cache entry", key=key, error=str(e))
+            return None
+
+        if time.time() - cache_content.get("cached_at", 0) > self.ttl_seconds:
+            logger.debug("LLM cache entry expired", key=key)
+            return None
+
+        return cache_content.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a response (written atomically).
+
+        Args:
+            key: Cache key
+            value: JSON-serializable response data
+        """
+        cache_path = self._get_cache_path(key)
+        tmp_path = cache_path.with_suffix(".tmp")
+
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            tmp_path.write_bytes(to_json({"cached_at": time.time(), "value": value}))
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to write LLM cache entry", key=key, error=str(e))
+            tmp_path.unlink(missing_ok=True)
@@ -9,6 +9,12 @@ from typing import Any
 import yaml
 from loguru import logger
 
+# libyaml's C parser is several times faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class PromptLoader:
     """Load and format prompts from YAML files."""
@@ -23,9 +29,14 @@ class PromptLoader:
         if not self.prompts_dir.exists():
             raise FileNotFoundError(f"Prompts directory not found: {self.prompts_dir}")
 
+        # Loaded prompts by step name, with the file mtime they were read at
+        self._cache: dict[str, tuple[int, dict[str, str]]] = {}
+
     def load_prompt(self, step_name: str) -> dict[str, str]:
         """Load prompt template for a specific step.
 
+        Prompts are cached per step and re-read only when the file changes.
+
         Args:
             step_name: Name of the step (e.g., "step3_clustering")
 
@@ -41,9 +52,14 @@ class PromptLoader:
         if not prompt_file.exists():
             raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
 
+        mtime_ns = prompt_file.stat().st_mtime_ns
+        cached = self._cache.get(step_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return dict(cached[1])
+
         try:
             with open(prompt_file, encoding="utf-8") as f:
-                prompt_data = yaml.safe_load(f)
+                prompt_data = yaml.load(f, Loader=_YamlLoader)  # noqa: S506
 
             if not isinstance(prompt_data, dict):
                 raise ValueError(f"Invalid prompt file format: {prompt_file}")
@@ -53,11 +69,14 @@ class PromptLoader:
                     f"Prompt file must contain 'system_prompt' and 'user_prompt': {prompt_file}"
                 )
 
-            logger.debug(f"Loaded prompt from {prompt_file}")
-            return {
+            prompts = {
                 "system_prompt": prompt_data["system_prompt"].strip(),
                 "user_prompt": prompt_data["user_prompt"].strip(),
             }
+            self._cache[step_name] = (mtime_ns, prompts)
+
+            logger.debug(f"Loaded prompt from {prompt_file}")
+            return dict(prompts)
 
         except yaml.YAMLError as e:
             raise ValueError(f"Failed to parse prompt YAML: {e}") from e
@@ -1,7 +1,7 @@
 """BDD step definitions for Step 0: Cache Management."""
 
 import asyncio
-import json
+import os
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -85,12 +85,10 @@ def empty_cache(cache_manager: CacheManager) -> None:
 def old_articles_in_cache(cache_manager: CacheManager, cache_dir: Path) -> None:
     """Create old articles in cache."""
     cache_manager.save("articles", [TestCacheModel(id=1, name="Old Article")])
-    # Modify timestamp to be old
+    # Backdate the file; cache age is read from its mtime
     cache_path = cache_dir / "articles.json"
-    content = json.loads(cache_path.read_text())
-    old_date = (datetime.now() - timedelta(days=15)).isoformat()
-    content["cached_at"] = old_date
-    cache_path.write_text(json.dumps(content))
+    old_time = (datetime.now() - timedelta(days=15)).timestamp()
+    os.utime(cache_path, (old_time, old_time))
 
 
 @given("the cache contains news older than 3 days")
@@ -98,10 +96,8 @@ def old_news_in_cache(cache_manager: CacheManager, cache_dir: Path) -> None:
     """Create old news in cache."""
     cache_manager.save("news", [TestCacheModel(id=2, name="Old News")])
     cache_path = cache_dir / "news.json"
-    content = json.loads(cache_path.read_text())
-    old_date = (datetime.now() - timedelta(days=5)).isoformat()
-    content["cached_at"] = old_date
-    cache_path.write_text(json.dumps(content))
+    old_time = (datetime.now() - timedelta(days=5)).timestamp()
+    os.utime(cache_path, (old_time, old_time))
 
 
 @given("the cache contains fresh articles")
@@ -122,10 +118,8 @@ def cache_with_old_entries(cache_manager: CacheManager, cache_dir: Path) -> None
     """Create old cache entries."""
     cache_manager.save("old_entry", [TestCacheModel(id=1, name="Old")])
     cache_path = cache_dir / "old_entry.json"
-    content = json.loads(cache_path.read_text())
-    old_date = (datetime.now() - timedelta(days=20)).isoformat()
-    content["cached_at"] = old_date
-    cache_path.write_text(json.dumps(content))
+    old_time = (datetime.now() - timedelta(days=20)).timestamp()
+    os.utime(cache_path, (old_time, old_time))
 
 
 @given("the cache directory does not exist")
@@ -1,7 +1,7 @@
 """BDD tests for Step 4: Multi-day News Deduplication."""
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -175,7 +175,7 @@ def create_cached_news_yesterday(
     cache_manager: CacheManager, cached_news_storage: dict, count: int, topic: str
 ) -> None:
     """Create cached news from yesterday."""
-    yesterday = datetime.now() - timedelta(days=1)
+    yesterday = datetime.now(UTC) - timedelta(days=1)
     yesterday_str = yesterday.strftime("%Y-%m-%d")
 
     news_list = []
@@ -205,7 +205,7 @@ def create_cached_news_yesterday_multi(
     cache_manager: CacheManager, cached_news_storage: dict, count: int, article_count: int
 ) -> None:
     """Create cached news from yesterday with multiple articles."""
-    yesterday = datetime.now() - timedelta(days=1)
+    yesterday = datetime.now(UTC) - timedelta(days=1)
     yesterday_str = yesterday.strftime("%Y-%m-%d")
 
     news_list = []
@@ -237,7 +237,7 @@ def create_cached_news_yesterday_count(
     cache_manager: CacheManager, cached_news_storage: dict, count: int
 ) -> None:
     """Create specific number of cached news from yesterday."""
-    yesterday = datetime.now() - timedelta(days=1)
+    yesterday = datetime.now(UTC) - timedelta(days=1)
     yesterday_str = yesterday.strftime("%Y-%m-%d")
 
     news_list = []
@@ -264,7 +264,7 @@ def create_cached_news_yesterday_count(
 @given(parsers.parse("we have cached news from {days:d} days ago"))
 def create_cached_news_days_ago(cache_manager: CacheManager, days: int) -> None:
     """Create cached news from N days ago."""
-    past_date = datetime.now() - timedelta(days=days)
+    past_date = datetime.now(UTC) - timedelta(days=days)
     past_date_str = past_date.strftime("%Y-%m-%d")
 
     news = NewsCluster(
@@ -448,8 +448,8 @@ def check_cache_saved(cache_manager: CacheManager) -> None:
     news_cache_dir = Path(cache_manager.cache_dir) / "news"
     assert news_cache_dir.exists()
 
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    cache_file = news_cache_dir / f"news_{today_str}.json"
+    today_str = datetime.now(UTC).strftime("%Y-%m-%d")
+    cache_file = news_cache_dir / f"news_{today_str}.json.gz"
     assert cache_file.exists()
 
 
@@ -65,3 +65,12 @@ def mock_cache_dir(tmp_path: Path) -> Path:
     cache_dir = tmp_path / "cache"
     cache_dir.mkdir()
     return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def reset_gemini_breaker() -> None:
+    """Close the Step 5 circuit breaker so failures don't leak between tests."""
+    from src.steps.step5_selection import _GEMINI_BREAKER
+
+    _GEMINI_BREAKER.use_state_file(None)
+    _GEMINI_BREAKER.reset()
@@ -1,6 +1,7 @@
 """Integration tests for configuration loading."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -262,3 +263,24 @@ class TestConfigIntegration:
         assert loaded.step0_cache.enabled is False
         assert loaded.step1_ingestion.enabled is False
         assert loaded.pipeline.execution_mode == "dry_run"
+
+    def test_reload_reuses_unchanged_config(self, sample_pipeline_yaml: Path) -> None:
+        """Test an unchanged file is parsed once and an edited file is re-read."""
+        with patch("src.utils.config_loader.yaml.load", wraps=yaml.load) as mock_load:
+            first = load_pipeline_config(sample_pipeline_yaml)
+            second = load_pipeline_config(sample_pipeline_yaml)
+
+        assert mock_load.call_count == 1
+        # Each caller gets its own copy, so mutations don't leak into the cache
+        assert second is not first
+        assert second == first
+        second.pipeline.execution_mode = "dry_run"
+        assert load_pipeline_config(sample_pipeline_yaml).pipeline.execution_mode != "dry_run"
+
+        raw = yaml.safe_load(sample_pipeline_yaml.read_text())
+        raw["pipeline"]["execution_mode"] = "dry_run"
+        sample_pipeline_yaml.write_text(yaml.dump(raw))
+
+        reloaded = load_pipeline_config(sample_pipeline_yaml)
+        assert reloaded is not first
+        assert reloaded.pipeline.execution_mode == "dry_run"
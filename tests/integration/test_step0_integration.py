@@ -1,6 +1,6 @@
 """Integration tests for Step 0 with full pipeline setup."""
 
-import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -20,6 +20,12 @@ class SampleArticle(BaseModel):
     url: str
 
 
+def _age_cache_file(path: Path, days: int) -> None:
+    """Backdate a cache file; CacheManager reads entry age from the file mtime."""
+    old_time = (datetime.now() - timedelta(days=days)).timestamp()
+    os.utime(path, (old_time, old_time))
+
+
 @pytest.fixture
 def pipeline_cache_dir(tmp_path: Path) -> Path:
     """Create pipeline-like cache directory structure."""
@@ -51,16 +57,10 @@ def populated_cache(pipeline_cache_dir: Path) -> CacheManager:
 
     # Make some entries old
     articles_path = pipeline_cache_dir / "articles.json"
-    content = json.loads(articles_path.read_text())
-    old_date = (datetime.now() - timedelta(days=15)).isoformat()
-    content["cached_at"] = old_date
-    articles_path.write_text(json.dumps(content))
+    _age_cache_file(articles_path, days=15)
 
     news_path = pipeline_cache_dir / "news.json"
-    content = json.loads(news_path.read_text())
-    old_date = (datetime.now() - timedelta(days=5)).isoformat()
-    content["cached_at"] = old_date
-    news_path.write_text(json.dumps(content))
+    _age_cache_file(news_path, days=5)
 
     return manager
 
@@ -168,21 +168,15 @@ class TestStep0Integration:
 
         # Make articles 11 days old (should be removed with 10 day retention)
         articles_path = pipeline_cache_dir / "articles.json"
-        content = json.loads(articles_path.read_text())
-        content["cached_at"] = (datetime.now() - timedelta(days=11)).isoformat()
-        articles_path.write_text(json.dumps(content))
+        _age_cache_file(articles_path, days=11)
 
         # Make news 4 days old (should be removed with 3 day retention)
         news_path = pipeline_cache_dir / "news.json"
-        content = json.loads(news_path.read_text())
-        content["cached_at"] = (datetime.now() - timedelta(days=4)).isoformat()
-        news_path.write_text(json.dumps(content))
+        _age_cache_file(news_path, days=4)
 
         # Make processed_articles 5 days old (should stay with 10 day retention)
         processed_path = pipeline_cache_dir / "processed_articles.json"
-        content = json.loads(processed_path.read_text())
-        content["cached_at"] = (datetime.now() - timedelta(days=5)).isoformat()
-        processed_path.write_text(json.dumps(content))
+        _age_cache_file(processed_path, days=5)
 
         # Run cleanup
         config = Step0Config(
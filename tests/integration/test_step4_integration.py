@@ -1,6 +1,6 @@
 """Integration tests for Step 4: Multi-day News Deduplication."""
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -69,8 +69,8 @@ async def test_step4_first_run_no_cache(temp_cache: CacheManager, step4_config:
     news_cache_dir = Path(temp_cache.cache_dir) / "news"
     assert news_cache_dir.exists()
 
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    cache_file = news_cache_dir / f"news_{today_str}.json"
+    today_str = datetime.now(UTC).strftime("%Y-%m-%d")
+    cache_file = news_cache_dir / f"news_{today_str}.json.gz"
     assert cache_file.exists()
 
 
@@ -82,7 +82,7 @@ async def test_step4_second_run_with_deduplication(temp_cache: CacheManager, ste
         create_sample_news("news-cached-001", "OpenAI Releases GPT-5", "openai-gpt5"),
     ]
 
-    yesterday = datetime.now() - timedelta(days=1)
+    yesterday = datetime.now(UTC) - timedelta(days=1)
     yesterday_str = yesterday.strftime("%Y-%m-%d")
 
     # Manually create cache directory and save
@@ -139,7 +139,7 @@ async def test_step4_multi_day_cache_loading(temp_cache: CacheManager, step4_con
 
     # Create news for last 2 days (within 3-day lookback)
     for days_ago in range(1, 3):
-        date = datetime.now() - timedelta(days=days_ago)
+        date = datetime.now(UTC) - timedelta(days=days_ago)
         date_str = date.strftime("%Y-%m-%d")
 
         news = [
@@ -184,13 +184,13 @@ async def test_step4_filters_old_cache(temp_cache: CacheManager, step4_config: S
     news_cache_dir.mkdir(parents=True, exist_ok=True)
 
     # Create old cache (5 days ago, outside 3-day window)
-    old_date = datetime.now() - timedelta(days=5)
+    old_date = datetime.now(UTC) - timedelta(days=5)
     old_date_str = old_date.strftime("%Y-%m-%d")
     old_news = [create_sample_news("news-old-001", "Old News Article", "old-news")]
     temp_cache.save(f"news/news_{old_date_str}", old_news)
 
     # Create recent cache (1 day ago, inside window)
-    recent_date = datetime.now() - timedelta(days=1)
+    recent_date = datetime.now(UTC) - timedelta(days=1)
     recent_date_str = recent_date.strftime("%Y-%m-%d")
     recent_news = [create_sample_news("news-recent-001", "Recent News Item", "recent-news")]
     temp_cache.save(f"news/news_{recent_date_str}", recent_news)
@@ -85,6 +85,34 @@ class TestProcessedArticle:
         assert article.slug == "test-article"
         assert article.content_hash == "abc123"
 
+    def test_processed_article_cached_string_forms(self) -> None:
+        """Test URL and date string forms are cached and not serialized."""
+        article = ProcessedArticle(
+            title="Test Article",
+            url="https://example.com/article",
+            published_date=datetime(2024, 1, 1),
+            feed_name="Test Feed",
+            feed_priority=8,
+            slug="test-article",
+            content_hash="abc123",
+        )
+        assert article.url_str == "https://example.com/article"
+        assert article.url_str is article.url_str
+        assert article.published_iso == "2024-01-01T00:00:00"
+        assert "url_str" not in article.model_dump()
+
+    def test_processed_article_unknown_published_iso(self) -> None:
+        """Test missing publication date renders as 'unknown'."""
+        article = ProcessedArticle(
+            title="Test Article",
+            url="https://example.com/article",
+            feed_name="Test Feed",
+            feed_priority=8,
+            slug="test-article",
+            content_hash="abc123",
+        )
+        assert article.published_iso == "unknown"
+
 
 class TestClusteredArticle:
     """Test ClusteredArticle model."""
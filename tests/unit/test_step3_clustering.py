@@ -1,20 +1,41 @@
 """Unit tests for Step 3: News Clustering."""
 
 from datetime import datetime
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
 
 from src.models.articles import ProcessedArticle
+from src.models.config import Step3Config
 from src.models.news import NewsCluster, Step3Result
 from src.steps.step3_clustering import (
+    AI_KEYWORDS,
+    GeminiClusteringResponse,
+    _call_gemini_clustering,
     _create_singleton_clusters,
     _format_articles_for_prompt,
     _generate_news_id,
+    _is_ai_related,
     _prepare_articles_for_prompt,
 )
 
 
+def _make_article(title: str, content: str | None = None) -> ProcessedArticle:
+    """Build a minimal processed article for filter tests."""
+    return ProcessedArticle(
+        title=title,
+        url="https://example.com/article",
+        published_date=datetime.now(),
+        content=content,
+        author=None,
+        feed_name="Feed",
+        feed_priority=5,
+        slug="article-slug",
+        content_hash="hash",
+    )
+
+
 class TestNewsIdGeneration:
     """Test news ID generation logic."""
 
@@ -66,6 +87,32 @@ class TestNewsIdGeneration:
         assert id1 == id2
 
 
+class TestAIRelatedFilter:
+    """Test AI keyword filtering."""
+
+    def test_matches_keyword_in_title(self) -> None:
+        """Test article with AI keyword in title is accepted."""
+        assert _is_ai_related(_make_article("OpenAI ships new model"))
+
+    def test_matches_keyword_in_content(self) -> None:
+        """Test article with AI keyword only in content is accepted."""
+        assert _is_ai_related(_make_article("Weekly roundup", "Notes on pytorch"))
+
+    def test_rejects_text_without_keywords(self) -> None:
+        """Test article mentioning no AI keyword is rejected."""
+        assert not _is_ai_related(_make_article("Xyzzy", "Qwq zzz"))
+
+    @pytest.mark.parametrize(
+        "title",
+        ["Local bakery wins prize", "Stock markets fall", "Cup final tonight", "Zoo news"],
+    )
+    def test_agrees_with_full_keyword_scan(self, title: str) -> None:
+        """Test the filter gives the same answer as scanning every keyword."""
+        expected = any(keyword in title.lower() for keyword in AI_KEYWORDS)
+
+        assert _is_ai_related(_make_article(title)) == expected
+
+
 class TestArticlePreparation:
     """Test article preparation for LLM prompt."""
 
@@ -374,3 +421,35 @@ class TestStep3Result:
         assert result.success is True
         assert result.fallback_used is True
         assert result.singleton_clusters == 10
+
+
+class TestGeminiResponseParsing:
+    """Test parsing of the clustering API response."""
+
+    async def test_reuses_sdk_parsed_response(self) -> None:
+        """Test the SDK's pre-parsed schema instance is returned as-is."""
+        parsed = GeminiClusteringResponse(
+            clusters=[], total_articles_processed=0, clustering_rationale="none"
+        )
+        mock_response = MagicMock()
+        mock_response.parsed = parsed
+
+        with patch("google.genai.Client") as mock_client_class:
+            mock_client_class.return_value.models.generate_content.return_value = mock_response
+            result = await _call_gemini_clustering([], Step3Config(), "test-key")
+
+        assert result is parsed
+
+    async def test_falls_back_to_response_text(self) -> None:
+        """Test JSON text is validated when the SDK did not pre-parse it."""
+        mock_response = MagicMock()
+        mock_response.parsed = None
+        mock_response.text = (
+            '{"clusters": [], "total_articles_processed": 3, "clustering_rationale": "ok"}'
+        )
+
+        with patch("google.genai.Client") as mock_client_class:
+            mock_client_class.return_value.models.generate_content.return_value = mock_response
+            result = await _call_gemini_clustering([], Step3Config(), "test-key")
+
+        assert result.total_articles_processed == 3
@@ -1,17 +1,30 @@
 """Unit tests for Step 4: Multi-day News Deduplication."""
 
-from datetime import datetime, timedelta
+import os
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.genai import errors
 
 from src.models.config import Step4Config
 from src.models.news import NewsCluster, NewsDeduplicationPair
 from src.steps.step4_multi_dedup import (
+    GeminiDeduplicationResponse,
+    _call_gemini_deduplication,
+    _decode_news_day,
+    _deduplicate_in_batches,
+    _find_exact_duplicates,
+    _format_news_entry,
     _load_cached_news,
     _merge_duplicate_news,
+    _prepare_news_for_prompt,
+    _read_news_day,
     _save_news_to_cache,
+    _select_candidates,
+    _term_vector,
+    _unique_pairs,
     run_step4,
 )
 from src.utils.cache import CacheManager
@@ -116,32 +129,46 @@ def test_save_news_to_cache(
     assert news_dir.is_dir()
 
     # Check that file was created with today's date
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    news_file = news_dir / f"news_{today_str}.json"
+    today_str = datetime.now(UTC).strftime("%Y-%m-%d")
+    news_file = news_dir / f"news_{today_str}.json.gz"
     assert news_file.exists()
 
     # Load and verify content
-    loaded_news = cache_manager.load(f"news/news_{today_str}", NewsCluster)
+    loaded_news = _read_news_day(news_file)
     assert len(loaded_news) == 2
     assert loaded_news[0].news_id == "news-today-0001234"
 
 
+def test_save_news_to_cache_leaves_no_temp_file(
+    cache_manager: CacheManager, sample_news_today: list[NewsCluster]
+) -> None:
+    """Test that the atomic write leaves only the final day file."""
+    _save_news_to_cache(cache_manager, sample_news_today)
+    _save_news_to_cache(cache_manager, sample_news_today[:1])
+
+    news_dir = Path(cache_manager.cache_dir) / "news"
+    today_str = datetime.now(UTC).strftime("%Y-%m-%d")
+    assert [p.name for p in news_dir.iterdir()] == [f"news_{today_str}.json.gz"]
+    assert len(_read_news_day(news_dir / f"news_{today_str}.json.gz")) == 1
+
+
 def test_save_news_to_cache_empty_list(cache_manager: CacheManager) -> None:
     """Test saving empty news list."""
     _save_news_to_cache(cache_manager, [])
 
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    loaded_news = cache_manager.load(f"news/news_{today_str}", NewsCluster)
-    assert loaded_news == []
+    today_str = datetime.now(UTC).strftime("%Y-%m-%d")
+    news_file = Path(cache_manager.cache_dir) / "news" / f"news_{today_str}.json.gz"
+    assert news_file.exists()
+    assert _read_news_day(news_file) == []
 
 
-def test_load_cached_news_no_directory(cache_manager: CacheManager) -> None:
+async def test_load_cached_news_no_directory(cache_manager: CacheManager) -> None:
     """Test loading cached news when directory doesn't exist."""
-    result = _load_cached_news(cache_manager, lookback_days=3)
+    result = await _load_cached_news(cache_manager, lookback_days=3)
     assert result == []
 
 
-def test_load_cached_news_with_files(
+async def test_load_cached_news_with_files(
     cache_manager: CacheManager, sample_cached_news: list[NewsCluster]
 ) -> None:
     """Test loading cached news from multiple dated files."""
@@ -150,14 +177,14 @@ def test_load_cached_news_with_files(
     news_dir.mkdir(parents=True)
 
     # Save news from yesterday and 2 days ago
-    yesterday = datetime.now() - timedelta(days=1)
-    two_days_ago = datetime.now() - timedelta(days=2)
+    yesterday = datetime.now(UTC) - timedelta(days=1)
+    two_days_ago = datetime.now(UTC) - timedelta(days=2)
 
     cache_manager.save(f"news/news_{yesterday.strftime('%Y-%m-%d')}", [sample_cached_news[0]])
     cache_manager.save(f"news/news_{two_days_ago.strftime('%Y-%m-%d')}", [sample_cached_news[1]])
 
     # Load cached news
-    result = _load_cached_news(cache_manager, lookback_days=3)
+    result = await _load_cached_news(cache_manager, lookback_days=3)
 
     assert len(result) == 2
     # Files are loaded in sorted order (oldest first due to filename sorting)
@@ -165,14 +192,14 @@ def test_load_cached_news_with_files(
     assert news_ids == {"news-cache-0001111", "news-cache-0002222"}
 
 
-def test_load_cached_news_filters_old_files(cache_manager: CacheManager) -> None:
+async def test_load_cached_news_filters_old_files(cache_manager: CacheManager) -> None:
     """Test that old files outside lookback window are filtered out."""
     news_dir = Path(cache_manager.cache_dir) / "news"
     news_dir.mkdir(parents=True)
 
     # Create files: 2 days ago (should load), 5 days ago (should skip)
-    two_days_ago = datetime.now() - timedelta(days=2)
-    five_days_ago = datetime.now() - timedelta(days=5)
+    two_days_ago = datetime.now(UTC) - timedelta(days=2)
+    five_days_ago = datetime.now(UTC) - timedelta(days=5)
 
     news_recent = NewsCluster(
         news_id="news-recent-0001",
@@ -200,13 +227,147 @@ def test_load_cached_news_filters_old_files(cache_manager: CacheManager) -> None
     cache_manager.save(f"news/news_{five_days_ago.strftime('%Y-%m-%d')}", [news_old])
 
     # Load with 3-day lookback
-    result = _load_cached_news(cache_manager, lookback_days=3)
+    result = await _load_cached_news(cache_manager, lookback_days=3)
 
     # Should only get recent news, not old news
     assert len(result) == 1
     assert result[0].news_id == "news-recent-0001"
 
 
+async def test_load_cached_news_skips_corrupted_file(
+    cache_manager: CacheManager, sample_cached_news: list[NewsCluster]
+) -> None:
+    """Test that a corrupted day file is skipped while other days still load."""
+    news_dir = Path(cache_manager.cache_dir) / "news"
+    news_dir.mkdir(parents=True)
+
+    yesterday = datetime.now(UTC) - timedelta(days=1)
+    two_days_ago = datetime.now(UTC) - timedelta(days=2)
+
+    cache_manager.save(f"news/news_{yesterday.strftime('%Y-%m-%d')}", [sample_cached_news[0]])
+    corrupt_file = news_dir / f"news_{two_days_ago.strftime('%Y-%m-%d')}.json"
+    corrupt_file.write_text("{not json")
+
+    result = await _load_cached_news(cache_manager, lookback_days=3)
+
+    assert [news.news_id for news in result] == ["news-cache-0001111"]
+    # Moved aside so it is not decoded again on the next run
+    assert not corrupt_file.exists()
+    assert corrupt_file.with_name(f"{corrupt_file.name}.corrupt").exists()
+
+
+async def test_load_cached_news_reuses_decoded_unchanged_files(
+    cache_manager: CacheManager, sample_cached_news: list[NewsCluster]
+) -> None:
+    """Test unchanged day files are decoded once and rewritten files are reloaded."""
+    news_dir = Path(cache_manager.cache_dir) / "news"
+    news_dir.mkdir(parents=True)
+    key = f"news/news_{(datetime.now(UTC) - timedelta(days=1)).strftime('%Y-%m-%d')}"
+    cache_manager.save(key, [sample_cached_news[0]])
+
+    with patch("src.steps.step4_multi_dedup._read_news_day", wraps=_read_news_day) as mock_read:
+        first = await _load_cached_news(cache_manager, lookback_days=3)
+        second = await _load_cached_news(cache_manager, lookback_days=3)
+        assert mock_read.call_count == 1
+
+        cache_manager.save(key, sample_cached_news)
+        news_file = Path(cache_manager.cache_dir) / f"{key}.json"
+        stat = news_file.stat()
+        os.utime(news_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        third = await _load_cached_news(cache_manager, lookback_days=3)
+        assert mock_read.call_count == 2
+
+    assert [n.news_id for n in first] == [n.news_id for n in second] == ["news-cache-0001111"]
+    assert len(third) == 2
+
+
+async def test_load_cached_news_only_reads_window_files(
+    cache_manager: CacheManager, sample_cached_news: list[NewsCluster]
+) -> None:
+    """Test that only files named after days in the window are read, oldest first."""
+    news_dir = Path(cache_manager.cache_dir) / "news"
+    news_dir.mkdir(parents=True)
+
+    for days_ago, news in ((1, sample_cached_news[0]), (2, sample_cached_news[1])):
+        day = (datetime.now(UTC) - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+        cache_manager.save(f"news/news_{day}", [news])
+    old_day = (datetime.now(UTC) - timedelta(days=10)).strftime("%Y-%m-%d")
+    cache_manager.save(f"news/news_{old_day}", [sample_cached_news[0]])
+    (news_dir / "notes.json").write_text("{}")
+
+    _decode_news_day.cache_clear()
+    with patch("src.steps.step4_multi_dedup._read_news_day", wraps=_read_news_day) as mock_read:
+        result = await _load_cached_news(cache_manager, lookback_days=3)
+
+    assert [news.news_id for news in result] == ["news-cache-0002222", "news-cache-0001111"]
+    assert mock_read.call_count == 2
+
+
+async def test_load_cached_news_reads_legacy_plain_json(
+    cache_manager: CacheManager, sample_cached_news: list[NewsCluster]
+) -> None:
+    """Test that uncompressed day files from before compression still load."""
+    yesterday = (datetime.now(UTC) - timedelta(days=1)).strftime("%Y-%m-%d")
+    _save_news_to_cache(cache_manager, [])
+    cache_manager.save(f"news/news_{yesterday}", sample_cached_news)
+
+    result = await _load_cached_news(cache_manager, lookback_days=3)
+
+    assert [n.news_id for n in result] == ["news-cache-0001111", "news-cache-0002222"]
+
+
+async def test_load_cached_news_keeps_latest_version_across_days(
+    cache_manager: CacheManager, sample_cached_news: list[NewsCluster]
+) -> None:
+    """Test that a news saved on several days is returned once, latest version."""
+    yesterday = (datetime.now(UTC) - timedelta(days=1)).strftime("%Y-%m-%d")
+    _save_news_to_cache(cache_manager, [])
+    cache_manager.save(f"news/news_{yesterday}", sample_cached_news)
+    updated = sample_cached_news[0].model_copy(
+        update={"article_slugs": ["openai-unveils-gpt5", "gpt5-more"], "article_count": 2}
+    )
+    _save_news_to_cache(cache_manager, [updated])
+
+    result = await _load_cached_news(cache_manager, lookback_days=3)
+
+    assert [n.news_id for n in result] == ["news-cache-0001111", "news-cache-0002222"]
+    assert result[0].article_slugs == ["openai-unveils-gpt5", "gpt5-more"]
+
+
+def test_prepare_news_for_prompt_format(sample_news_today: list[NewsCluster]) -> None:
+    """Test that news entries are numbered and separated by blank lines."""
+    first, second = sample_news_today
+
+    prompt_text = _prepare_news_for_prompt(sample_news_today)
+
+    assert prompt_text == (
+        f"1. [ID: {first.news_id}] {first.title}\n"
+        f"   Summary: {first.summary}...\n"
+        f"   Topic: model release | Articles: 1 | Created: {first.created_at:%Y-%m-%d %H:%M}"
+        "\n\n"
+        f"2. [ID: {second.news_id}] {second.title}\n"
+        f"   Summary: {second.summary}...\n"
+        f"   Topic: policy | Articles: 1 | Created: {second.created_at:%Y-%m-%d %H:%M}"
+    )
+    assert _prepare_news_for_prompt([]) == ""
+
+
+def test_prepare_news_for_prompt_reuses_entry_text(
+    sample_cached_news: list[NewsCluster],
+) -> None:
+    """Test that entries for unchanged news are formatted only once."""
+    _format_news_entry.cache_clear()
+
+    first = _prepare_news_for_prompt(sample_cached_news)
+    second = _prepare_news_for_prompt(list(reversed(sample_cached_news)))
+
+    info = _format_news_entry.cache_info()
+    assert info.misses == 2
+    assert info.hits == 2
+    assert first.startswith("1. [ID: news-cache-0001111]")
+    assert second.startswith("1. [ID: news-cache-0002222]")
+
+
 def test_merge_duplicate_news_basic(
     sample_news_today: list[NewsCluster], sample_cached_news: list[NewsCluster]
 ) -> None:
@@ -279,6 +440,42 @@ def test_merge_duplicate_news_keeps_larger_cluster(sample_cached_news: list[News
     assert "openai-unveils-gpt5" in merged[0].article_slugs
 
 
+def test_merge_duplicate_news_preserves_order(sample_cached_news: list[NewsCluster]) -> None:
+    """Test that merged slugs and keywords keep first-seen order without duplicates."""
+    today_news = NewsCluster(
+        news_id="news-today-order",
+        title="GPT-5 Release Coverage",
+        summary=(
+            "Extended coverage of the GPT-5 release with benchmarks, pricing details, "
+            "and availability for developers worldwide."
+        ),
+        article_slugs=["gpt5-a", "openai-unveils-gpt5", "gpt5-b"],
+        article_count=3,
+        main_topic="model release",
+        keywords=[f"kw-{i}" for i in range(8)] + ["OpenAI"],
+        created_at=datetime.utcnow(),
+    )
+
+    duplicate_pairs = [
+        NewsDeduplicationPair(
+            news_today_id="news-today-order",
+            news_cached_id="news-cache-0001111",
+            similarity_score=0.9,
+            should_merge=True,
+            merge_reason="Same GPT-5 release",
+        )
+    ]
+
+    result = _merge_duplicate_news([today_news], sample_cached_news, duplicate_pairs)
+    merged = next(n for n in result if n.news_id == "news-today-order")
+
+    assert merged.article_slugs == ["gpt5-a", "openai-unveils-gpt5", "gpt5-b"]
+    expected_keywords = list(dict.fromkeys(today_news.keywords + sample_cached_news[0].keywords))[
+        :10
+    ]
+    assert merged.keywords == expected_keywords
+
+
 def test_merge_duplicate_news_no_duplicates(
     sample_news_today: list[NewsCluster], sample_cached_news: list[NewsCluster]
 ) -> None:
@@ -359,8 +556,8 @@ async def test_run_step4_no_cached_news(
     assert result.api_calls == 0
 
     # Verify news was saved to cache
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    loaded = cache_manager.load(f"news/news_{today_str}", NewsCluster)
+    today_str = datetime.now(UTC).strftime("%Y-%m-%d")
+    loaded = _read_news_day(Path(cache_manager.cache_dir) / "news" / f"news_{today_str}.json.gz")
     assert len(loaded) == 2
 
 
@@ -531,18 +728,293 @@ async def test_run_step4_saves_deduplicated_news(
         )
 
     # Verify news was saved
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    loaded = cache_manager.load(f"news/news_{today_str}", NewsCluster)
+    today_str = datetime.now(UTC).strftime("%Y-%m-%d")
+    loaded = _read_news_day(Path(cache_manager.cache_dir) / "news" / f"news_{today_str}.json.gz")
     assert len(loaded) > 0
 
 
+@pytest.mark.asyncio
+async def test_deduplicate_in_batches_splits_today_news(
+    step4_config: Step4Config,
+    sample_news_today: list[NewsCluster],
+    sample_cached_news: list[NewsCluster],
+) -> None:
+    """Test that today's news is split into batches and pairs are combined."""
+    step4_config.batch_size = 1
+    step4_config.prefilter_threshold = 0.0
+
+    async def fake_call(
+        batch: list[NewsCluster], cached: list[NewsCluster], config: Step4Config, api_key: str
+    ) -> GeminiDeduplicationResponse:
+        assert len(batch) == 1
+        return GeminiDeduplicationResponse(
+            duplicate_pairs=[
+                NewsDeduplicationPair(
+                    news_today_id=batch[0].news_id,
+                    news_cached_id=cached[0].news_id,
+                    similarity_score=0.9,
+                    should_merge=True,
+                    merge_reason="test",
+                )
+            ],
+            rationale="test",
+        )
+
+    with patch(
+        "src.steps.step4_multi_dedup._call_gemini_deduplication",
+        new=AsyncMock(side_effect=fake_call),
+    ) as mock_call:
+        pairs, calls = await _deduplicate_in_batches(
+            sample_news_today, sample_cached_news, step4_config, "test-key"
+        )
+
+    assert calls == len(sample_news_today)
+    assert mock_call.await_count == len(sample_news_today)
+    assert [p.news_today_id for p in pairs] == [n.news_id for n in sample_news_today]
+
+
+def test_select_candidates_keeps_only_similar_cached_news(
+    sample_news_today: list[NewsCluster], sample_cached_news: list[NewsCluster]
+) -> None:
+    """Test that the lexical prefilter drops unrelated cached news."""
+    cached_vectors = [_term_vector(news) for news in sample_cached_news]
+
+    gpt_candidates = _select_candidates(
+        [sample_news_today[0]], sample_cached_news, cached_vectors, threshold=0.2
+    )
+    eu_candidates = _select_candidates(
+        [sample_news_today[1]], sample_cached_news, cached_vectors, threshold=0.2
+    )
+    all_candidates = _select_candidates(
+        [sample_news_today[1]], sample_cached_news, cached_vectors, threshold=0.0
+    )
+
+    assert [n.news_id for n in gpt_candidates] == ["news-cache-0001111"]
+    assert eu_candidates == []
+    assert all_candidates == sample_cached_news
+
+
+@pytest.mark.asyncio
+async def test_deduplicate_in_batches_skips_batches_without_candidates(
+    step4_config: Step4Config,
+    sample_news_today: list[NewsCluster],
+    sample_cached_news: list[NewsCluster],
+) -> None:
+    """Test that only batches with prefilter candidates reach Gemini."""
+    step4_config.batch_size = 1
+    response = GeminiDeduplicationResponse(duplicate_pairs=[], rationale="none")
+
+    with patch(
+        "src.steps.step4_multi_dedup._call_gemini_deduplication",
+        new=AsyncMock(return_value=response),
+    ) as mock_call:
+        pairs, calls = await _deduplicate_in_batches(
+            sample_news_today, sample_cached_news, step4_config, "test-key"
+        )
+
+    assert pairs == []
+    assert calls == 1
+    batch, candidates = mock_call.await_args.args[:2]
+    assert [n.news_id for n in batch] == ["news-today-0001234"]
+    assert [n.news_id for n in candidates] == ["news-cache-0001111"]
+
+
+@pytest.mark.asyncio
+async def test_run_step4_does_not_retry_permanent_errors(
+    step4_config: Step4Config,
+    cache_manager: CacheManager,
+    sample_news_today: list[NewsCluster],
+    sample_cached_news: list[NewsCluster],
+) -> None:
+    """Test that a non-transient API error fails fast without retries."""
+    _save_news_to_cache(cache_manager, sample_cached_news)
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.models.generate_content.side_effect = errors.ClientError(
+            400, {"error": {"message": "bad request"}}
+        )
+
+        result = await run_step4(
+            step4_config, sample_news_today, cache_manager, api_key="test-api-key"
+        )
+
+    assert result.fallback_used is True
+    assert result.api_failures == 1
+    assert mock_client.models.generate_content.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_call_gemini_deduplication_uses_sdk_parsed_response(
+    step4_config: Step4Config,
+    sample_news_today: list[NewsCluster],
+    sample_cached_news: list[NewsCluster],
+) -> None:
+    """Test that the SDK-parsed response is returned without re-decoding text."""
+    parsed = GeminiDeduplicationResponse(duplicate_pairs=[], rationale="pre-parsed")
+    mock_response = MagicMock()
+    mock_response.parsed = parsed
+    type(mock_response).text = property(lambda _: pytest.fail("text should not be read"))
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client_class.return_value.models.generate_content.return_value = mock_response
+
+        result = await _call_gemini_deduplication(
+            sample_news_today, sample_cached_news, step4_config, "test-parsed-key"
+        )
+
+    assert result is parsed
+
+
+def test_find_exact_duplicates_matches_title_and_topic(
+    sample_news_today: list[NewsCluster], sample_cached_news: list[NewsCluster]
+) -> None:
+    """Test that identical title/topic pairs are found without the LLM."""
+    repeated = sample_cached_news[1].model_copy(
+        update={"news_id": "news-today-repeat", "title": "  google GEMINI 2.0 update "}
+    )
+
+    pairs = _find_exact_duplicates([*sample_news_today, repeated], sample_cached_news)
+
+    assert [(p.news_today_id, p.news_cached_id) for p in pairs] == [
+        ("news-today-repeat", "news-cache-0002222")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_step4_skips_when_today_news_already_cached(
+    step4_config: Step4Config,
+    cache_manager: CacheManager,
+    sample_cached_news: list[NewsCluster],
+) -> None:
+    """Test that a re-run with already cached news makes no API call."""
+    _save_news_to_cache(cache_manager, sample_cached_news)
+
+    with patch("google.genai.Client") as mock_client_class:
+        result = await run_step4(
+            step4_config, sample_cached_news[:1], cache_manager, api_key="test-api-key"
+        )
+
+    assert result.success is True
+    assert result.api_calls == 0
+    assert [n.news_id for n in result.unique_news] == [n.news_id for n in sample_cached_news]
+    assert result.news_after_dedup == len(sample_cached_news)
+    mock_client_class.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_step4_merges_exact_duplicates_without_api(
+    step4_config: Step4Config,
+    cache_manager: CacheManager,
+    sample_cached_news: list[NewsCluster],
+) -> None:
+    """Test that exact duplicates are merged even when nothing is left for Gemini."""
+    _save_news_to_cache(cache_manager, sample_cached_news)
+    repeated = sample_cached_news[0].model_copy(
+        update={"news_id": "news-today-repeat", "article_slugs": ["gpt5-follow-up"]}
+    )
+
+    with patch("google.genai.Client") as mock_client_class:
+        result = await run_step4(step4_config, [repeated], cache_manager, api_key="test-api-key")
+
+    assert result.success is True
+    assert result.duplicates_found == 1
+    assert result.api_calls == 0
+    mock_client_class.return_value.models.generate_content.assert_not_called()
+    merged = next(n for n in result.unique_news if "gpt5-follow-up" in n.article_slugs)
+    assert set(merged.article_slugs) == {"gpt5-follow-up", "openai-unveils-gpt5"}
+
+
+@pytest.mark.asyncio
+async def test_run_step4_excludes_exact_duplicates_from_gemini_candidates(
+    step4_config: Step4Config,
+    cache_manager: CacheManager,
+    sample_news_today: list[NewsCluster],
+    sample_cached_news: list[NewsCluster],
+) -> None:
+    """Test that exactly matched today and cached news are not sent to Gemini."""
+    _save_news_to_cache(cache_manager, sample_cached_news)
+    repeated = sample_cached_news[1].model_copy(update={"news_id": "news-today-repeat"})
+
+    with patch(
+        "src.steps.step4_multi_dedup._deduplicate_in_batches",
+        new=AsyncMock(return_value=([], 0)),
+    ) as mock_batches:
+        result = await run_step4(
+            step4_config, [*sample_news_today, repeated], cache_manager, api_key="test-api-key"
+        )
+
+    assert result.duplicates_found == 1
+    today_batch, cached_candidates = mock_batches.await_args.args[:2]
+    assert "news-today-repeat" not in {n.news_id for n in today_batch}
+    assert "news-cache-0002222" not in {n.news_id for n in cached_candidates}
+
+
+def test_unique_pairs_keeps_first_pair_per_id() -> None:
+    """Test that overlapping pairs keep only the first claim on each id."""
+    pairs = [
+        NewsDeduplicationPair(news_today_id="t1", news_cached_id="c1", merge_reason="a"),
+        NewsDeduplicationPair(news_today_id="t2", news_cached_id="c1", merge_reason="b"),
+        NewsDeduplicationPair(news_today_id="t1", news_cached_id="c2", merge_reason="c"),
+        NewsDeduplicationPair(news_today_id="t3", news_cached_id="c3", merge_reason="d"),
+    ]
+
+    assert [p.merge_reason for p in _unique_pairs(pairs)] == ["a", "d"]
+
+
+@pytest.mark.asyncio
+async def test_run_step4_merges_each_cached_news_once_across_batches(
+    step4_config: Step4Config,
+    cache_manager: CacheManager,
+    sample_news_today: list[NewsCluster],
+    sample_cached_news: list[NewsCluster],
+) -> None:
+    """Test that two batches matching the same cached news produce a single merge."""
+    _save_news_to_cache(cache_manager, sample_cached_news)
+    step4_config.batch_size = 1
+    step4_config.prefilter_threshold = 0.0
+    target_id = sample_cached_news[0].news_id
+
+    async def fake_call(
+        batch: list[NewsCluster], cached: list[NewsCluster], config: Step4Config, api_key: str
+    ) -> GeminiDeduplicationResponse:
+        return GeminiDeduplicationResponse(
+            duplicate_pairs=[
+                NewsDeduplicationPair(
+                    news_today_id=batch[0].news_id,
+                    news_cached_id=target_id,
+                    merge_reason="same story",
+                )
+            ],
+            rationale="test",
+        )
+
+    with patch(
+        "src.steps.step4_multi_dedup._call_gemini_deduplication",
+        new=AsyncMock(side_effect=fake_call),
+    ) as mock_call:
+        result = await run_step4(
+            step4_config, sample_news_today, cache_manager, api_key="test-api-key"
+        )
+
+    assert mock_call.await_count == 2
+    assert result.duplicates_found == 1
+    ids = [n.news_id for n in result.unique_news]
+    assert len(ids) == len(set(ids))
+    assert sample_news_today[0].news_id in ids
+    assert sample_news_today[1].news_id in ids
+    assert target_id not in ids
+
+
 @pytest.mark.asyncio
 async def test_run_step4_critical_error_handling(
     step4_config: Step4Config, cache_manager: CacheManager, sample_news_today: list[NewsCluster]
 ) -> None:
     """Test Step 4 handles unexpected critical errors."""
-    # Mock cache_manager.save to raise an exception
-    with patch.object(cache_manager, "save", side_effect=Exception("Disk full")):
+    # Mock the cache write to raise an exception
+    with patch(
+        "src.steps.step4_multi_dedup._save_news_to_cache", side_effect=Exception("Disk full")
+    ):
         result = await run_step4(step4_config, sample_news_today, cache_manager, api_key="test-key")
 
     assert result.success is False
@@ -1,20 +1,31 @@
 """Unit tests for Step 5: Top News Selection and Categorization."""
 
-from datetime import datetime
-from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.genai import errors
+from tenacity import wait_none
 
 from src.models.config import Step5Config
 from src.models.news import CategorizedNews, NewsCategory, NewsCluster
 from src.steps.step5_selection import (
+    _CATEGORIES_DESC_BLOCK,
+    _GEMINI_BREAKER,
     CategorizedNewsItem,
+    GeminiCategorizationResponse,
     _calculate_category_distribution,
+    _call_gemini_categorization,
+    _categorize_locally,
     _get_category_description,
     _parse_categorized_news,
+    _partition_llm_candidates,
     _prepare_news_for_prompt,
+    _select_top_news,
     run_step5,
 )
+from src.utils.circuit_breaker import CircuitState
 
 
 @pytest.fixture
@@ -89,6 +100,14 @@ def test_get_category_description() -> None:
     assert len(desc_other) > 0
 
 
+def test_categories_description_block_lists_every_category() -> None:
+    """Test the prebuilt prompt block covers all categories in enum order."""
+    lines = _CATEGORIES_DESC_BLOCK.split("\n")
+    assert lines == [
+        f"- {category.value}: {_get_category_description(category)}" for category in NewsCategory
+    ]
+
+
 def test_prepare_news_for_prompt(sample_news_clusters: list[NewsCluster]) -> None:
     """Test news formatting for prompt."""
     prompt_text = _prepare_news_for_prompt(sample_news_clusters)
@@ -337,6 +356,38 @@ def test_calculate_category_distribution() -> None:
     assert distribution[NewsCategory.POLICY_REGULATION] == 1
 
 
+@pytest.mark.parametrize("target_count", [0, 1, 3, 10])
+def test_select_top_news_matches_full_sort(target_count: int) -> None:
+    """Test single-pass selection against filter + stable sort + slice."""
+    scores = [7.0, 9.5, 4.0, 7.0, 8.0, 6.0, 9.5, 5.9, 7.0]
+    categorized = [
+        CategorizedNews(
+            news_cluster=NewsCluster(
+                news_id=f"news-{i}",
+                title=f"News Article Number {i}",
+                summary=f"Summary for news {i} with enough characters to pass validation.",
+                article_slugs=[f"slug-{i}"],
+                article_count=1,
+                main_topic="test",
+                keywords=["test"],
+            ),
+            category=NewsCategory.OTHER,
+            importance_score=score,
+        )
+        for i, score in enumerate(scores)
+    ]
+
+    top_news, above_threshold = _select_top_news(categorized, 6.0, target_count)
+
+    expected = sorted(
+        (n for n in categorized if n.importance_score >= 6.0),
+        key=lambda n: n.importance_score,
+        reverse=True,
+    )[:target_count]
+    assert [n.news_cluster.news_id for n in top_news] == [n.news_cluster.news_id for n in expected]
+    assert above_threshold == 7
+
+
 @pytest.mark.asyncio
 async def test_run_step5_disabled(
     step5_config: Step5Config, sample_news_clusters: list[NewsCluster]
@@ -519,3 +570,326 @@ async def test_run_step5_critical_error(
 
     assert result.success is False
     assert len(result.errors) > 0
+
+
+@pytest.mark.asyncio
+async def test_run_step5_circuit_open_uses_defaults(
+    step5_config: Step5Config, sample_news_clusters: list[NewsCluster]
+) -> None:
+    """Test that an open circuit skips Gemini and keeps news with default scores."""
+    for _ in range(_GEMINI_BREAKER.fail_max):
+        _GEMINI_BREAKER.record_failure()
+
+    with patch("google.genai.Client") as mock_client_class:
+        result = await run_step5(step5_config, sample_news_clusters, api_key="test-key")
+
+    mock_client_class.assert_not_called()
+    assert result.success is True
+    assert result.api_calls == 0
+    assert len(result.all_categorized_news) == len(sample_news_clusters)
+    assert all(n.importance_score == 5.0 for n in result.all_categorized_news)
+    assert "circuit" in result.errors[0].lower()
+
+
+@pytest.mark.asyncio
+async def test_run_step5_invalid_response_not_retried(
+    step5_config: Step5Config, sample_news_clusters: list[NewsCluster]
+) -> None:
+    """Test that a malformed Gemini response fails without retrying."""
+    mock_response = MagicMock()
+    mock_response.text = "not json"
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.models.generate_content.return_value = mock_response
+
+        result = await run_step5(step5_config, sample_news_clusters, api_key="test-key")
+
+    assert result.success is False
+    assert mock_client.models.generate_content.call_count == 1
+    # A bad response says nothing about Gemini being down
+    assert _GEMINI_BREAKER.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_run_step5_open_circuit_persists_to_next_run(
+    step5_config: Step5Config, sample_news_clusters: list[NewsCluster], tmp_path: Path
+) -> None:
+    """Test that exhausted retries open the circuit for the next run as well."""
+    step5_config.circuit_state_file = str(tmp_path / "step5_circuit.json")
+
+    with (
+        patch("google.genai.Client") as mock_client_class,
+        patch.object(_call_gemini_categorization.retry, "wait", wait_none()),
+    ):
+        mock_client = mock_client_class.return_value
+        mock_client.models.generate_content.side_effect = errors.ServerError(
+            503, {"error": {"message": "unavailable"}}
+        )
+        first = await run_step5(step5_config, sample_news_clusters, api_key="test-outage-key")
+
+    assert first.success is False
+    assert mock_client.models.generate_content.call_count == _GEMINI_BREAKER.fail_max
+
+    # Next run (new process): the state comes from the file, Gemini is skipped
+    _GEMINI_BREAKER.use_state_file(None)
+    _GEMINI_BREAKER.reset()
+    mock_client.models.generate_content.reset_mock()
+
+    second = await run_step5(step5_config, sample_news_clusters, api_key="test-outage-key")
+
+    assert second.success is True
+    assert "circuit" in second.errors[0].lower()
+    mock_client.models.generate_content.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_call_gemini_categorization_passes_timeout(
+    step5_config: Step5Config, sample_news_clusters: list[NewsCluster]
+) -> None:
+    """Test that the configured deadline is sent with the Gemini request."""
+    step5_config.timeout_seconds = 12
+    mock_response = MagicMock()
+    mock_response.text = '{"categorized_news": [], "rationale": "none"}'
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.models.generate_content.return_value = mock_response
+
+        await _call_gemini_categorization(sample_news_clusters, step5_config, "test-key")
+
+    request_config = mock_client.models.generate_content.call_args.kwargs["config"]
+    assert request_config["http_options"] == {"timeout": 12000}
+
+
+@pytest.mark.asyncio
+async def test_call_gemini_categorization_runs_in_thread(
+    step5_config: Step5Config, sample_news_clusters: list[NewsCluster]
+) -> None:
+    """Test that the blocking SDK call runs off the event loop thread."""
+    import threading
+
+    loop_thread = threading.get_ident()
+    call_threads: list[int] = []
+    mock_response = MagicMock()
+    mock_response.text = '{"categorized_news": [], "rationale": "none"}'
+
+    def generate_content(**kwargs: object) -> MagicMock:
+        call_threads.append(threading.get_ident())
+        return mock_response
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client_class.return_value.models.generate_content.side_effect = generate_content
+
+        await _call_gemini_categorization(sample_news_clusters, step5_config, "test-key")
+
+    assert call_threads and call_threads[0] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_call_gemini_categorization_bounded_concurrency(
+    step5_config: Step5Config, sample_news_clusters: list[NewsCluster]
+) -> None:
+    """Test that concurrent calls never exceed max_concurrent_calls."""
+    import asyncio
+    import threading
+    import time
+
+    step5_config.max_concurrent_calls = 2
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    mock_response = MagicMock()
+    mock_response.text = '{"categorized_news": [], "rationale": "none"}'
+
+    def generate_content(**kwargs: object) -> MagicMock:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return mock_response
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client_class.return_value.models.generate_content.side_effect = generate_content
+
+        await asyncio.gather(
+            *(
+                _call_gemini_categorization(sample_news_clusters, step5_config, "test-key")
+                for _ in range(5)
+            )
+        )
+
+    assert peak == 2
+
+
+def test_partition_llm_candidates() -> None:
+    """Test that the biggest, freshest clusters go to Gemini in input order."""
+    now = datetime.utcnow()
+    news_clusters = [
+        NewsCluster(
+            news_id=f"news-{i}",
+            title=f"News Article Number {i}",
+            summary=f"Summary for news {i} with enough characters to pass validation.",
+            article_slugs=[f"slug-{i}-{j}" for j in range(count)],
+            article_count=count,
+            main_topic="test",
+            keywords=["test"],
+            created_at=now - timedelta(days=age_days),
+        )
+        for i, (count, age_days) in enumerate([(1, 0), (4, 0), (4, 3), (3, 0)])
+    ]
+
+    candidates, auto_categorized = _partition_llm_candidates(news_clusters, 2)
+
+    assert [n.news_id for n in candidates] == ["news-1", "news-3"]
+    assert [n.news_cluster.news_id for n in auto_categorized] == ["news-0", "news-2"]
+    assert all(n.category == NewsCategory.OTHER for n in auto_categorized)
+    assert all(n.importance_score == 4.0 for n in auto_categorized)
+
+
+def test_partition_llm_candidates_under_limit(sample_news_clusters: list[NewsCluster]) -> None:
+    """Test that nothing is auto-categorized when under the limit."""
+    candidates, auto_categorized = _partition_llm_candidates(sample_news_clusters, 100)
+
+    assert candidates is sample_news_clusters
+    assert auto_categorized == []
+
+
+def _keyword_cluster(news_id: str, title: str, keywords: list[str]) -> NewsCluster:
+    """Build a two-article cluster for local categorization tests."""
+    return NewsCluster(
+        news_id=news_id,
+        title=title,
+        summary="Summary with enough characters to pass the validation requirements.",
+        article_slugs=[f"{news_id}-a", f"{news_id}-b"],
+        article_count=2,
+        main_topic="ai",
+        keywords=keywords,
+    )
+
+
+def test_categorize_locally() -> None:
+    """Test keyword-based category guess and its confidence."""
+    clear = _keyword_cluster(
+        "news-funding", "Startup raises new funding round", ["funding", "investors", "valuation"]
+    )
+    vague = _keyword_cluster("news-vague", "Something happened in AI today", ["ai", "news"])
+    mixed = _keyword_cluster(
+        "news-mixed", "Company partners on new model", ["partnership", "model"]
+    )
+
+    assert _categorize_locally(clear) == (NewsCategory.FUNDING_ACQUISITION, 1.0)
+    assert _categorize_locally(vague) == (NewsCategory.OTHER, 0.0)
+    assert _categorize_locally(mixed)[1] < 0.9
+
+
+@pytest.mark.asyncio
+async def test_run_step5_bypasses_llm_for_confident_clusters(step5_config: Step5Config) -> None:
+    """Test that confidently categorized clusters skip the Gemini call."""
+    step5_config.llm_bypass_threshold = 0.9
+    news_clusters = [
+        _keyword_cluster(
+            "news-funding", "Startup raises new funding round", ["funding", "investors"]
+        ),
+        _keyword_cluster("news-safety", "New alignment and safety work", ["safety", "bias"]),
+    ]
+
+    with patch("google.genai.Client") as mock_client_class:
+        result = await run_step5(step5_config, news_clusters, api_key="test-key")
+
+    mock_client_class.assert_not_called()
+    assert result.success is True
+    assert result.api_calls == 0
+    assert [n.category for n in result.all_categorized_news] == [
+        NewsCategory.FUNDING_ACQUISITION,
+        NewsCategory.ETHICS_SAFETY,
+    ]
+    assert all(n.importance_score == 6.0 for n in result.all_categorized_news)
+
+
+@pytest.mark.asyncio
+async def test_call_gemini_categorization_uses_sdk_parsed_response(
+    step5_config: Step5Config, sample_news_clusters: list[NewsCluster]
+) -> None:
+    """Test that the SDK-parsed response is returned without re-decoding text."""
+    parsed = GeminiCategorizationResponse(categorized_news=[], rationale="pre-parsed")
+    mock_response = MagicMock()
+    mock_response.parsed = parsed
+    mock_response.text = "not json"
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client_class.return_value.models.generate_content.return_value = mock_response
+
+        result = await _call_gemini_categorization(sample_news_clusters, step5_config, "test-key")
+
+    assert result is parsed
+
+
+@pytest.mark.asyncio
+async def test_call_gemini_categorization_reuses_client(
+    step5_config: Step5Config, sample_news_clusters: list[NewsCluster]
+) -> None:
+    """Test that repeated calls with the same key share one Gemini client."""
+    mock_response = MagicMock()
+    mock_response.text = '{"categorized_news": [], "rationale": "none"}'
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client_class.return_value.models.generate_content.return_value = mock_response
+
+        await _call_gemini_categorization(sample_news_clusters, step5_config, "reuse-key")
+        await _call_gemini_categorization(sample_news_clusters, step5_config, "reuse-key")
+
+    mock_client_class.assert_called_once_with(api_key="reuse-key")
+
+
+@pytest.mark.asyncio
+async def test_run_step5_api_error_with_braces_in_message(
+    step5_config: Step5Config, sample_news_clusters: list[NewsCluster]
+) -> None:
+    """Test that an API error whose message contains braces is reported as an API failure."""
+    with patch(
+        "src.steps.step5_selection._call_gemini_categorization",
+        side_effect=ValueError("{'error': {'code': 400}}"),
+    ):
+        result = await run_step5(step5_config, sample_news_clusters, api_key="test-key")
+
+    assert result.success is False
+    assert result.api_failures == 1
+    assert "Gemini API call failed" in result.errors[0]
+
+
+@pytest.mark.asyncio
+async def test_run_step5_categorizes_equivalent_clusters_once(step5_config: Step5Config) -> None:
+    """Test that equivalent clusters are sent once and share the result."""
+    news_clusters = [
+        _keyword_cluster("news-a", "OpenAI releases GPT-5!", ["gpt-5", "OpenAI"]),
+        _keyword_cluster("news-b", "Other story about chips", ["chips"]),
+        _keyword_cluster("news-c", "openai releases GPT 5", ["openai", "gpt-5"]),
+    ]
+    response = GeminiCategorizationResponse(
+        categorized_news=[
+            CategorizedNewsItem(
+                news_id="news-a", category="model_release", importance_score=9.0, reasoning="big"
+            ),
+            CategorizedNewsItem(
+                news_id="news-b", category="industry_news", importance_score=6.5, reasoning="ok"
+            ),
+        ],
+        rationale="done",
+    )
+
+    with patch(
+        "src.steps.step5_selection._call_gemini_categorization",
+        new=AsyncMock(return_value=response),
+    ) as mock_call:
+        result = await run_step5(step5_config, news_clusters, api_key="test-key")
+
+    sent = mock_call.await_args.args[0]
+    assert [n.news_id for n in sent] == ["news-a", "news-b"]
+    by_id = {n.news_cluster.news_id: n for n in result.all_categorized_news}
+    assert set(by_id) == {"news-a", "news-b", "news-c"}
+    assert by_id["news-c"].category == NewsCategory.MODEL_RELEASE
+    assert by_id["news-c"].importance_score == 9.0
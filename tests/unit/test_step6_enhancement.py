@@ -1,6 +1,7 @@
 """Unit tests for Step 6: Content Enhancement with Web Grounding."""
 
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,7 +13,13 @@ from src.models.news import (
     NewsCluster,
 )
 from src.steps.step6_enhancement import (
+    _enhance_single_news,
+    _extract_external_links,
+    _extract_key_points,
     _parse_single_news_response,
+    _resolve_redirect_locally,
+    _resolve_redirect_url,
+    _split_sections,
     run_step6,
 )
 
@@ -228,6 +235,9 @@ CITATIONS:
     assert len(result.enhanced_news[0].extended_summary) >= 200
     assert len(result.enhanced_news[0].key_points) > 0
     assert result.enhanced_news[0].grounded is True
+    # All news from one run share a timezone-aware timestamp
+    assert result.enhanced_news[0].enhanced_at.tzinfo is not None
+    assert len({news.enhanced_at for news in result.enhanced_news}) == 1
 
 
 @pytest.mark.asyncio
@@ -349,3 +359,349 @@ KEY POINTS:
     assert result.api_calls == len(sample_categorized_news)  # One call per news
     if result.enhanced_news:
         assert result.avg_links_per_news == result.total_external_links / len(result.enhanced_news)
+
+
+@pytest.mark.asyncio
+async def test_run_step6_enhances_concurrently_in_order(
+    step6_config: Step6Config, sample_categorized_news: list[CategorizedNews]
+) -> None:
+    """Test that news are enhanced concurrently, bounded, and returned in input order."""
+    import asyncio
+
+    step6_config.max_concurrent_calls = 1
+    in_flight = 0
+    peak = 0
+
+    async def fake_enhance(cat_news: CategorizedNews, *args: object) -> MagicMock:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # The first news finishes last
+        await asyncio.sleep(0.02 if cat_news is sample_categorized_news[0] else 0)
+        in_flight -= 1
+        enhanced = MagicMock(external_links=[], citations=[])
+        enhanced.news = cat_news
+        return enhanced
+
+    with (
+        patch("src.steps.step6_enhancement._enhance_single_news", side_effect=fake_enhance),
+        patch("src.steps.step6_enhancement.Step6Result") as mock_result,
+    ):
+        await run_step6(step6_config, sample_categorized_news, api_key="test-key")
+
+    enhanced = mock_result.call_args.kwargs["enhanced_news"]
+    assert [e.news for e in enhanced] == sample_categorized_news
+    assert peak == 1
+
+
+_BATCH_RESPONSE_TEXT = """
+=== NEWS START ===
+ABSTRACT:
+OpenAI has released GPT-5 with significant improvements in AI capabilities.
+
+EXTENDED SUMMARY:
+OpenAI has released GPT-5 with significant improvements. The model shows better reasoning
+and reduced hallucinations. This is a major milestone in AI development that will impact
+various industries. Experts predict widespread adoption soon across many sectors.
+
+KEY POINTS:
+- Major advancement
+- Better reasoning
+=== NEWS END ===
+"""
+
+
+@pytest.mark.asyncio
+async def test_run_step6_batch_mode(
+    step6_config: Step6Config, sample_categorized_news: list[CategorizedNews]
+) -> None:
+    """Test that batch mode submits one job, polls it and parses inlined responses."""
+    step6_config.use_batch_mode = True
+    response = MagicMock(text=_BATCH_RESPONSE_TEXT, candidates=[])
+    running_job = MagicMock(state="JOB_STATE_RUNNING")
+    running_job.name = "batches/123"
+    done_job = MagicMock(state="JOB_STATE_SUCCEEDED", error=None)
+    done_job.name = "batches/123"
+    done_job.dest.inlined_responses = [
+        MagicMock(response=response, error=None),
+        MagicMock(response=None, error="quota"),
+    ]
+
+    with (
+        patch("google.genai.Client") as mock_client_class,
+        patch("src.steps.step6_enhancement.asyncio.sleep") as mock_sleep,
+    ):
+        mock_client = mock_client_class.return_value
+        mock_client.batches.create.return_value = running_job
+        mock_client.batches.get.return_value = done_job
+
+        result = await run_step6(step6_config, sample_categorized_news, api_key="test-key")
+
+    mock_client.models.generate_content.assert_not_called()
+    requests = mock_client.batches.create.call_args.kwargs["src"]
+    assert [r.metadata["news_id"] for r in requests] == ["news-001", "news-002"]
+    mock_sleep.assert_awaited_once()
+    assert [e.news.news_cluster.news_id for e in result.enhanced_news] == ["news-001"]
+    assert result.enhancement_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_run_step6_batch_failure_falls_back(
+    step6_config: Step6Config, sample_categorized_news: list[CategorizedNews]
+) -> None:
+    """Test that a failed batch job falls back to one call per news."""
+    step6_config.use_batch_mode = True
+    failed_job = MagicMock(state="JOB_STATE_FAILED", error="internal")
+    failed_job.name = "batches/456"
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.batches.create.return_value = failed_job
+        mock_client.models.generate_content.return_value = MagicMock(
+            text=_BATCH_RESPONSE_TEXT, candidates=[]
+        )
+
+        result = await run_step6(step6_config, sample_categorized_news, api_key="test-key")
+
+    assert mock_client.models.generate_content.call_count == len(sample_categorized_news)
+    assert len(result.enhanced_news) == len(sample_categorized_news)
+
+
+@pytest.mark.asyncio
+async def test_enhance_single_news_uses_response_cache(
+    step6_config: Step6Config,
+    sample_categorized_news: list[CategorizedNews],
+    tmp_path: Path,
+) -> None:
+    """Test that a successful response is cached and reused without calling Gemini."""
+    from google.genai import types
+
+    step6_config.response_cache_dir = str(tmp_path)
+    response = types.GenerateContentResponse(
+        candidates=[
+            types.Candidate(
+                content=types.Content(role="model", parts=[types.Part(text=_BATCH_RESPONSE_TEXT)])
+            )
+        ]
+    )
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.models.generate_content.return_value = response
+        first = await _enhance_single_news(sample_categorized_news[0], step6_config, "test-key")
+
+        mock_client.models.generate_content.side_effect = Exception("should not be called")
+        second = await _enhance_single_news(sample_categorized_news[0], step6_config, "test-key")
+
+    assert mock_client.models.generate_content.call_count == 1
+    assert second.extended_summary == first.extended_summary
+    assert second.key_points == first.key_points
+
+
+@pytest.mark.asyncio
+async def test_run_step6_creates_one_client(
+    step6_config: Step6Config, sample_categorized_news: list[CategorizedNews]
+) -> None:
+    """Test that all news share one Gemini client."""
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client_class.return_value.models.generate_content.return_value = MagicMock(
+            text=_BATCH_RESPONSE_TEXT, candidates=[]
+        )
+
+        result = await run_step6(step6_config, sample_categorized_news, api_key="one-client-key")
+
+    assert len(result.enhanced_news) == len(sample_categorized_news)
+    mock_client_class.assert_called_once_with(api_key="one-client-key")
+
+
+@pytest.mark.asyncio
+async def test_run_step6_calls_overlap(
+    step6_config: Step6Config, sample_categorized_news: list[CategorizedNews]
+) -> None:
+    """Test that blocking Gemini calls for different news run in parallel in the step pool."""
+    import threading
+
+    barrier = threading.Barrier(len(sample_categorized_news), timeout=5)
+    thread_names: list[str] = []
+
+    def generate_content(**kwargs: object) -> MagicMock:
+        thread_names.append(threading.current_thread().name)
+        # Only returns once every news has a call in flight at the same time
+        barrier.wait()
+        return MagicMock(text=_BATCH_RESPONSE_TEXT, candidates=[])
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client_class.return_value.models.generate_content.side_effect = generate_content
+
+        result = await run_step6(step6_config, sample_categorized_news, api_key="test-key")
+
+    assert len(result.enhanced_news) == len(sample_categorized_news)
+    # Calls run in the step's dedicated pool, not the default executor
+    assert all(name.startswith("gemini-step6") for name in thread_names)
+
+
+@pytest.mark.asyncio
+async def test_extract_external_links_resolves_with_one_session() -> None:
+    """Test that redirect URLs are resolved together over a single session."""
+    chunks = []
+    for i in range(3):
+        chunk = MagicMock()
+        chunk.web.uri = f"https://vertexaisearch.cloud.google.com/grounding-api-redirect/tok{i}"
+        chunk.web.title = f"Source {i}"
+        chunks.append(chunk)
+    chunks[1].web.title = ""  # Chunks without a title are skipped
+
+    sessions = []
+
+    async def fake_resolve(session: object, uri: str) -> str:
+        sessions.append(session)
+        return f"https://source.example.com/{uri[-1]}"
+
+    with (
+        patch.dict("src.steps.step6_enhancement._REDIRECT_CACHE", clear=True),
+        patch("src.steps.step6_enhancement._resolve_redirect_url", side_effect=fake_resolve),
+    ):
+        links = await _extract_external_links({"grounding_chunks": chunks})
+
+    assert sorted(links) == [0, 2]
+    assert str(links[2].url) == "https://source.example.com/2"
+    assert links[2].source == "source.example.com"
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1]
+
+
+@pytest.mark.asyncio
+async def test_resolve_redirect_url_caches_resolved_urls() -> None:
+    """Test that a resolved redirect is reused instead of requested again."""
+    from unittest.mock import AsyncMock
+
+    redirect = "https://vertexaisearch.cloud.google.com/grounding-api-redirect/abc"
+    head_response = MagicMock(url=redirect, headers={"Location": "https://example.com/article"})
+    session = MagicMock()
+    session.head.return_value.__aenter__ = AsyncMock(return_value=head_response)
+    session.head.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    with patch.dict("src.steps.step6_enhancement._REDIRECT_CACHE", clear=True):
+        first = await _resolve_redirect_url(session, redirect)
+        second = await _resolve_redirect_url(session, redirect)
+
+    assert first == second == "https://example.com/article"
+    session.head.assert_called_once()
+    assert session.head.call_args.kwargs["allow_redirects"] is False
+
+
+def test_split_sections_stops_at_next_header() -> None:
+    """Test that each section ends where the next fixed header begins."""
+    news_block = (
+        "NEWS_ID: news-001\n"
+        "ABSTRACT:\nShort abstract.\n\n"
+        "extended summary: Longer summary\ntext.\n\n"
+        "KEY POINTS:\n- First point\n  continued\n- Second point\n\nTrailing note\n"
+    )
+
+    sections = _split_sections(news_block)
+
+    assert sections["ABSTRACT"] == "Short abstract."
+    assert sections["EXTENDED SUMMARY"] == "Longer summary\ntext."
+    assert _extract_key_points(sections["KEY POINTS"]) == [
+        "First point\ncontinued",
+        "Second point",
+    ]
+    assert _split_sections("no headers here") == {}
+
+
+def test_resolve_redirect_locally() -> None:
+    """Test that destinations are found without a request when possible."""
+    import base64
+
+    redirect_base = "https://vertexaisearch.cloud.google.com/grounding-api-redirect/"
+    token = base64.urlsafe_b64encode(b"\x08\x01https://example.com/post\x12").decode()
+
+    with patch.dict("src.steps.step6_enhancement._REDIRECT_CACHE", clear=True) as cache:
+        assert _resolve_redirect_locally("https://example.com/a") == "https://example.com/a"
+        assert (
+            _resolve_redirect_locally(f"{redirect_base}x?url=https://example.com/q")
+            == "https://example.com/q"
+        )
+        # Opaque tokens are never decoded; they need a HEAD request
+        assert _resolve_redirect_locally(redirect_base + token.rstrip("=")) is None
+        assert _resolve_redirect_locally(f"{redirect_base}AUZIYQ") is None
+        assert cache == {}
+
+
+@pytest.mark.asyncio
+async def test_run_step6_streams_enhanced_news(
+    step6_config: Step6Config, sample_categorized_news: list[CategorizedNews]
+) -> None:
+    """Test that on_enhanced sees each news as it completes, before the step returns."""
+    import asyncio
+
+    async def fake_enhance(cat_news: CategorizedNews, *args: object) -> MagicMock:
+        # The first news finishes last
+        await asyncio.sleep(0.02 if cat_news is sample_categorized_news[0] else 0)
+        enhanced = MagicMock(external_links=[], citations=[])
+        enhanced.news = cat_news
+        return enhanced
+
+    streamed: list[CategorizedNews] = []
+
+    async def on_enhanced(enhanced: MagicMock) -> None:
+        streamed.append(enhanced.news)
+        raise RuntimeError("callback errors must not fail the news")
+
+    with (
+        patch("src.steps.step6_enhancement._enhance_single_news", side_effect=fake_enhance),
+        patch("src.steps.step6_enhancement.Step6Result") as mock_result,
+    ):
+        await run_step6(
+            step6_config, sample_categorized_news, api_key="test-key", on_enhanced=on_enhanced
+        )
+
+    assert streamed == sample_categorized_news[::-1]
+    enhanced = mock_result.call_args.kwargs["enhanced_news"]
+    assert [e.news for e in enhanced] == sample_categorized_news
+
+
+@pytest.mark.asyncio
+async def test_run_step6_unparseable_response_not_retried(
+    step6_config: Step6Config, sample_categorized_news: list[CategorizedNews]
+) -> None:
+    """Test that a response without a NEWS block fails without retrying."""
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.models.generate_content.return_value = MagicMock(
+            text="no news block", candidates=[]
+        )
+
+        result = await run_step6(step6_config, sample_categorized_news[:1], api_key="test-key")
+
+    assert result.enhancement_failures == 1
+    assert mock_client.models.generate_content.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_run_step6_structured_output(
+    step6_config: Step6Config, sample_categorized_news: list[CategorizedNews]
+) -> None:
+    """Test that structured output requests JSON and parses it without the template."""
+    import json
+
+    step6_config.structured_output = True
+    payload = {
+        "abstract": "OpenAI has released GPT-5 with significant improvements in AI capabilities.",
+        "extended_summary": "OpenAI has released GPT-5 with significant improvements. " * 5,
+        "key_points": ["Major advancement", " ", "Better reasoning"],
+    }
+
+    with patch("google.genai.Client") as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.models.generate_content.return_value = MagicMock(
+            text=json.dumps(payload), candidates=[]
+        )
+
+        result = await run_step6(step6_config, sample_categorized_news[:1], api_key="test-key")
+
+    generation_config = mock_client.models.generate_content.call_args.kwargs["config"]
+    assert generation_config.response_mime_type == "application/json"
+    assert result.enhanced_news[0].abstract == payload["abstract"]
+    assert result.enhanced_news[0].key_points == ["Major advancement", "Better reasoning"]
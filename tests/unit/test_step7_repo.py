@@ -1,6 +1,6 @@
 """Unit tests for Step 7: Repository Update."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -16,6 +16,7 @@ from src.models.news import (
     NewsCluster,
 )
 from src.steps.step7_repo import (
+    _clean_old_news,
     _create_daily_news_file,
     _create_readme_template,
     _generate_news_section,
@@ -105,6 +106,17 @@ def test_create_readme_template() -> None:
     assert "Gemini" in template
 
 
+def test_clean_old_news_drops_sections_past_cutoff() -> None:
+    """Test that dated sections older than 30 days are removed with their content."""
+    recent = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+    old = (datetime.now() - timedelta(days=45)).strftime("%Y-%m-%d")
+    content = f"# Title\n## {recent}\nrecent news\n## {old}\nold news\n## 2025-13-40\nkept\n"
+
+    cleaned = _clean_old_news(content)
+
+    assert cleaned == f"# Title\n## {recent}\nrecent news\n## 2025-13-40\nkept\n"
+
+
 def test_generate_news_section(sample_enhanced_news: list[EnhancedNews]) -> None:
     """Test news section generation."""
     date = "2025-12-25"
@@ -213,6 +225,24 @@ Footer content
     assert "<!-- NEWS_END -->" in content
 
 
+def test_update_readme_keeps_original_on_write_failure(
+    sample_enhanced_news: list[EnhancedNews], temp_test_dir: Path, monkeypatch
+) -> None:
+    """Test a failed README write leaves the old file intact and no temp file."""
+    monkeypatch.chdir(temp_test_dir)
+    readme_path = temp_test_dir / "README.md"
+    readme_path.write_text("# Original\n", encoding="utf-8")
+
+    with (
+        patch("src.steps.step7_repo.os.fsync", side_effect=OSError("disk full")),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        _update_readme(readme_path, sample_enhanced_news)
+
+    assert readme_path.read_text(encoding="utf-8") == "# Original\n"
+    assert not (temp_test_dir / "README.md.tmp").exists()
+
+
 def test_update_archive(
     sample_enhanced_news: list[EnhancedNews], temp_test_dir: Path, monkeypatch
 ) -> None:
@@ -320,22 +350,19 @@ async def test_run_step7_with_git_operations(
 
     # Mock subprocess calls
     with patch("subprocess.run") as mock_run:
-        # Mock git add
-        mock_run.return_value = MagicMock(stdout="", stderr="")
-
-        # When we get commit hash
-        def side_effect(*args, **kwargs):
-            if args[0][1] == "rev-parse":
-                return MagicMock(stdout="abc123def456\n")
-            return MagicMock(stdout="", stderr="")
-
-        mock_run.side_effect = side_effect
+        # git add, commit and rev-parse run in one shell; the hash is printed last
+        mock_run.return_value = MagicMock(
+            stdout="[main abc123d] Daily update\n 3 files changed\nabc123def456\n", stderr=""
+        )
 
         result = await run_step7(step7_config, sample_enhanced_news, dry_run=False)
 
         assert result.commit_created is True
         assert result.commit_info is not None
         assert result.commit_info.commit_hash == "abc123de"  # Short hash
+        commit_call = mock_run.call_args_list[0]
+        assert commit_call.args[0][:2] == ["sh", "-c"]
+        assert commit_call.kwargs["env"]["COMMIT_MESSAGE"] == result.commit_info.message
 
 
 @pytest.mark.asyncio
@@ -356,6 +383,27 @@ async def test_run_step7_archive_disabled(
     assert result.files_changed == 2  # Only README and news file
 
 
+@pytest.mark.asyncio
+async def test_run_step7_readme_failure_keeps_other_writes(
+    step7_config: Step7Config,
+    sample_enhanced_news: list[EnhancedNews],
+    temp_test_dir: Path,
+    monkeypatch,
+) -> None:
+    """Test a failed README write does not stop the concurrent file writes."""
+    monkeypatch.chdir(temp_test_dir)
+
+    with patch("src.steps.step7_repo._update_readme", side_effect=OSError("disk full")):
+        result = await run_step7(step7_config, sample_enhanced_news, dry_run=True)
+
+    assert result.readme_updated is False
+    assert result.news_file_created is not None
+    assert result.news_file_created.exists()
+    assert result.archive_updated is True
+    assert result.files_changed == 2
+    assert result.errors == ["Failed to update README: disk full"]
+
+
 @pytest.mark.asyncio
 async def test_run_step7_handles_file_errors(
     step7_config: Step7Config,
@@ -1,6 +1,6 @@
 """Unit tests for cache utilities."""
 
-import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -105,12 +105,10 @@ class TestCacheManager:
         # Fresh cache (< 1 day old)
         assert cache_manager.is_fresh("test", max_age_days=1)
 
-        # Simulate old cache by modifying cached_at timestamp
+        # Simulate old cache by moving the file's mtime back
         cache_path = temp_cache_dir / "test.json"
-        cache_content = json.loads(cache_path.read_text())
-        old_date = (datetime.now() - timedelta(days=5)).isoformat()
-        cache_content["cached_at"] = old_date
-        cache_path.write_text(json.dumps(cache_content))
+        old_time = (datetime.now() - timedelta(days=5)).timestamp()
+        os.utime(cache_path, (old_time, old_time))
 
         # Now it should not be fresh
         assert not cache_manager.is_fresh("test", max_age_days=1)
@@ -144,10 +142,8 @@ class TestCacheManager:
 
         # Make "old" cache actually old
         cache_path = temp_cache_dir / "old.json"
-        cache_content = json.loads(cache_path.read_text())
-        old_date = (datetime.now() - timedelta(days=5)).isoformat()
-        cache_content["cached_at"] = old_date
-        cache_path.write_text(json.dumps(cache_content))
+        old_time = (datetime.now() - timedelta(days=5)).timestamp()
+        os.utime(cache_path, (old_time, old_time))
 
         # Cleanup with retention policy
         retention = {"fresh": 10, "old": 3}
@@ -158,6 +154,20 @@ class TestCacheManager:
         # Old should be deleted
         assert not cache_manager.exists("old")
 
+    def test_cleanup_skips_keys_without_retention(
+        self, cache_manager: CacheManager, temp_cache_dir: Path
+    ) -> None:
+        """Test cleanup leaves cache files outside the retention policy alone."""
+        cache_manager.save("other", TestModel(id=1, name="Other"))
+
+        cache_path = temp_cache_dir / "other.json"
+        old_time = (datetime.now() - timedelta(days=30)).timestamp()
+        os.utime(cache_path, (old_time, old_time))
+
+        cache_manager.cleanup({"articles": 1})
+
+        assert cache_manager.exists("other")
+
     def test_list_all(self, cache_manager: CacheManager) -> None:
         """Test listing all cache keys."""
         assert cache_manager.list_all() == []
@@ -0,0 +1,200 @@
+"""Unit tests for the circuit breaker utility."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+def _make_failing(breaker: CircuitBreaker) -> object:
+    """Wrap an async function that always fails."""
+
+    @breaker
+    async def call() -> None:
+        raise ConnectionError("service down")
+
+    return call
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker class."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_fail_max(self) -> None:
+        """Test that the circuit opens after consecutive failures."""
+        breaker = CircuitBreaker("test", fail_max=2, reset_timeout=60)
+        call = _make_failing(breaker)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await call()
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            await call()
+
+    @pytest.mark.asyncio
+    async def test_success_resets_failure_count(self) -> None:
+        """Test that a success between failures keeps the circuit closed."""
+        breaker = CircuitBreaker("test", fail_max=2, reset_timeout=60)
+        outcomes = iter([ConnectionError("down"), None, ConnectionError("down")])
+
+        @breaker
+        async def call() -> None:
+            outcome = next(outcomes)
+            if outcome:
+                raise outcome
+
+        with pytest.raises(ConnectionError):
+            await call()
+        await call()
+        with pytest.raises(ConnectionError):
+            await call()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe(self) -> None:
+        """Test that a probe is allowed after the timeout and closes on success."""
+        breaker = CircuitBreaker("test", fail_max=1, reset_timeout=60)
+        calls = 0
+
+        @breaker
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ConnectionError("down")
+            return "ok"
+
+        with patch("src.utils.circuit_breaker.time.time", return_value=100.0):
+            with pytest.raises(ConnectionError):
+                await call()
+            with pytest.raises(CircuitOpenError):
+                await call()
+
+        with patch("src.utils.circuit_breaker.time.time", return_value=161.0):
+            assert breaker.state is CircuitState.HALF_OPEN
+            assert await call() == "ok"
+
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_half_open_failure_reopens(self) -> None:
+        """Test that a failed probe opens the circuit again."""
+        breaker = CircuitBreaker("test", fail_max=3, reset_timeout=60)
+        call = _make_failing(breaker)
+
+        with patch("src.utils.circuit_breaker.time.time", return_value=100.0):
+            for _ in range(3):
+                with pytest.raises(ConnectionError):
+                    await call()
+
+        with patch("src.utils.circuit_breaker.time.time", return_value=161.0):
+            with pytest.raises(ConnectionError):
+                await call()
+            assert breaker.state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_half_open_allows_single_probe(self) -> None:
+        """Test that concurrent callers are rejected while the probe is running."""
+        breaker = CircuitBreaker("test", fail_max=1, reset_timeout=60)
+        release = asyncio.Event()
+        calls = 0
+
+        @breaker
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "ok"
+
+        with patch("src.utils.circuit_breaker.time.time", return_value=100.0):
+            breaker.record_failure()
+
+        with patch("src.utils.circuit_breaker.time.time", return_value=161.0):
+            probe = asyncio.create_task(call())
+            await asyncio.sleep(0)
+            results = await asyncio.gather(call(), call(), return_exceptions=True)
+            assert all(isinstance(r, CircuitOpenError) for r in results)
+
+            release.set()
+            assert await probe == "ok"
+
+        assert calls == 1
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_allows_next_probe_after_timeout(self) -> None:
+        """Test that a failed probe reopens the circuit and frees the probe slot."""
+        breaker = CircuitBreaker("test", fail_max=1, reset_timeout=60)
+        call = _make_failing(breaker)
+
+        with patch("src.utils.circuit_breaker.time.time", return_value=100.0):
+            breaker.record_failure()
+
+        with patch("src.utils.circuit_breaker.time.time", return_value=161.0):
+            with pytest.raises(ConnectionError):
+                await call()
+            with pytest.raises(CircuitOpenError):
+                await call()
+
+        with patch("src.utils.circuit_breaker.time.time", return_value=222.0):
+            assert breaker.state is CircuitState.HALF_OPEN
+            with pytest.raises(ConnectionError):
+                await call()
+
+    @pytest.mark.asyncio
+    async def test_ignores_errors_that_are_not_failures(self) -> None:
+        """Test that exceptions rejected by is_failure leave the circuit closed."""
+        breaker = CircuitBreaker(
+            "test", fail_max=1, is_failure=lambda e: isinstance(e, ConnectionError)
+        )
+
+        @breaker
+        async def call() -> None:
+            raise ValueError("bad prompt")
+
+        with pytest.raises(ValueError):
+            await call()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_state_file_keeps_circuit_open_across_processes(self, tmp_path: Path) -> None:
+        """Test that a new breaker loads the open state saved by a previous run."""
+        state_file = tmp_path / "circuit.json"
+        first = CircuitBreaker("test", fail_max=2, reset_timeout=60)
+        first.use_state_file(state_file)
+        call = _make_failing(first)
+
+        with patch("src.utils.circuit_breaker.time.time", return_value=100.0):
+            for _ in range(2):
+                with pytest.raises(ConnectionError):
+                    await call()
+
+        second = CircuitBreaker("test", fail_max=2, reset_timeout=60)
+        second.use_state_file(state_file)
+
+        with patch("src.utils.circuit_breaker.time.time", return_value=130.0):
+            assert second.state is CircuitState.OPEN
+        with patch("src.utils.circuit_breaker.time.time", return_value=161.0):
+            assert second.state is CircuitState.HALF_OPEN
+            second.record_success()
+
+        third = CircuitBreaker("test", fail_max=2, reset_timeout=60)
+        third.use_state_file(state_file)
+        assert third.state is CircuitState.CLOSED
+
+    def test_unreadable_state_file_starts_closed(self, tmp_path: Path) -> None:
+        """Test that a corrupt state file is ignored."""
+        state_file = tmp_path / "circuit.json"
+        state_file.write_text("not json")
+        breaker = CircuitBreaker("test")
+
+        breaker.use_state_file(state_file)
+
+        assert breaker.state is CircuitState.CLOSED
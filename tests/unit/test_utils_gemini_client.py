@@ -0,0 +1,49 @@
+"""Unit tests for the shared Gemini client utility."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from google.genai import errors
+
+from src.utils.gemini_client import get_gemini_client, is_transient_gemini_error
+
+
+class TestGetGeminiClient:
+    """Test get_gemini_client function."""
+
+    def test_client_reused_for_same_key(self) -> None:
+        """Test that the same API key returns the same client instance."""
+        with patch("google.genai.Client") as mock_client_class:
+            first = get_gemini_client("key-a")
+            second = get_gemini_client("key-a")
+
+        assert first is second
+        mock_client_class.assert_called_once_with(api_key="key-a")
+
+    def test_separate_clients_per_key(self) -> None:
+        """Test that different API keys get different clients."""
+        with patch("google.genai.Client") as mock_client_class:
+            mock_client_class.side_effect = lambda api_key: object()
+            first = get_gemini_client("key-a")
+            second = get_gemini_client("key-b")
+
+        assert first is not second
+        assert mock_client_class.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("exc", "expected"),
+    [
+        (TimeoutError("timed out"), True),
+        (httpx.ConnectTimeout("connect timeout"), True),
+        (errors.ServerError(503, {"error": {"message": "unavailable"}}), True),
+        (errors.ClientError(429, {"error": {"message": "quota"}}), True),
+        (errors.ClientError(401, {"error": {"message": "unauthenticated"}}), False),
+        (errors.ClientError(400, {"error": {"message": "bad request"}}), False),
+        (ValueError("invalid JSON"), False),
+    ],
+)
+def test_is_transient_gemini_error(exc: BaseException, expected: bool) -> None:
+    """Test that only transient Gemini failures are retried."""
+    assert is_transient_gemini_error(exc) is expected
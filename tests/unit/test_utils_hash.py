@@ -1,6 +1,14 @@
 """Unit tests for hash utilities."""
 
-from src.utils.hash import calculate_similarity, generate_content_hash, normalize_url
+import hashlib
+
+from src.utils.hash import (
+    calculate_similarity,
+    generate_content_hash,
+    generate_content_hashes,
+    normalize_url,
+    normalize_urls,
+)
 
 
 class TestGenerateContentHash:
@@ -49,6 +57,17 @@ class TestGenerateContentHash:
         hash2 = generate_content_hash("URL")
         assert hash1 == hash2  # Empty strings filtered out
 
+    def test_hash_matches_previous_format(self) -> None:
+        """Test hashes stay compatible with previously stored values."""
+        expected = hashlib.sha256(b"title|url").hexdigest()
+        assert generate_content_hash(" Title ", "URL") == expected
+
+    def test_batch_hashes_match_single(self) -> None:
+        """Test batch hashing matches generate_content_hash per row."""
+        rows = [("Title", "URL"), ("Title", None, "Content"), ("Ünïcode", 42)]
+        assert generate_content_hashes(rows) == [generate_content_hash(*row) for row in rows]
+        assert generate_content_hashes([]) == []
+
 
 class TestNormalizeUrl:
     """Test normalize_url function."""
@@ -94,6 +113,17 @@ class TestNormalizeUrl:
             == "example.com/blog/2024/article"
         )
 
+    def test_normalize_multiple_trailing_slashes(self) -> None:
+        """Test every trailing slash is removed, also before a query."""
+        assert normalize_url("https://example.com/page//") == "example.com/page"
+        assert normalize_url("https://example.com/page/?a=1") == "example.com/page"
+
+    def test_normalize_urls_batch(self) -> None:
+        """Test batch normalization matches normalize_url per URL."""
+        urls = ["https://www.example.com/a/", "http://example.com/b?x=1#y", "EXAMPLE.com"]
+        assert normalize_urls(urls) == [normalize_url(url) for url in urls]
+        assert normalize_urls([]) == []
+
 
 class TestCalculateSimilarity:
     """Test calculate_similarity function."""
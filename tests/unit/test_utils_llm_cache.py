@@ -0,0 +1,52 @@
+"""Unit tests for the LLM response cache."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils.llm_cache import LLMResponseCache
+
+
+class TestLLMResponseCache:
+    """Test LLMResponseCache class."""
+
+    def test_set_and_get(self, tmp_path: Path) -> None:
+        """Test that a stored value is returned for the same key."""
+        cache = LLMResponseCache(tmp_path, ttl_seconds=60)
+        key = LLMResponseCache.make_key(model="m", prompt="p")
+
+        cache.set(key, {"text": "hello"})
+
+        assert cache.get(key) == {"text": "hello"}
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_get_missing(self, tmp_path: Path) -> None:
+        """Test that an unknown key is a miss."""
+        cache = LLMResponseCache(tmp_path, ttl_seconds=60)
+
+        assert cache.get(LLMResponseCache.make_key(prompt="unknown")) is None
+
+    def test_expired_entry_ignored(self, tmp_path: Path) -> None:
+        """Test that entries older than the TTL are not returned."""
+        cache = LLMResponseCache(tmp_path, ttl_seconds=60)
+        key = LLMResponseCache.make_key(prompt="p")
+
+        with patch("src.utils.llm_cache.time.time", return_value=1000.0):
+            cache.set(key, "old")
+        with patch("src.utils.llm_cache.time.time", return_value=1061.0):
+            assert cache.get(key) is None
+
+    def test_corrupt_entry_is_miss(self, tmp_path: Path) -> None:
+        """Test that an unreadable entry is treated as a miss."""
+        cache = LLMResponseCache(tmp_path, ttl_seconds=60)
+        key = LLMResponseCache.make_key(prompt="p")
+        cache.set(key, "value")
+        next(tmp_path.rglob(f"{key}.json")).write_text("{not json")
+
+        assert cache.get(key) is None
+
+    def test_make_key_depends_on_all_parts(self) -> None:
+        """Test that keys are stable and change with any parameter."""
+        key = LLMResponseCache.make_key(model="m", prompt="p", temperature=0.3)
+
+        assert key == LLMResponseCache.make_key(temperature=0.3, prompt="p", model="m")
+        assert key != LLMResponseCache.make_key(model="m", prompt="p", temperature=0.5)